@@ -0,0 +1,388 @@
+"""add employee_full read model.
+
+Revision ID: 9d3c7a21e6f0
+Revises: 5b8e2d9c1a47
+Create Date: 2026-10-17 11:02:18.550731
+
+"""
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9d3c7a21e6f0"
+down_revision = "5b8e2d9c1a47"
+branch_labels = None
+depends_on = None
+
+# functions and triggers keeping employee_full up to date, as of this revision
+READ_MODEL_STATEMENTS = (
+    """
+CREATE OR REPLACE FUNCTION employee_full_refresh(employee_uids uuid[])
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM employee_full WHERE uid = ANY(employee_uids);
+    INSERT INTO employee_full
+    SELECT
+        e.uid,
+        e.badge_number,
+        e.first_name,
+        e.last_name,
+        e.grandfather_name,
+        e.gender,
+        e.birth_date,
+        e.birth_place,
+        e.origin_of_birth,
+        e.mother_first_name,
+        e.mother_last_name,
+        e.mother_grandfather_name,
+        e.section_uid,
+        e.educational_level_uid,
+        e.country_uid,
+        e.nationality_uid,
+        e.designation_uid,
+        e.current_hire_date,
+        e.current_salary,
+        e.marital_status,
+        e.national_id,
+        e.phone_number,
+        e.apprenticeship_from_date,
+        e.apprenticeship_to_date,
+        e.contract_type,
+        e.national_service,
+        e.is_active,
+        e.is_terminated,
+        e.created_by,
+        e.modified_by,
+        e.date_created,
+        e.date_modified,
+        dv.name,
+        dp.name,
+        u.name,
+        s.name,
+        el.level,
+        ds.title,
+        n.name,
+        c.name
+    FROM employee e
+    JOIN section s ON s.uid = e.section_uid
+    JOIN unit u ON u.uid = s.unit_uid
+    JOIN department dp ON dp.uid = u.department_uid
+    JOIN division dv ON dv.uid = dp.division_uid
+    JOIN educational_level el ON el.uid = e.educational_level_uid
+    JOIN designation ds ON ds.uid = e.designation_uid
+    JOIN nationality n ON n.uid = e.nationality_uid
+    JOIN country c ON c.uid = e.country_uid
+    WHERE e.uid = ANY(employee_uids);
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_employee_insert()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT uid FROM changed_rows
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_employee_insert ON employee",
+    """
+CREATE TRIGGER employee_full_on_employee_insert
+AFTER INSERT ON employee
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_employee_insert()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_employee_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT uid FROM changed_rows
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_employee_update ON employee",
+    """
+CREATE TRIGGER employee_full_on_employee_update
+AFTER UPDATE ON employee
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_employee_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_section_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT e.uid FROM employee e
+        JOIN changed_rows r ON e.section_uid = r.uid
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_section_update ON section",
+    """
+CREATE TRIGGER employee_full_on_section_update
+AFTER UPDATE ON section
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_section_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_unit_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT e.uid FROM employee e
+        JOIN section s ON s.uid = e.section_uid
+        JOIN changed_rows r ON s.unit_uid = r.uid
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_unit_update ON unit",
+    """
+CREATE TRIGGER employee_full_on_unit_update
+AFTER UPDATE ON unit
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_unit_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_department_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT e.uid FROM employee e
+        JOIN section s ON s.uid = e.section_uid
+        JOIN unit u ON u.uid = s.unit_uid
+        JOIN changed_rows r ON u.department_uid = r.uid
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_department_update ON department",
+    """
+CREATE TRIGGER employee_full_on_department_update
+AFTER UPDATE ON department
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_department_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_division_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT e.uid FROM employee e
+        JOIN section s ON s.uid = e.section_uid
+        JOIN unit u ON u.uid = s.unit_uid
+        JOIN department dp ON dp.uid = u.department_uid
+        JOIN changed_rows r ON dp.division_uid = r.uid
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_division_update ON division",
+    """
+CREATE TRIGGER employee_full_on_division_update
+AFTER UPDATE ON division
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_division_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_designation_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT e.uid FROM employee e
+        JOIN changed_rows r ON e.designation_uid = r.uid
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_designation_update ON designation",
+    """
+CREATE TRIGGER employee_full_on_designation_update
+AFTER UPDATE ON designation
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_designation_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_educational_level_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT e.uid FROM employee e
+        JOIN changed_rows r ON e.educational_level_uid = r.uid
+    ));
+    RETURN NULL;
+END $$
+""",
+    (
+        "DROP TRIGGER IF EXISTS employee_full_on_educational_level_update "
+        "ON educational_level"
+    ),
+    """
+CREATE TRIGGER employee_full_on_educational_level_update
+AFTER UPDATE ON educational_level
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_educational_level_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_nationality_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT e.uid FROM employee e
+        JOIN changed_rows r ON e.nationality_uid = r.uid
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_nationality_update ON nationality",
+    """
+CREATE TRIGGER employee_full_on_nationality_update
+AFTER UPDATE ON nationality
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_nationality_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION employee_full_on_country_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY(
+        SELECT e.uid FROM employee e
+        JOIN changed_rows r ON e.country_uid = r.uid
+    ));
+    RETURN NULL;
+END $$
+""",
+    "DROP TRIGGER IF EXISTS employee_full_on_country_update ON country",
+    """
+CREATE TRIGGER employee_full_on_country_update
+AFTER UPDATE ON country
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION employee_full_on_country_update()
+""",
+)
+
+READ_MODEL_TRIGGERS = (
+    ("employee", "employee_full_on_employee_insert"),
+    ("employee", "employee_full_on_employee_update"),
+    ("section", "employee_full_on_section_update"),
+    ("unit", "employee_full_on_unit_update"),
+    ("department", "employee_full_on_department_update"),
+    ("division", "employee_full_on_division_update"),
+    ("designation", "employee_full_on_designation_update"),
+    ("educational_level", "employee_full_on_educational_level_update"),
+    ("nationality", "employee_full_on_nationality_update"),
+    ("country", "employee_full_on_country_update"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade migrations."""
+    op.create_table(
+        "employee_full",
+        sa.Column("uid", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("badge_number", sa.Integer(), nullable=False),
+        sa.Column("first_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("last_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column(
+            "grandfather_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("gender", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("birth_date", sa.Date(), nullable=False),
+        sa.Column("birth_place", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column(
+            "origin_of_birth", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column(
+            "mother_first_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column(
+            "mother_last_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column(
+            "mother_grandfather_name",
+            sqlmodel.sql.sqltypes.AutoString(),
+            nullable=False,
+        ),
+        sa.Column("section_uid", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column(
+            "educational_level_uid", sqlmodel.sql.sqltypes.GUID(), nullable=False
+        ),
+        sa.Column("country_uid", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("nationality_uid", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("designation_uid", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("current_hire_date", sa.Date(), nullable=False),
+        sa.Column("current_salary", sa.Numeric(), nullable=False),
+        sa.Column("marital_status", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("national_id", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("phone_number", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("apprenticeship_from_date", sa.Date(), nullable=False),
+        sa.Column("apprenticeship_to_date", sa.Date(), nullable=False),
+        sa.Column("contract_type", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column(
+            "national_service", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_terminated", sa.Boolean(), nullable=False),
+        sa.Column("created_by", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("modified_by", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("date_created", sa.DateTime(), nullable=False),
+        sa.Column("date_modified", sa.DateTime(), nullable=False),
+        sa.Column("division", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("department", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("unit", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("section", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column(
+            "educational_level", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("designation", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("nationality", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("country", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.ForeignKeyConstraint(["uid"], ["employee.uid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("uid"),
+        sa.UniqueConstraint("badge_number"),
+    )
+    op.create_index(
+        "ix_employee_full_date_created_uid",
+        "employee_full",
+        ["date_created", "uid"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_employee_full_section_uid", "employee_full", ["section_uid"], unique=False
+    )
+    op.create_index(
+        "ix_employee_full_current_hire_date",
+        "employee_full",
+        ["current_hire_date"],
+        unique=False,
+    )
+    for statement in READ_MODEL_STATEMENTS:
+        op.execute(statement)
+    op.execute("SELECT employee_full_refresh(ARRAY(SELECT uid FROM employee))")
+
+
+def downgrade() -> None:
+    """Downgrade migrations."""
+    for table, function in READ_MODEL_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {function} ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
+    op.execute("DROP FUNCTION IF EXISTS employee_full_refresh(uuid[])")
+    op.drop_index("ix_employee_full_current_hire_date", table_name="employee_full")
+    op.drop_index("ix_employee_full_section_uid", table_name="employee_full")
+    op.drop_index("ix_employee_full_date_created_uid", table_name="employee_full")
+    op.drop_table("employee_full")
@@ -0,0 +1,47 @@
+"""add employee search trigram indexes.
+
+Revision ID: 3f6a1c8b7d20
+Revises: 9d3c7a21e6f0
+Create Date: 2026-10-17 13:24:05.918362
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f6a1c8b7d20"
+down_revision = "9d3c7a21e6f0"
+branch_labels = None
+depends_on = None
+
+# employee_full columns searched by name, phone number or national id
+SEARCH_COLUMNS = (
+    "first_name",
+    "last_name",
+    "grandfather_name",
+    "mother_first_name",
+    "mother_last_name",
+    "mother_grandfather_name",
+    "phone_number",
+    "national_id",
+)
+
+
+def upgrade() -> None:
+    """Upgrade migrations."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f"ix_employee_full_{column}_trgm",
+            "employee_full",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade migrations."""
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f"ix_employee_full_{column}_trgm", table_name="employee_full")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
@@ -0,0 +1,142 @@
+"""upsert employee_full rows on refresh.
+
+Revision ID: 8783c4a0b63a
+Revises: 3f6a1c8b7d20
+Create Date: 2026-10-17 15:12:40.201385
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8783c4a0b63a"
+down_revision = "3f6a1c8b7d20"
+branch_labels = None
+depends_on = None
+
+SELECT_EMPLOYEES = """
+    SELECT
+        e.uid,
+        e.badge_number,
+        e.first_name,
+        e.last_name,
+        e.grandfather_name,
+        e.gender,
+        e.birth_date,
+        e.birth_place,
+        e.origin_of_birth,
+        e.mother_first_name,
+        e.mother_last_name,
+        e.mother_grandfather_name,
+        e.section_uid,
+        e.educational_level_uid,
+        e.country_uid,
+        e.nationality_uid,
+        e.designation_uid,
+        e.current_hire_date,
+        e.current_salary,
+        e.marital_status,
+        e.national_id,
+        e.phone_number,
+        e.apprenticeship_from_date,
+        e.apprenticeship_to_date,
+        e.contract_type,
+        e.national_service,
+        e.is_active,
+        e.is_terminated,
+        e.created_by,
+        e.modified_by,
+        e.date_created,
+        e.date_modified,
+        dv.name,
+        dp.name,
+        u.name,
+        s.name,
+        el.level,
+        ds.title,
+        n.name,
+        c.name
+    FROM employee e
+    JOIN section s ON s.uid = e.section_uid
+    JOIN unit u ON u.uid = s.unit_uid
+    JOIN department dp ON dp.uid = u.department_uid
+    JOIN division dv ON dv.uid = dp.division_uid
+    JOIN educational_level el ON el.uid = e.educational_level_uid
+    JOIN designation ds ON ds.uid = e.designation_uid
+    JOIN nationality n ON n.uid = e.nationality_uid
+    JOIN country c ON c.uid = e.country_uid
+    WHERE e.uid = ANY(employee_uids)"""
+
+# deleting and inserting again made transactions refreshing the same
+# employee concurrently both insert it, failing on the primary key. The rows
+# are locked first so the select runs after a concurrent refresh committed.
+UPSERT_REFRESH_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION employee_full_refresh(employee_uids uuid[])
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM employee_full
+    WHERE uid = ANY(employee_uids)
+    ORDER BY uid
+    FOR UPDATE;
+    INSERT INTO employee_full{SELECT_EMPLOYEES}
+    ORDER BY e.uid
+    ON CONFLICT (uid) DO UPDATE SET
+        badge_number = EXCLUDED.badge_number,
+        first_name = EXCLUDED.first_name,
+        last_name = EXCLUDED.last_name,
+        grandfather_name = EXCLUDED.grandfather_name,
+        gender = EXCLUDED.gender,
+        birth_date = EXCLUDED.birth_date,
+        birth_place = EXCLUDED.birth_place,
+        origin_of_birth = EXCLUDED.origin_of_birth,
+        mother_first_name = EXCLUDED.mother_first_name,
+        mother_last_name = EXCLUDED.mother_last_name,
+        mother_grandfather_name = EXCLUDED.mother_grandfather_name,
+        section_uid = EXCLUDED.section_uid,
+        educational_level_uid = EXCLUDED.educational_level_uid,
+        country_uid = EXCLUDED.country_uid,
+        nationality_uid = EXCLUDED.nationality_uid,
+        designation_uid = EXCLUDED.designation_uid,
+        current_hire_date = EXCLUDED.current_hire_date,
+        current_salary = EXCLUDED.current_salary,
+        marital_status = EXCLUDED.marital_status,
+        national_id = EXCLUDED.national_id,
+        phone_number = EXCLUDED.phone_number,
+        apprenticeship_from_date = EXCLUDED.apprenticeship_from_date,
+        apprenticeship_to_date = EXCLUDED.apprenticeship_to_date,
+        contract_type = EXCLUDED.contract_type,
+        national_service = EXCLUDED.national_service,
+        is_active = EXCLUDED.is_active,
+        is_terminated = EXCLUDED.is_terminated,
+        created_by = EXCLUDED.created_by,
+        modified_by = EXCLUDED.modified_by,
+        date_created = EXCLUDED.date_created,
+        date_modified = EXCLUDED.date_modified,
+        division = EXCLUDED.division,
+        department = EXCLUDED.department,
+        unit = EXCLUDED.unit,
+        section = EXCLUDED.section,
+        educational_level = EXCLUDED.educational_level,
+        designation = EXCLUDED.designation,
+        nationality = EXCLUDED.nationality,
+        country = EXCLUDED.country;
+END $$
+"""
+
+DELETE_INSERT_REFRESH_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION employee_full_refresh(employee_uids uuid[])
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM employee_full WHERE uid = ANY(employee_uids);
+    INSERT INTO employee_full{SELECT_EMPLOYEES};
+END $$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade migrations."""
+    op.execute(UPSERT_REFRESH_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade migrations."""
+    op.execute(DELETE_INSERT_REFRESH_FUNCTION)
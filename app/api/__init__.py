@@ -9,13 +9,16 @@ from app.api.v1.employee_info.educational_level import (
     router as educational_level_router,
 )
 from app.api.v1.employee_info.employee import router as employee_router
+from app.api.v1.employee_info.headcount import router as headcount_router
 from app.api.v1.employee_info.nationalities import router as nationality_router
 from app.api.v1.employee_info.termination import router as termination_router
 from app.api.v1.organization_units.department import router as department_router
 from app.api.v1.organization_units.designation import router as designation_router
 from app.api.v1.organization_units.division import router as division_router
+from app.api.v1.organization_units.org_tree import router as org_tree_router
 from app.api.v1.organization_units.section import router as section_router
 from app.api.v1.organization_units.unit import router as unit_router
+from app.api.v1.reports.severance_liability import router as severance_liability_router
 
 api_router = APIRouter()
 
@@ -23,8 +26,10 @@ api_router.include_router(division_router)
 api_router.include_router(department_router)
 api_router.include_router(section_router)
 api_router.include_router(unit_router)
+api_router.include_router(org_tree_router)
 api_router.include_router(designation_router)
 api_router.include_router(employee_router)
+api_router.include_router(headcount_router)
 api_router.include_router(child_router)
 api_router.include_router(nationality_router)
 api_router.include_router(country_router)
@@ -32,3 +37,4 @@ api_router.include_router(educational_level_router)
 api_router.include_router(address_router)
 api_router.include_router(contact_person_router)
 api_router.include_router(termination_router)
+api_router.include_router(severance_liability_router)
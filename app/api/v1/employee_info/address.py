@@ -3,12 +3,13 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_jwt_auth import AuthJWT  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.employee_info.address_crud import AddressCRUD
 from app.api.v1.employee_info.dependencies import get_address_crud
-from app.api.v1.utils import staff_user_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import StaffUserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
 from app.models.employee_info.address import (
     AddressBase,
     AddressCreate,
@@ -19,21 +20,19 @@ from app.models.employee_info.address import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/employee/addresses", tags=["address"])
+router = APIRouter(
+    prefix="/employee/addresses", tags=["address"], route_class=UnitOfWorkRoute
+)
 
 AddressCRUDDep = Annotated[AddressCRUD, Depends(get_address_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=AddressRead, status_code=status.HTTP_201_CREATED)
 async def create_address(
-    payload: AddressBase, addresses: AddressCRUDDep, Authorize: AuthJWTDep
+    payload: AddressBase, addresses: AddressCRUDDep, user_claims: StaffUserClaimsDep
 ):
     """Create address endpoint."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    user = UUID(Authorize.get_jwt_subject())  # type: ignore
+    user = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     create_payload = AddressCreate(**payload.dict(), created_by=user, modified_by=user)
     try:
@@ -47,20 +46,22 @@ async def create_address(
 
 
 @router.get("", response_model=AddressReadMany)
-async def read_many(addresses: AddressCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    addresses: AddressCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+):
     """Read many addresses."""
-    Authorize.jwt_required()
-    address_list = await addresses.read_many()
+    address_list = await addresses.read_many(page=page)
 
     return address_list
 
 
 @router.get("/employee-id/{employee_uid}", response_model=AddressReadMany)
 async def read_many_by_employee(
-    employee_uid: UUID, addresses: AddressCRUDDep, Authorize: AuthJWTDep
+    employee_uid: UUID, addresses: AddressCRUDDep, user_claims: UserClaimsDep
 ):
     """Read many addresses of an employee."""
-    Authorize.jwt_required()
     address_list = await addresses.read_many_by_employee(employee_uid)
 
     return address_list
@@ -68,10 +69,9 @@ async def read_many_by_employee(
 
 @router.get("/address-id/{address_uid}", response_model=AddressRead)
 async def read_by_uid(
-    address_uid: UUID, addresses: AddressCRUDDep, Authorize: AuthJWTDep
+    address_uid: UUID, addresses: AddressCRUDDep, user_claims: UserClaimsDep
 ):
     """Read address by uid."""
-    Authorize.jwt_required()
     address = await addresses.read_by_uid(address_uid)
     if address is None:
         raise HTTPException(
@@ -85,13 +85,10 @@ async def update_address(
     address_uid: UUID,
     payload: AddressUpdateBase,
     addresses: AddressCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: StaffUserClaimsDep,
 ):
     """Update address."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    user = UUID(Authorize.get_jwt_subject())  # type: ignore
+    user = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     update_payload = AddressUpdate(**payload.dict(exclude_unset=True), modified_by=user)
     address = await addresses.update_address(address_uid, update_payload)
@@ -104,12 +101,9 @@ async def update_address(
 
 @router.delete("/{address_uid}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_address(
-    address_uid: UUID, addresses: AddressCRUDDep, Authorize: AuthJWTDep
+    address_uid: UUID, addresses: AddressCRUDDep, user_claims: StaffUserClaimsDep
 ):
     """Delete address."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
     deleted = await addresses.delete_address(address_uid)
     if not deleted:
         raise HTTPException(
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.utils.pagination import PageParams, paginate
 from app.models.employee_info.address import (
     AddressCreate,
     AddressDB,
@@ -26,17 +27,24 @@ class AddressCRUD:
 
         address = AddressDB(**values)
         self.session.add(address)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(address)
 
         return address
 
-    async def read_many(self) -> AddressReadMany:
+    async def read_many(self, page: Optional[PageParams] = None) -> AddressReadMany:
         """Fetch all address records."""
         statement = select(AddressDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
-        return AddressReadMany(count=len(all_result), result=all_result)
+        keys = (AddressDB.date_created, AddressDB.uid)
+        result = await paginate(
+            self.session, statement, keys, page, estimate_from=AddressDB.__tablename__
+        )
+        return AddressReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_many_by_employee(self, employee_uid: UUID) -> AddressReadMany:
         """Fetch all address records of an employee."""
@@ -66,7 +74,7 @@ class AddressCRUD:
             setattr(address, k, v)
 
         self.session.add(address)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(address)
 
         return address
@@ -77,6 +85,6 @@ class AddressCRUD:
         if address is None:
             return False
         await self.session.delete(address)
-        await self.session.commit()
+        await self.session.flush()
 
         return True
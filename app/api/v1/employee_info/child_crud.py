@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.utils.pagination import PageParams, paginate
 from app.models.employee_info.child import (
     ChildCreate,
     ChildDB,
@@ -26,17 +27,24 @@ class ChildCRUD:
 
         child = ChildDB(**values)
         self.session.add(child)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(child)
 
         return child
 
-    async def read_many(self) -> ChildReadMany:
+    async def read_many(self, page: Optional[PageParams] = None) -> ChildReadMany:
         """Fetch all child records."""
         statement = select(ChildDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
-        return ChildReadMany(count=len(all_result), result=all_result)
+        keys = (ChildDB.date_created, ChildDB.uid)
+        result = await paginate(
+            self.session, statement, keys, page, estimate_from=ChildDB.__tablename__
+        )
+        return ChildReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_many_by_employee(self, employee_uid: UUID) -> ChildReadMany:
         """Fetch all child records of an employee."""
@@ -66,7 +74,7 @@ class ChildCRUD:
             setattr(child, k, v)
 
         self.session.add(child)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(child)
 
         return child
@@ -77,6 +85,6 @@ class ChildCRUD:
         if child is None:
             return False
         await self.session.delete(child)
-        await self.session.commit()
+        await self.session.flush()
 
         return True
@@ -3,12 +3,13 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_jwt_auth import AuthJWT  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.employee_info.contact_person_crud import ContactPersonCRUD
 from app.api.v1.employee_info.dependencies import get_contact_person_crud
-from app.api.v1.utils import staff_user_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import StaffUserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
 from app.models.employee_info.contact_person import (
     ContactPersonBase,
     ContactPersonCreate,
@@ -19,23 +20,23 @@ from app.models.employee_info.contact_person import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/employee/contact-persons", tags=["contact_person"])
+router = APIRouter(
+    prefix="/employee/contact-persons",
+    tags=["contact_person"],
+    route_class=UnitOfWorkRoute,
+)
 
 ContactPersonCRUDDep = Annotated[ContactPersonCRUD, Depends(get_contact_person_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=ContactPersonRead, status_code=status.HTTP_201_CREATED)
 async def create_contact_person(
     payload: ContactPersonBase,
     contact_persons: ContactPersonCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: StaffUserClaimsDep,
 ):
     """Create contact person endpoint."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    user = UUID(Authorize.get_jwt_subject())  # type: ignore
+    user = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     create_payload = ContactPersonCreate(
         **payload.dict(), created_by=user, modified_by=user
@@ -51,20 +52,24 @@ async def create_contact_person(
 
 
 @router.get("", response_model=ContactPersonReadMany)
-async def read_many(contact_persons: ContactPersonCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    contact_persons: ContactPersonCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+):
     """Read many contact persons."""
-    Authorize.jwt_required()
-    contact_person_list = await contact_persons.read_many()
+    contact_person_list = await contact_persons.read_many(page=page)
 
     return contact_person_list
 
 
 @router.get("/employee-id/{employee_uid}", response_model=ContactPersonReadMany)
 async def read_many_by_employee(
-    employee_uid: UUID, contact_persons: ContactPersonCRUDDep, Authorize: AuthJWTDep
+    employee_uid: UUID,
+    contact_persons: ContactPersonCRUDDep,
+    user_claims: UserClaimsDep,
 ):
     """Read many contact persons of an employee."""
-    Authorize.jwt_required()
     contact_person_list = await contact_persons.read_many_by_employee(employee_uid)
 
     return contact_person_list
@@ -74,10 +79,9 @@ async def read_many_by_employee(
 async def read_by_uid(
     contact_person_uid: UUID,
     contact_persons: ContactPersonCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: UserClaimsDep,
 ):
     """Read contact person by uid."""
-    Authorize.jwt_required()
     contact_person = await contact_persons.read_by_uid(contact_person_uid)
     if contact_person is None:
         raise HTTPException(
@@ -91,13 +95,10 @@ async def update_contact_person(
     contact_person_uid: UUID,
     payload: ContactPersonUpdateBase,
     contact_persons: ContactPersonCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: StaffUserClaimsDep,
 ):
     """Update contact person."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    user = UUID(Authorize.get_jwt_subject())  # type: ignore
+    user = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     update_payload = ContactPersonUpdate(
         **payload.dict(exclude_unset=True), modified_by=user
@@ -116,12 +117,9 @@ async def update_contact_person(
 async def delete_contact_person(
     contact_person_uid: UUID,
     contact_persons: ContactPersonCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: StaffUserClaimsDep,
 ):
     """Delete contact person."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
     deleted = await contact_persons.delete_contact_person(contact_person_uid)
     if not deleted:
         raise HTTPException(
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.utils.pagination import PageParams, paginate
 from app.models.employee_info.contact_person import (
     ContactPersonCreate,
     ContactPersonDB,
@@ -28,17 +29,30 @@ class ContactPersonCRUD:
 
         contact_person = ContactPersonDB(**values)
         self.session.add(contact_person)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(contact_person)
 
         return contact_person
 
-    async def read_many(self) -> ContactPersonReadMany:
+    async def read_many(
+        self, page: Optional[PageParams] = None
+    ) -> ContactPersonReadMany:
         """Fetch all contact person records."""
         statement = select(ContactPersonDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
-        return ContactPersonReadMany(count=len(all_result), result=all_result)
+        keys = (ContactPersonDB.date_created, ContactPersonDB.uid)
+        result = await paginate(
+            self.session,
+            statement,
+            keys,
+            page,
+            estimate_from=ContactPersonDB.__tablename__,
+        )
+        return ContactPersonReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_many_by_employee(self, employee_uid: UUID) -> ContactPersonReadMany:
         """Fetch all contact person records."""
@@ -72,7 +86,7 @@ class ContactPersonCRUD:
             setattr(contact_person, k, v)
 
         self.session.add(contact_person)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(contact_person)
 
         return contact_person
@@ -83,6 +97,6 @@ class ContactPersonCRUD:
         if contact_person is None:
             return False
         await self.session.delete(contact_person)
-        await self.session.commit()
+        await self.session.flush()
 
         return True
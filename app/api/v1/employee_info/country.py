@@ -3,12 +3,13 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_jwt_auth import AuthJWT  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.employee_info.country_crud import CountryCRUD
 from app.api.v1.employee_info.dependencies import get_country_crud
-from app.api.v1.utils.exception_responses import superuser_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import SuperuserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
 from app.models.employee_info.country import (
     CountryBase,
     CountryCreate,
@@ -19,21 +20,17 @@ from app.models.employee_info.country import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/countries", tags=["country"])
+router = APIRouter(prefix="/countries", tags=["country"], route_class=UnitOfWorkRoute)
 
 CountryCRUDDep = Annotated[CountryCRUD, Depends(get_country_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=CountryRead, status_code=status.HTTP_201_CREATED)
 async def create_country(
-    payload: CountryBase, countries: CountryCRUDDep, Authorize: AuthJWTDep
+    payload: CountryBase, countries: CountryCRUDDep, user_claims: SuperuserClaimsDep
 ):
     """Create country endpoint."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims=user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     create_payload = CountryCreate(
         **payload.dict(), created_by=subject, modified_by=subject
@@ -50,20 +47,22 @@ async def create_country(
 
 
 @router.get("", response_model=CountryReadMany)
-async def read_many(countries: CountryCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    countries: CountryCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+):
     """Read many countries."""
-    Authorize.jwt_required()
-    country_list = await countries.read_many()
+    country_list = await countries.read_many(page=page)
 
     return country_list
 
 
 @router.get("/{country_uid}", response_model=CountryRead)
 async def read_by_uid(
-    country_uid: UUID, countries: CountryCRUDDep, Authorize: AuthJWTDep
+    country_uid: UUID, countries: CountryCRUDDep, user_claims: UserClaimsDep
 ):
     """Read country by uid."""
-    Authorize.jwt_required()
     country = await countries.read_by_uid(country_uid)
     if country is None:
         raise HTTPException(
@@ -77,13 +76,10 @@ async def updated_country(
     country_uid: UUID,
     payload: CountryUpdateBase,
     countries: CountryCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Update country."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims=user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     update_payload = CountryUpdate(
         **payload.dict(exclude_unset=True), modified_by=subject
@@ -98,12 +94,9 @@ async def updated_country(
 
 @router.delete("/{country_uid}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_country(
-    country_uid: UUID, countries: CountryCRUDDep, Authorize: AuthJWTDep
+    country_uid: UUID, countries: CountryCRUDDep, user_claims: SuperuserClaimsDep
 ):
     """Delete country."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims=user_claims)
     deleted = await countries.delete_country(country_uid)
     if not deleted:
         raise HTTPException(
@@ -5,6 +5,8 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.core.cache import get_cache, invalidate_on_commit
 from app.models.employee_info.country import (
     CountryCreate,
     CountryDB,
@@ -12,6 +14,8 @@ from app.models.employee_info.country import (
     CountryUpdate,
 )
 
+cache = get_cache("countries")
+
 
 class CountryCRUD:
     """Class defining all database related operations."""
@@ -26,17 +30,32 @@ class CountryCRUD:
 
         country = CountryDB(**values)
         self.session.add(country)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name)
         await self.session.refresh(country)
 
         return country
 
-    async def read_many(self) -> CountryReadMany:
+    async def read_many(self, page: Optional[PageParams] = None) -> CountryReadMany:
         """Fetch all countries."""
+        key = page.cache_key() if page is not None else None
+        return await cache.get_or_load(
+            key, lambda: self._read_many(page), session=self.session
+        )
+
+    async def _read_many(self, page: Optional[PageParams] = None) -> CountryReadMany:
+        """Fetch all countries from the database."""
         statement = select(CountryDB)
-        result = await self.session.exec(statement=statement)  # type: ignore
-        all_result = result.all()
-        return CountryReadMany(count=len(all_result), result=all_result)
+        keys = (CountryDB.date_created, CountryDB.uid)
+        result = await paginate(
+            self.session, statement, keys, page, estimate_from=CountryDB.__tablename__
+        )
+        return CountryReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_by_uid(self, country_uid: UUID) -> Optional[CountryDB]:
         """Read country by id."""
@@ -59,7 +78,8 @@ class CountryCRUD:
             setattr(country, k, v)
 
         self.session.add(country)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name)
         await self.session.refresh(country)
 
         return country
@@ -70,6 +90,7 @@ class CountryCRUD:
         if not country:
             return False
         await self.session.delete(country)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name)
 
         return True
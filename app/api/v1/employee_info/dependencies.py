@@ -8,6 +8,8 @@ from app.api.v1.employee_info.contact_person_crud import ContactPersonCRUD
 from app.api.v1.employee_info.country_crud import CountryCRUD
 from app.api.v1.employee_info.educational_level_crud import EducationalLevelCRUD
 from app.api.v1.employee_info.employee_crud import EmployeeCRUD
+from app.api.v1.employee_info.employee_import_crud import EmployeeImportCRUD
+from app.api.v1.employee_info.headcount_crud import HeadcountCRUD
 from app.api.v1.employee_info.nationalities_crud import NationalityCRUD
 from app.api.v1.employee_info.termination_crud import TerminationCRUD
 from app.core.db import get_async_session
@@ -20,6 +22,13 @@ async def get_employee_crud(
     return EmployeeCRUD(session=session)
 
 
+async def get_employee_import_crud(
+    session: AsyncSession = Depends(get_async_session),
+) -> EmployeeImportCRUD:
+    """Initialize employee bulk import operations class."""
+    return EmployeeImportCRUD(session=session)
+
+
 async def get_child_crud(
     session: AsyncSession = Depends(get_async_session),
 ) -> ChildCRUD:
@@ -67,3 +76,10 @@ async def get_termination_crud(
 ) -> TerminationCRUD:
     """Initialize termination crud operations class."""
     return TerminationCRUD(session=session)
+
+
+async def get_headcount_crud(
+    session: AsyncSession = Depends(get_async_session),
+) -> HeadcountCRUD:
+    """Initialize headcount aggregates crud operations class."""
+    return HeadcountCRUD(session=session)
@@ -3,12 +3,13 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_jwt_auth import AuthJWT  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.employee_info.dependencies import get_educational_level_crud
 from app.api.v1.employee_info.educational_level_crud import EducationalLevelCRUD
-from app.api.v1.utils.exception_responses import superuser_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import SuperuserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
 from app.models.employee_info.educational_level import (
     EducationalLevelBase,
     EducationalLevelCreate,
@@ -19,12 +20,15 @@ from app.models.employee_info.educational_level import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/educational-levels", tags=["educational_level"])
+router = APIRouter(
+    prefix="/educational-levels",
+    tags=["educational_level"],
+    route_class=UnitOfWorkRoute,
+)
 
 EducationalLevelCRUDDep = Annotated[
     EducationalLevelCRUD, Depends(get_educational_level_crud)
 ]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post(
@@ -33,13 +37,10 @@ AuthJWTDep = Annotated[AuthJWT, Depends()]
 async def create_educational_level(
     payload: EducationalLevelBase,
     educational_levels: EducationalLevelCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Create educational level endpoint."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims=user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     create_payload = EducationalLevelCreate(
         **payload.dict(), created_by=subject, modified_by=subject
@@ -56,10 +57,13 @@ async def create_educational_level(
 
 
 @router.get("", response_model=EducationalLevelReadMany)
-async def read_many(educational_levels: EducationalLevelCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    educational_levels: EducationalLevelCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+):
     """Read many educational levels."""
-    Authorize.jwt_required()
-    educational_level_list = await educational_levels.read_many()
+    educational_level_list = await educational_levels.read_many(page=page)
 
     return educational_level_list
 
@@ -68,10 +72,9 @@ async def read_many(educational_levels: EducationalLevelCRUDDep, Authorize: Auth
 async def read_by_uid(
     educational_level_uid: UUID,
     educational_levels: EducationalLevelCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: UserClaimsDep,
 ):
     """Read educational level by uid."""
-    Authorize.jwt_required()
     educational_level = await educational_levels.read_by_uid(educational_level_uid)
     if educational_level is None:
         raise HTTPException(
@@ -85,13 +88,10 @@ async def updated_educational_level(
     educational_level_uid: UUID,
     payload: EducationalLevelUpdateBase,
     educational_levels: EducationalLevelCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Update educational level."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims=user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     update_payload = EducationalLevelUpdate(
         **payload.dict(exclude_unset=True), modified_by=subject
@@ -116,12 +116,9 @@ async def updated_educational_level(
 async def delete_educational_level(
     educational_level_uid: UUID,
     educational_levels: EducationalLevelCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Delete educational level."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims=user_claims)
     deleted = await educational_levels.delete_educational_level(educational_level_uid)
     if not deleted:
         raise HTTPException(
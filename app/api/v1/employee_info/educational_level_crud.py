@@ -5,6 +5,9 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.employee_info.headcount_crud import cache as headcount_cache
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.core.cache import get_cache, invalidate_on_commit
 from app.models.employee_info.educational_level import (
     EducationalLevelCreate,
     EducationalLevelDB,
@@ -12,6 +15,8 @@ from app.models.employee_info.educational_level import (
     EducationalLevelUpdate,
 )
 
+cache = get_cache("educational_levels")
+
 
 class EducationalLevelCRUD:
     """Class defining all database related operations."""
@@ -26,17 +31,40 @@ class EducationalLevelCRUD:
 
         educational_level = EducationalLevelDB(**values)
         self.session.add(educational_level)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name, headcount_cache.name)
         await self.session.refresh(educational_level)
 
         return educational_level
 
-    async def read_many(self) -> EducationalLevelReadMany:
+    async def read_many(
+        self, page: Optional[PageParams] = None
+    ) -> EducationalLevelReadMany:
         """Fetch all educational levels."""
+        key = page.cache_key() if page is not None else None
+        return await cache.get_or_load(
+            key, lambda: self._read_many(page), session=self.session
+        )
+
+    async def _read_many(
+        self, page: Optional[PageParams] = None
+    ) -> EducationalLevelReadMany:
+        """Fetch all educational levels from the database."""
         statement = select(EducationalLevelDB)
-        result = await self.session.exec(statement=statement)  # type: ignore
-        all_result = result.all()
-        return EducationalLevelReadMany(count=len(all_result), result=all_result)
+        keys = (EducationalLevelDB.date_created, EducationalLevelDB.uid)
+        result = await paginate(
+            self.session,
+            statement,
+            keys,
+            page,
+            estimate_from=EducationalLevelDB.__tablename__,
+        )
+        return EducationalLevelReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_by_uid(
         self, educational_level_uid: UUID
@@ -63,7 +91,8 @@ class EducationalLevelCRUD:
             setattr(educational_level, k, v)
 
         self.session.add(educational_level)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name, headcount_cache.name)
         await self.session.refresh(educational_level)
 
         return educational_level
@@ -74,6 +103,7 @@ class EducationalLevelCRUD:
         if not educational_level:
             return False
         await self.session.delete(educational_level)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name, headcount_cache.name)
 
         return True
@@ -1,54 +1,90 @@
 """Employee api endpoints module."""
-import base64
-import os
-import pathlib
-from typing import Annotated
+from datetime import date
+from decimal import Decimal
+from typing import Annotated, AsyncIterator, Optional
 from uuid import UUID
 
-import pandas as pd
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse, Response
-from fastapi_jwt_auth import AuthJWT  # type: ignore
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.exc import IntegrityError
+from starlette.background import BackgroundTask
 
 from app.api.v1.employee_info.dependencies import (
     get_employee_crud,
+    get_employee_import_crud,
     get_termination_crud,
 )
 from app.api.v1.employee_info.employee_crud import EmployeeCRUD
+from app.api.v1.employee_info.employee_import_crud import EmployeeImportCRUD
+from app.api.v1.employee_info.queries import MIN_SEARCH_WORD_LENGTH, search_words
 from app.api.v1.employee_info.termination_crud import TerminationCRUD
-from app.api.v1.utils.exception_responses import staff_user_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import StaffUserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    PageParams,
+    PageParamsDep,
+    SortOrder,
+    TotalCount,
+)
+from app.api.v1.utils.pdf import PDF_MEDIA_TYPE, PdfEncoding, pdf_encoding, pdf_response
+from app.api.v1.utils.streaming import NDJSON_MEDIA_TYPE, StreamFormat, stream_rows
+from app.core.db import read_only
+from app.core.render import RenderQueueFull, render_service
+from app.core.settings import settings
+from app.exports.csv_export import csv_response
+from app.exports.xlsx_export import xlsx_response
+from app.exports.zip_export import zip_response
+from app.imports.employee_import import import_employees
+from app.imports.table_import import TableError, read_table, table_format
 from app.models.employee_info.employee import (
+    EmployeeBadgeNumberBatch,
     EmployeeBase,
     EmployeeCreate,
+    EmployeeFilter,
+    EmployeeImportResult,
     EmployeeRead,
     EmployeeReadFull,
+    EmployeeReadFullByBadgeNumbers,
+    EmployeeReadFullByUids,
     EmployeeReadMany,
     EmployeeReadManyFull,
+    EmployeeSearchResults,
     EmployeeSeverancePay,
+    EmployeeSortKey,
+    EmployeeUidBatch,
     EmployeeUpdate,
     EmployeeUpdateBase,
 )
+from app.models.employee_info.employee_profile import EmployeeProfile
 from app.models.employee_info.termination import TerminationRead
-from app.reports.severance_pay import SeverancePayReport
+from app.reports.severance_calculation import SeverancePayBreakdown, calculate_severance
+from app.utils.lazy_import import LazyFunction
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/employees", tags=["employee"])
+router = APIRouter(prefix="/employees", tags=["employee"], route_class=UnitOfWorkRoute)
+
+# imported by the render workers, keeps reportlab out of the api process
+render_severance_pay_report = LazyFunction(
+    "app.reports.severance_pay", "render_severance_pay_report"
+)
 
 EmployeeCRUDDep = Annotated[EmployeeCRUD, Depends(get_employee_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
+EmployeeImportCRUDDep = Annotated[EmployeeImportCRUD, Depends(get_employee_import_crud)]
 TerminationCRUDDep = Annotated[TerminationCRUD, Depends(get_termination_crud)]
+EmployeeFilterDep = Annotated[EmployeeFilter, Depends()]
+PdfEncodingDep = Annotated[PdfEncoding, Depends(pdf_encoding)]
+
+MAX_BULK_REPORTS = 500
 
 
 @router.post("", response_model=EmployeeRead, status_code=status.HTTP_201_CREATED)
 async def create_employee(
-    payload: EmployeeBase, employees: EmployeeCRUDDep, Authorize: AuthJWTDep
+    payload: EmployeeBase, employees: EmployeeCRUDDep, user_claims: StaffUserClaimsDep
 ):
     """Create Employee."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     create_payload = EmployeeCreate(
         **payload.dict(), created_by=subject, modified_by=subject
@@ -63,30 +99,116 @@ async def create_employee(
     return employee
 
 
-@router.get("/full", response_model=EmployeeReadManyFull)
-async def read_many_full(employees: EmployeeCRUDDep, Authorize: AuthJWTDep):
-    """Read many full employee info."""
-    Authorize.jwt_required()
-    employee_list = await employees.read_many_full_info()
+@router.post("/import", response_model=EmployeeImportResult)
+async def import_employee_table(
+    file: UploadFile,
+    imports: EmployeeImportCRUDDep,
+    user_claims: StaffUserClaimsDep,
+    dry_run: bool = False,
+):
+    """Create employees from an uploaded csv or xlsx table.
+
+    Columns are named after the employee fields. Related data is given by
+    name in ``designation``, ``section``, ``nationality``, ``country`` and
+    ``educational_level`` columns, plus ``unit`` for section names used in
+    several units. Valid rows are created in one transaction, the others are
+    reported by row number. A dry run only validates.
+    """
+    table = table_format(file.filename, file.content_type)
+    if table is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="upload a csv or xlsx file.",
+        )
+    subject = UUID(user_claims["sub"])
+    try:
+        return await import_employees(
+            read_table(file.file, table), imports, subject, dry_run
+        )
+    except TableError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="integrity error. eg. duplicate field or invalid field value.",
+        )
+
+
+@router.get(
+    "/full",
+    response_model=EmployeeReadManyFull,
+    responses={status.HTTP_200_OK: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def read_many_full(
+    employees: EmployeeCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+    filters: EmployeeFilterDep,
+    sort_by: EmployeeSortKey = EmployeeSortKey.DATE_CREATED,
+    stream: Optional[StreamFormat] = None,
+):
+    """Read many full employee info.
+
+    With ``stream`` set all matching employees are streamed, either as
+    newline delimited json or as one json array, instead of a page.
+    """
+    if stream is not None:
+        rows = employees.stream_full_info(filters=filters, sort_by=sort_by)
+        return stream_rows(rows, stream)
+    employee_list = await employees.read_many_full_info(
+        page=page, filters=filters, sort_by=sort_by
+    )
 
     return employee_list
 
 
 @router.get("", response_model=EmployeeReadMany)
-async def read_many(employees: EmployeeCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    employees: EmployeeCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+    filters: EmployeeFilterDep,
+    sort_by: EmployeeSortKey = EmployeeSortKey.DATE_CREATED,
+):
     """Read many employees."""
-    Authorize.jwt_required()
-    employee_list = await employees.read_many()
+    employee_list = await employees.read_many(
+        page=page, filters=filters, sort_by=sort_by
+    )
+
+    return employee_list
+
+
+@router.get("/search", response_model=EmployeeSearchResults)
+async def search(
+    employees: EmployeeCRUDDep,
+    user_claims: UserClaimsDep,
+    filters: EmployeeFilterDep,
+    q: str = Query(min_length=3, max_length=100, regex=r"\S"),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    total: Optional[TotalCount] = None,
+):
+    """Search employees by partial or misspelled names, phone or national id.
+
+    Each word of ``q`` must match one of the searched fields, the best
+    matches come first. Words shorter than three characters are ignored.
+    """
+    if not search_words(q):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"q needs a word of {MIN_SEARCH_WORD_LENGTH} or more characters.",
+        )
+    page = PageParams(limit=limit, cursor=cursor, order=SortOrder.DESC, total=total)
+    employee_list = await employees.search(q, page=page, filters=filters)
 
     return employee_list
 
 
 @router.get("/{employee_uid}/full", response_model=EmployeeReadFull)
 async def read_full_info_by_id(
-    employee_uid: UUID, employees: EmployeeCRUDDep, Authorize: AuthJWTDep
+    employee_uid: UUID, employees: EmployeeCRUDDep, user_claims: UserClaimsDep
 ) -> EmployeeReadFull:
     """Read full employee info by uid."""
-    Authorize.jwt_required()
     employee = await employees.read_full_by_uid(employee_uid)
     if employee is None:
         raise HTTPException(
@@ -95,12 +217,27 @@ async def read_full_info_by_id(
     return employee
 
 
+@router.get("/{employee_uid}/profile", response_model=EmployeeProfile)
+async def read_profile(
+    employee_uid: UUID, employees: EmployeeCRUDDep, user_claims: UserClaimsDep
+) -> EmployeeProfile:
+    """Read employee full info with children, address, contact person and terminations.
+
+    Everything is read by one query, instead of one request per record type.
+    """
+    profile = await employees.read_profile(employee_uid=employee_uid)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="employee not found."
+        )
+    return profile
+
+
 @router.get("/{employee_uid}", response_model=EmployeeRead)
 async def read_by_uid(
-    employee_uid: UUID, employees: EmployeeCRUDDep, Authorize: AuthJWTDep
+    employee_uid: UUID, employees: EmployeeCRUDDep, user_claims: UserClaimsDep
 ):
     """Read employee by uid."""
-    Authorize.jwt_required()
     employee = await employees.read_by_uid(employee_uid)
     if employee is None:
         raise HTTPException(
@@ -114,13 +251,10 @@ async def update_employee(
     employee_uid: UUID,
     payload: EmployeeUpdateBase,
     employees: EmployeeCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: StaffUserClaimsDep,
 ):
     """Update employee."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     update_payload = EmployeeUpdate(
         **payload.dict(exclude_unset=True), modified_by=subject
@@ -146,13 +280,10 @@ async def update_employee(
     status_code=status.HTTP_201_CREATED,
 )
 async def deactivate_employee(
-    employee_uid: UUID, employees: EmployeeCRUDDep, Authorize: AuthJWTDep
+    employee_uid: UUID, employees: EmployeeCRUDDep, user_claims: StaffUserClaimsDep
 ):
     """Deactivate employee, not delete it from db."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     # TODO: Log this action in to a db table
     employee = await employees.read_by_uid(employee_uid=employee_uid)
     if employee is None:
@@ -182,13 +313,10 @@ async def deactivate_employee(
     status_code=status.HTTP_201_CREATED,
 )
 async def activate_employee(
-    employee_uid: UUID, employees: EmployeeCRUDDep, Authorize: AuthJWTDep
+    employee_uid: UUID, employees: EmployeeCRUDDep, user_claims: StaffUserClaimsDep
 ):
     """Activate employee."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     # TODO: Log this action in to a db table
     employee = await employees.read_by_uid(employee_uid=employee_uid)
     if employee is None:
@@ -213,27 +341,35 @@ async def activate_employee(
     return employee
 
 
-@router.get("/download/csv", response_class=FileResponse)
+@router.get("/download/csv", response_class=StreamingResponse)
 async def download_csv(
-    employees: EmployeeCRUDDep, Authorize: AuthJWTDep
-) -> FileResponse:
+    employees: EmployeeCRUDDep,
+    user_claims: UserClaimsDep,
+    filters: EmployeeFilterDep,
+    sort_by: EmployeeSortKey = EmployeeSortKey.DATE_CREATED,
+) -> StreamingResponse:
     """Download employees as csv."""
-    Authorize.jwt_required()
-    divisions_list = await employees.read_many_full_info()
-    df = pd.DataFrame([d.dict() for d in divisions_list.result])
-    # TODO remove this when app lifespan works with pytest and httpx
-    p = pathlib.Path("hr_tmp")
-    p.mkdir(exist_ok=True)
-    df.to_csv("hr_tmp/employees.csv", index=False)
-    return FileResponse("hr_tmp/employees.csv")
+    rows = employees.stream_full_info(filters=filters, sort_by=sort_by)
+    return csv_response(rows, filename="employees.csv")
+
+
+@router.get("/download/xlsx", response_class=StreamingResponse)
+async def download_excel(
+    employees: EmployeeCRUDDep,
+    user_claims: UserClaimsDep,
+    filters: EmployeeFilterDep,
+    sort_by: EmployeeSortKey = EmployeeSortKey.DATE_CREATED,
+) -> StreamingResponse:
+    """Download employees as excel."""
+    rows = employees.stream_full_info(filters=filters, sort_by=sort_by)
+    return xlsx_response(rows, filename="employees.xlsx", sheet_title="employees")
 
 
 @router.get("/badge-number/{badge_number}", response_model=EmployeeReadFull)
 async def read_by_badge_number(
-    badge_number: int, employees: EmployeeCRUDDep, Authorize: AuthJWTDep
+    badge_number: int, employees: EmployeeCRUDDep, user_claims: UserClaimsDep
 ) -> EmployeeReadFull:
     """Read employee by badge number."""
-    Authorize.jwt_required()
     employee = await employees.read_full_by_badge_number(badge_number=badge_number)
     if employee is None:
         raise HTTPException(
@@ -242,18 +378,58 @@ async def read_by_badge_number(
     return employee
 
 
-@router.get("/severance-pay/{badge_number}", response_class=Response)
-async def calculate_severance_pay(
-    badge_number: int,
+@router.post(
+    "/badge-number/batch",
+    response_model=EmployeeReadFullByBadgeNumbers,
+    dependencies=[Depends(read_only)],
+)
+async def read_by_badge_numbers(
+    batch: EmployeeBadgeNumberBatch,
     employees: EmployeeCRUDDep,
-    terminations: TerminationCRUDDep,
-    Authorize: AuthJWTDep,
-) -> Response:
-    """Calculate employee severance pay."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
+    user_claims: UserClaimsDep,
+) -> EmployeeReadFullByBadgeNumbers:
+    """Read employees by badge numbers with one query.
 
+    Employees are listed in the order of the first occurrence of their badge
+    number, badge numbers without an employee are listed in ``not_found``.
+    """
+    return await employees.read_full_by_badge_numbers(batch.badge_numbers)
+
+
+@router.post(
+    "/batch",
+    response_model=EmployeeReadFullByUids,
+    dependencies=[Depends(read_only)],
+)
+async def read_by_uids(
+    batch: EmployeeUidBatch, employees: EmployeeCRUDDep, user_claims: UserClaimsDep
+) -> EmployeeReadFullByUids:
+    """Read employees by uids with one query.
+
+    Employees are listed in the order of the first occurrence of their uid,
+    uids without an employee are listed in ``not_found``.
+    """
+    return await employees.read_full_by_uids(batch.uids)
+
+
+def severance_pay_filename(badge_number: int) -> str:
+    """Get the severance pay report file name of an employee."""
+    return f"employee_{badge_number}_severance_pay.pdf"
+
+
+def render_queue_full_error() -> HTTPException:
+    """Create the error of a report the rendering service has no room for."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="too many reports are being rendered, try again later.",
+        headers={"Retry-After": str(settings.report_retry_after)},
+    )
+
+
+async def read_severance_employee(
+    badge_number: int, employees: EmployeeCRUD, terminations: TerminationCRUD
+) -> EmployeeSeverancePay:
+    """Read terminated employee and the termination of its current hire."""
     employee = await employees.read_full_by_badge_number(badge_number=badge_number)
     if employee is None:
         raise HTTPException(
@@ -285,17 +461,130 @@ async def calculate_severance_pay(
     else:
         termination = emp_terminations.result[0]  # type: ignore
 
-    emp_sev = EmployeeSeverancePay(
+    return EmployeeSeverancePay(
         **employee.dict(), termination_date=termination.termination_date
     )
-    p = pathlib.Path("hr_tmp")
-    p.mkdir(exist_ok=True)
-    old_path = os.getcwd()
-    os.chdir(p)
-    sr = SeverancePayReport(emp_sev)
-    filename = sr.create_report()
-    os.chdir(old_path)
-    file_path = p / filename
-    with open(file_path, "rb") as pdf_file:
-        encoded_string = base64.b64encode(pdf_file.read())
-        return Response(content=encoded_string, media_type="application/pdf")
+
+
+@router.get("/severance-pay/calculate", response_model=SeverancePayBreakdown)
+async def calculate_severance_pay_breakdown(
+    user_claims: UserClaimsDep,
+    salary: Decimal = Query(gt=0),
+    hire_date: date = Query(),
+    termination_date: date = Query(),
+    include_end_date: bool = False,
+) -> SeverancePayBreakdown:
+    """Calculate severance service pay for a salary and period of service."""
+    if termination_date < hire_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="termination date is before hire date.",
+        )
+    return calculate_severance(salary, hire_date, termination_date, include_end_date)
+
+
+@router.get(
+    "/severance-pay/{badge_number}/breakdown", response_model=SeverancePayBreakdown
+)
+async def read_severance_pay_breakdown(
+    badge_number: int,
+    employees: EmployeeCRUDDep,
+    terminations: TerminationCRUDDep,
+    user_claims: StaffUserClaimsDep,
+    include_end_date: bool = False,
+) -> SeverancePayBreakdown:
+    """Calculate terminated employee severance service pay."""
+    emp_sev = await read_severance_employee(badge_number, employees, terminations)
+    return calculate_severance(
+        emp_sev.current_salary,
+        emp_sev.current_hire_date,
+        emp_sev.termination_date,
+        include_end_date,
+    )
+
+
+@router.get(
+    "/severance-pay/bulk",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/zip": {}}}},
+)
+async def download_severance_pay_reports(
+    employees: EmployeeCRUDDep,
+    user_claims: StaffUserClaimsDep,
+    badge_number: list[int] = Query(default=[], max_items=MAX_BULK_REPORTS),
+    terminated_from: Optional[date] = None,
+    terminated_to: Optional[date] = None,
+) -> StreamingResponse:
+    """Download severance pay reports of many terminated employees as zip.
+
+    Employees are picked by badge number, termination date range or both.
+    Reports are rendered in parallel and archived as they are done.
+    """
+    if not badge_number and terminated_from is None and terminated_to is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="badge numbers or a termination date range is required.",
+        )
+    # one more than allowed, to tell a full batch from too many employees
+    emp_sevs = await employees.read_severance_employees(
+        badge_number, terminated_from, terminated_to, limit=MAX_BULK_REPORTS + 1
+    )
+    missing = set(badge_number).difference(e.badge_number for e in emp_sevs)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"terminated employees not found: {sorted(missing)}.",
+        )
+    if not emp_sevs:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="no terminated employees found.",
+        )
+    if len(emp_sevs) > MAX_BULK_REPORTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"more than {MAX_BULK_REPORTS} reports requested.",
+        )
+    try:
+        batch = render_service.batch(len(emp_sevs))
+    except RenderQueueFull:
+        raise render_queue_full_error()
+
+    async def files() -> AsyncIterator[tuple[str, bytes]]:
+        reports = batch.render(
+            render_severance_pay_report, ((emp_sev,) for emp_sev in emp_sevs)
+        )
+        names = (severance_pay_filename(e.badge_number) for e in emp_sevs)
+        async for content in reports:
+            yield next(names), content
+
+    return zip_response(
+        files(),
+        filename="severance_pay_reports.zip",
+        background=BackgroundTask(batch.close),
+    )
+
+
+@router.get(
+    "/severance-pay/{badge_number}",
+    response_class=Response,
+    responses={200: {"content": {PDF_MEDIA_TYPE: {}}}},
+)
+async def calculate_severance_pay(
+    badge_number: int,
+    employees: EmployeeCRUDDep,
+    terminations: TerminationCRUDDep,
+    user_claims: StaffUserClaimsDep,
+    encoding: PdfEncodingDep,
+) -> Response:
+    """Calculate employee severance pay.
+
+    The pdf is base64 encoded unless ``encoding=binary`` is passed or the
+    ``Accept`` header asks for ``application/pdf``.
+    """
+    emp_sev = await read_severance_employee(badge_number, employees, terminations)
+    try:
+        content = await render_service.render(render_severance_pay_report, emp_sev)
+    except RenderQueueFull:
+        raise render_queue_full_error()
+    return pdf_response(content, severance_pay_filename(badge_number), encoding)
@@ -1,23 +1,60 @@
 """Employee crud operations module."""
-from typing import Optional
+from datetime import date
+from typing import Hashable, Optional, Sequence, TypeVar
 from uuid import UUID
 
+from sqlalchemy import Float, cast
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.employee_info.headcount_crud import cache as headcount_cache
 from app.api.v1.employee_info.queries import (
+    EmployeeModel,
+    apply_employee_filters,
+    get_employee_profile_query,
     get_employee_relationships_query,
+    get_employee_search_query,
     get_full_emp_info_by_badge_number_query,
+    get_full_emp_info_by_badge_numbers_query,
     get_full_emp_info_by_uid_query,
+    get_full_emp_info_by_uids_query,
 )
+from app.api.v1.organization_units.org_tree_crud import cache as org_tree_cache
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.api.v1.utils.streaming import RowStream, stream_statement
+from app.core.cache import invalidate_on_commit
+from app.models import EmployeeFullDB, TerminationDB
 from app.models.employee_info.employee import (
     EmployeeCreate,
     EmployeeDB,
+    EmployeeFilter,
     EmployeeReadFull,
+    EmployeeReadFullByBadgeNumbers,
+    EmployeeReadFullByUids,
     EmployeeReadMany,
     EmployeeReadManyFull,
+    EmployeeSearchResults,
+    EmployeeSeverancePay,
+    EmployeeSortKey,
     EmployeeUpdate,
 )
+from app.models.employee_info.employee_profile import EmployeeProfile
+
+K = TypeVar("K", bound=Hashable)
+
+
+def _in_requested_order(
+    keys: Sequence[K], employees: dict[K, EmployeeReadFull]
+) -> tuple[list[EmployeeReadFull], list[K]]:
+    """Order employees like the requested keys, listing keys not found."""
+    found, not_found = [], []
+    for key in dict.fromkeys(keys):
+        employee = employees.get(key)
+        if employee is None:
+            not_found.append(key)
+        else:
+            found.append(employee)
+    return found, not_found
 
 
 class EmployeeCRUD:
@@ -32,26 +69,180 @@ class EmployeeCRUD:
         values = payload.dict()
         employee = EmployeeDB(**values)
         self.session.add(employee)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
         await self.session.refresh(employee)
 
         return employee
 
-    async def read_many(self) -> EmployeeReadMany:
+    def _sort_keys(
+        self, sort_by: EmployeeSortKey, model: EmployeeModel = EmployeeDB
+    ) -> tuple:
+        """Get the unique keyset pagination columns for the sort key."""
+        if sort_by == EmployeeSortKey.BADGE_NUMBER:
+            return (model.badge_number,)
+        return (model.date_created, model.uid)
+
+    async def read_many(
+        self,
+        page: Optional[PageParams] = None,
+        filters: Optional[EmployeeFilter] = None,
+        sort_by: EmployeeSortKey = EmployeeSortKey.DATE_CREATED,
+    ) -> EmployeeReadMany:
         """Read many employee records."""
         statement = select(EmployeeDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
+        if filters is not None:
+            statement = apply_employee_filters(statement, filters)
+        result = await paginate(
+            self.session,
+            statement,
+            self._sort_keys(sort_by),
+            page,
+            estimate_from=EmployeeDB.__tablename__,
+        )
 
-        return EmployeeReadMany(count=len(all_result), result=all_result)
+        return EmployeeReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
-    async def read_many_full_info(self) -> EmployeeReadManyFull:
+    async def read_many_full_info(
+        self,
+        page: Optional[PageParams] = None,
+        filters: Optional[EmployeeFilter] = None,
+        sort_by: EmployeeSortKey = EmployeeSortKey.DATE_CREATED,
+    ) -> EmployeeReadManyFull:
         """Read many full employee records."""
         statement = get_employee_relationships_query()
-        result = await self.session.exec(statement)
-        all_result = result.all()
+        if filters is not None:
+            statement = apply_employee_filters(statement, filters, EmployeeFullDB)
+        result = await paginate(
+            self.session,
+            statement,
+            self._sort_keys(sort_by, EmployeeFullDB),
+            page,
+            estimate_from=EmployeeFullDB.__tablename__,
+        )
+
+        return EmployeeReadManyFull(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
-        return EmployeeReadManyFull(count=len(all_result), result=all_result)
+    async def search(
+        self,
+        search: str,
+        page: PageParams,
+        filters: Optional[EmployeeFilter] = None,
+    ) -> EmployeeSearchResults:
+        """Search employees by names, phone number or national id.
+
+        Pages are ordered by descending rank, ties by uid.
+        """
+        statement = get_employee_search_query(search)
+        if filters is not None:
+            statement = apply_employee_filters(statement, filters, EmployeeFullDB)
+        keys = (statement.selected_columns.rank, EmployeeFullDB.uid)
+        result = await paginate(self.session, statement, keys, page)
+
+        return EmployeeSearchResults(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
+
+    def stream_full_info(
+        self,
+        filters: Optional[EmployeeFilter] = None,
+        sort_by: EmployeeSortKey = EmployeeSortKey.DATE_CREATED,
+    ) -> RowStream:
+        """Stream full employee records in batches from a server side cursor."""
+        statement = get_employee_relationships_query()
+        if filters is not None:
+            statement = apply_employee_filters(statement, filters, EmployeeFullDB)
+        statement = statement.order_by(*self._sort_keys(sort_by, EmployeeFullDB))
+
+        return stream_statement(self.session, statement)
+
+    async def read_severance_liability_columns(
+        self, as_of: date
+    ) -> tuple[list[str], list[float], list[date]]:
+        """Read department, salary and hire date columns of active employees.
+
+        Only employees hired on or before ``as_of`` are included.
+        """
+        statement = (
+            select(
+                EmployeeFullDB.department,
+                cast(EmployeeFullDB.current_salary, Float),
+                EmployeeFullDB.current_hire_date,
+            )
+            .where(EmployeeFullDB.is_active)
+            .where(EmployeeFullDB.current_hire_date <= as_of)
+        )
+        result = await self.session.execute(statement)
+        rows = result.all()
+        if not rows:
+            return [], [], []
+        departments, salaries, hire_dates = zip(*rows)
+
+        return list(departments), list(salaries), list(hire_dates)
+
+    async def read_severance_employees(
+        self,
+        badge_numbers: Sequence[int] = (),
+        terminated_from: Optional[date] = None,
+        terminated_to: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> list[EmployeeSeverancePay]:
+        """Read terminated employees with the termination of their current hire.
+
+        Like for a single employee, the termination of the current hire
+        date is preferred and the only termination is used otherwise. When
+        no termination has the current hire date the latest one is used.
+        At most ``limit`` employees are read, by badge number.
+        """
+        hire_termination = TerminationDB.hire_date == EmployeeFullDB.current_hire_date
+        columns = [
+            getattr(EmployeeFullDB, name)
+            for name in EmployeeSeverancePay.__fields__
+            if name != "termination_date"
+        ]
+        statement = (
+            select(*columns, TerminationDB.termination_date)
+            .join(TerminationDB, TerminationDB.employee_uid == EmployeeFullDB.uid)
+            .where(EmployeeFullDB.is_terminated)
+            .distinct(EmployeeFullDB.badge_number)
+            .order_by(
+                EmployeeFullDB.badge_number,
+                hire_termination.desc(),
+                TerminationDB.termination_date.desc(),
+                TerminationDB.uid,
+            )
+        )
+        if badge_numbers:
+            statement = statement.where(
+                EmployeeFullDB.badge_number.in_(badge_numbers)  # type: ignore
+            )
+        # the date range applies to the chosen termination only
+        severance = statement.subquery()
+        statement = select(severance).order_by(severance.c.badge_number)
+        if terminated_from is not None:
+            statement = statement.where(severance.c.termination_date >= terminated_from)
+        if terminated_to is not None:
+            statement = statement.where(severance.c.termination_date <= terminated_to)
+        if limit is not None:
+            statement = statement.limit(limit)
+        result = await self.session.execute(statement)
+
+        return [EmployeeSeverancePay(**row._mapping) for row in result.all()]
 
     async def read_by_uid(self, employee_uid: UUID) -> Optional[EmployeeDB]:
         """Read employee by uid."""
@@ -70,6 +261,18 @@ class EmployeeCRUD:
             return EmployeeReadFull(**employee._mapping)
         return employee
 
+    async def read_profile(self, employee_uid: UUID) -> Optional[EmployeeProfile]:
+        """Read full employee info and related records with one query."""
+        statement = get_employee_profile_query(employee_uid=employee_uid)
+        result = await self.session.exec(statement)
+        employee = result.one_or_none()
+        if employee is None:
+            return None
+        values = dict(employee._mapping)
+        values["children"] = values["children"] or []
+        values["terminations"] = values["terminations"] or []
+        return EmployeeProfile(**values)
+
     async def read_full_by_badge_number(
         self, badge_number: int
     ) -> Optional[EmployeeReadFull]:
@@ -81,6 +284,34 @@ class EmployeeCRUD:
             return EmployeeReadFull(**employee._mapping)
         return employee
 
+    async def read_full_by_uids(
+        self, employee_uids: Sequence[UUID]
+    ) -> EmployeeReadFullByUids:
+        """Read full employee info of many uids with one query."""
+        statement = get_full_emp_info_by_uids_query(employee_uids=employee_uids)
+        result = await self.session.exec(statement)
+        employees = {row.uid: EmployeeReadFull(**row._mapping) for row in result}
+        found, not_found = _in_requested_order(employee_uids, employees)
+        return EmployeeReadFullByUids(
+            count=len(found), result=found, not_found=not_found
+        )
+
+    async def read_full_by_badge_numbers(
+        self, badge_numbers: Sequence[int]
+    ) -> EmployeeReadFullByBadgeNumbers:
+        """Read full employee info of many badge numbers with one query."""
+        statement = get_full_emp_info_by_badge_numbers_query(
+            badge_numbers=badge_numbers
+        )
+        result = await self.session.exec(statement)
+        employees = {
+            row.badge_number: EmployeeReadFull(**row._mapping) for row in result
+        }
+        found, not_found = _in_requested_order(badge_numbers, employees)
+        return EmployeeReadFullByBadgeNumbers(
+            count=len(found), result=found, not_found=not_found
+        )
+
     async def update_employee(
         self, employee_uid: UUID, payload: EmployeeUpdate
     ) -> Optional[EmployeeDB]:
@@ -94,7 +325,10 @@ class EmployeeCRUD:
             setattr(employee, k, v)
 
         self.session.add(employee)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
         await self.session.refresh(employee)
 
         return employee
@@ -112,6 +346,9 @@ class EmployeeCRUD:
         setattr(employee, "is_active", False)
 
         self.session.add(employee)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
 
         return True
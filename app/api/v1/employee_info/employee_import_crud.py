@@ -0,0 +1,155 @@
+"""Employee bulk import database operations module."""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Final, Sequence
+from uuid import UUID
+
+from sqlalchemy import ARRAY, bindparam, cast, func, insert, or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.v1.employee_info.country_crud import cache as country_cache
+from app.api.v1.employee_info.educational_level_crud import (
+    cache as educational_level_cache,
+)
+from app.api.v1.employee_info.headcount_crud import cache as headcount_cache
+from app.api.v1.employee_info.nationalities_crud import cache as nationality_cache
+from app.api.v1.organization_units.designation_crud import cache as designation_cache
+from app.api.v1.organization_units.org_tree_crud import cache as org_tree_cache
+from app.api.v1.organization_units.section_crud import cache as section_cache
+from app.api.v1.utils.unit_of_work import HAS_WRITES
+from app.core.cache import TTLCache, invalidate_on_commit
+from app.models import (
+    CountryDB,
+    DesignationDB,
+    EducationalLevelDB,
+    EmployeeDB,
+    NationalityDB,
+    SectionDB,
+    UnitDB,
+)
+
+LOOKUP_KEY: Final = "uids_by_name"
+
+
+@lru_cache(maxsize=None)
+def _unnest_insert(columns: tuple[str, ...]) -> Any:
+    """Create an employee insert statement taking one array per column."""
+    table = EmployeeDB.__table__  # type: ignore
+    arrays = [
+        func.unnest(
+            cast(bindparam(c, type_=ARRAY(table.c[c].type)), ARRAY(table.c[c].type))
+        )
+        for c in columns
+    ]
+    return insert(table).from_select(columns, select(*arrays), include_defaults=False)
+
+
+@dataclass(frozen=True)
+class EmployeeLookups:
+    """Uids of employee related data by their lower case names.
+
+    Section names are only unique within a unit, so sections map to the
+    unit name and uid of every section with that name.
+    """
+
+    designations: dict[str, UUID]
+    nationalities: dict[str, UUID]
+    countries: dict[str, UUID]
+    educational_levels: dict[str, UUID]
+    sections: dict[str, list[tuple[str, UUID]]]
+
+
+class EmployeeImportCRUD:
+    """Employee bulk import database operations."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Database operations class initializer."""
+        self.session = session
+
+    async def _read_uids_by_name(
+        self, cache: TTLCache, name: Any, uid: Any
+    ) -> dict[str, UUID]:
+        """Read uids by name, cached until the table changes."""
+
+        async def load() -> dict[str, UUID]:
+            result = await self.session.execute(select(name, uid))
+            return {row[0]: row[1] for row in result.all()}
+
+        return await cache.get_or_load(LOOKUP_KEY, load, session=self.session)
+
+    async def _read_section_uids(self) -> dict[str, list[tuple[str, UUID]]]:
+        """Read section uids by name, cached until sections or units change."""
+
+        async def load() -> dict[str, list[tuple[str, UUID]]]:
+            statement = select(SectionDB.name, UnitDB.name, SectionDB.uid).join(
+                UnitDB, UnitDB.uid == SectionDB.unit_uid
+            )
+            result = await self.session.execute(statement)
+            sections: dict[str, list[tuple[str, UUID]]] = {}
+            for section, unit, uid in result.all():
+                sections.setdefault(section, []).append((unit, uid))
+            return sections
+
+        return await section_cache.get_or_load(LOOKUP_KEY, load, session=self.session)
+
+    async def read_lookups(self) -> EmployeeLookups:
+        """Read the uids of employee related data by name."""
+        return EmployeeLookups(
+            designations=await self._read_uids_by_name(
+                designation_cache, DesignationDB.title, DesignationDB.uid
+            ),
+            nationalities=await self._read_uids_by_name(
+                nationality_cache, NationalityDB.name, NationalityDB.uid
+            ),
+            countries=await self._read_uids_by_name(
+                country_cache, CountryDB.name, CountryDB.uid
+            ),
+            educational_levels=await self._read_uids_by_name(
+                educational_level_cache,
+                EducationalLevelDB.level,
+                EducationalLevelDB.uid,
+            ),
+            sections=await self._read_section_uids(),
+        )
+
+    async def read_taken(
+        self, phone_numbers: Sequence[str], national_ids: Sequence[str]
+    ) -> tuple[set[str], set[str]]:
+        """Read which phone numbers and national ids employees already have."""
+        if not phone_numbers and not national_ids:
+            return set(), set()
+        statement = select(EmployeeDB.phone_number, EmployeeDB.national_id).where(
+            or_(
+                EmployeeDB.phone_number.in_(phone_numbers),  # type: ignore
+                EmployeeDB.national_id.in_(national_ids),  # type: ignore
+            )
+        )
+        result = await self.session.execute(statement)
+        rows = result.all()
+        return (
+            {row.phone_number for row in rows} & set(phone_numbers),
+            {row.national_id for row in rows} & set(national_ids),
+        )
+
+    async def create_many(self, values: Sequence[dict[str, Any]]) -> None:
+        """Insert employees with one statement taking a column array each.
+
+        Statement level triggers refresh ``employee_full`` once per statement,
+        so the batch is inserted by a single ``INSERT ... SELECT unnest()``.
+        Unlike a multi row ``VALUES`` its sql does not grow with the batch and
+        is compiled once. The rows bypass the unit of work, the session is
+        flagged as written to by hand so the response still carries a
+        consistency token.
+        """
+        if not values:
+            return
+        columns = list(values[0])
+        await self.session.execute(
+            _unnest_insert(tuple(columns)),
+            {column: [v[column] for v in values] for column in columns},
+        )
+        self.session.sync_session.info[HAS_WRITES] = True
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
@@ -0,0 +1,32 @@
+"""Employee headcount aggregates api endpoints module."""
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.v1.employee_info.dependencies import get_headcount_crud
+from app.api.v1.employee_info.headcount_crud import HeadcountCRUD
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import UserClaimsDep
+from app.models.employee_info.headcount import Headcount, HeadcountDimension
+
+router = APIRouter(prefix="/headcount", tags=["headcount"], route_class=UnitOfWorkRoute)
+
+HeadcountCRUDDep = Annotated[HeadcountCRUD, Depends(get_headcount_crud)]
+
+
+@router.get("", response_model=Headcount)
+async def read_headcount(
+    headcount: HeadcountCRUDDep,
+    user_claims: UserClaimsDep,
+    group_by: list[HeadcountDimension] = Query(default=list(HeadcountDimension)),
+    is_active: Optional[bool] = None,
+    is_terminated: Optional[bool] = None,
+):
+    """Read the number of employees, in total and grouped by each dimension.
+
+    All groupings are computed by one grouping sets query and cached until
+    employees, organization units, designations or educational levels change.
+    """
+    return await headcount.read_headcount(
+        group_by, is_active=is_active, is_terminated=is_terminated
+    )
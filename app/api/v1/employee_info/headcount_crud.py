@@ -0,0 +1,131 @@
+"""Employee headcount aggregates database operations module."""
+from typing import Final, Optional, Sequence
+
+from sqlalchemy import func, tuple_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import get_cache
+from app.models import (
+    DepartmentDB,
+    DesignationDB,
+    DivisionDB,
+    EducationalLevelDB,
+    EmployeeDB,
+    SectionDB,
+    UnitDB,
+)
+from app.models.employee_info.headcount import (
+    Headcount,
+    HeadcountDimension,
+    HeadcountGroup,
+)
+
+# grouping columns of each dimension, the first one identifies the group
+DIMENSION_COLUMNS: Final = {
+    HeadcountDimension.DIVISION: (DivisionDB.uid, DivisionDB.name),
+    HeadcountDimension.DEPARTMENT: (DepartmentDB.uid, DepartmentDB.name),
+    HeadcountDimension.UNIT: (UnitDB.uid, UnitDB.name),
+    HeadcountDimension.SECTION: (SectionDB.uid, SectionDB.name),
+    HeadcountDimension.DESIGNATION: (DesignationDB.uid, DesignationDB.title),
+    HeadcountDimension.EDUCATIONAL_LEVEL: (
+        EducationalLevelDB.uid,
+        EducationalLevelDB.level,
+    ),
+    HeadcountDimension.GENDER: (EmployeeDB.gender,),
+    HeadcountDimension.CONTRACT_TYPE: (EmployeeDB.contract_type,),
+    HeadcountDimension.NATIONAL_SERVICE: (EmployeeDB.national_service,),
+}
+
+cache = get_cache("headcount")
+
+
+def get_headcount_query(
+    dimensions: Sequence[HeadcountDimension],
+    is_active: Optional[bool] = None,
+    is_terminated: Optional[bool] = None,
+):
+    """Create employee count grouping sets query, one set per dimension.
+
+    An empty grouping set adds the total. The ``grouping`` bit mask tells
+    which dimension a row counts, see ``build_headcount``.
+    """
+    columns = [c for dimension in dimensions for c in DIMENSION_COLUMNS[dimension]]
+    group_keys = [DIMENSION_COLUMNS[dimension][0] for dimension in dimensions]
+    grouping_sets = [tuple_(*DIMENSION_COLUMNS[dimension]) for dimension in dimensions]
+    statement = (
+        select(
+            *columns,
+            func.grouping(*group_keys).label("grouping"),
+            func.count().label("count"),
+        )
+        .select_from(EmployeeDB)
+        .join(SectionDB, SectionDB.uid == EmployeeDB.section_uid)
+        .join(UnitDB, UnitDB.uid == SectionDB.unit_uid)
+        .join(DepartmentDB, DepartmentDB.uid == UnitDB.department_uid)
+        .join(DivisionDB, DivisionDB.uid == DepartmentDB.division_uid)
+        .join(DesignationDB, DesignationDB.uid == EmployeeDB.designation_uid)
+        .join(
+            EducationalLevelDB,
+            EducationalLevelDB.uid == EmployeeDB.educational_level_uid,
+        )
+        .group_by(func.grouping_sets(*grouping_sets, tuple_()))
+    )
+    if is_active is not None:
+        statement = statement.where(EmployeeDB.is_active == is_active)
+    if is_terminated is not None:
+        statement = statement.where(EmployeeDB.is_terminated == is_terminated)
+
+    return statement
+
+
+def build_headcount(dimensions: Sequence[HeadcountDimension], rows) -> Headcount:
+    """Sort grouping sets rows into the total and the per dimension groups.
+
+    ``grouping`` has one bit per dimension, most significant first, set
+    when the row is not grouped by that dimension.
+    """
+    all_bits = (1 << len(dimensions)) - 1
+    headcount = Headcount(groups={dimension: [] for dimension in dimensions})
+    for row in rows:
+        if row.grouping == all_bits:
+            headcount.total = row.count
+            continue
+        dimension = dimensions[len(dimensions) - (all_bits ^ row.grouping).bit_length()]
+        values = [row._mapping[column] for column in DIMENSION_COLUMNS[dimension]]
+        if len(values) == 1:
+            name = getattr(values[0], "value", values[0])
+            group = HeadcountGroup(name=name, count=row.count)
+        else:
+            group = HeadcountGroup(uid=values[0], name=values[1], count=row.count)
+        headcount.groups[dimension].append(group)
+    for groups in headcount.groups.values():
+        groups.sort(key=lambda group: (-group.count, group.name))
+
+    return headcount
+
+
+class HeadcountCRUD:
+    """Employee headcount aggregates database operations."""
+
+    def __init__(self, session: AsyncSession):
+        """Database operations initializer."""
+        self.session = session
+
+    async def read_headcount(
+        self,
+        dimensions: Sequence[HeadcountDimension],
+        is_active: Optional[bool] = None,
+        is_terminated: Optional[bool] = None,
+    ) -> Headcount:
+        """Read employee headcount, cached until employees or groups change."""
+        dimensions = tuple(dict.fromkeys(dimensions))
+
+        async def load() -> Headcount:
+            statement = get_headcount_query(dimensions, is_active, is_terminated)
+            result = await self.session.execute(statement)
+            return build_headcount(dimensions, result.all())
+
+        return await cache.get_or_load(
+            (dimensions, is_active, is_terminated), load, session=self.session
+        )
@@ -5,6 +5,8 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.core.cache import get_cache, invalidate_on_commit
 from app.models.employee_info.nationalities import (
     NationalityCreate,
     NationalityDB,
@@ -12,6 +14,8 @@ from app.models.employee_info.nationalities import (
     NationalityUpdate,
 )
 
+cache = get_cache("nationalities")
+
 
 class NationalityCRUD:
     """Class defining all database related operations."""
@@ -26,17 +30,38 @@ class NationalityCRUD:
 
         nationality = NationalityDB(**values)
         self.session.add(nationality)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name)
         await self.session.refresh(nationality)
 
         return nationality
 
-    async def read_many(self) -> NationalityReadMany:
+    async def read_many(self, page: Optional[PageParams] = None) -> NationalityReadMany:
         """Fetch all nationalities."""
+        key = page.cache_key() if page is not None else None
+        return await cache.get_or_load(
+            key, lambda: self._read_many(page), session=self.session
+        )
+
+    async def _read_many(
+        self, page: Optional[PageParams] = None
+    ) -> NationalityReadMany:
+        """Fetch all nationalities from the database."""
         statement = select(NationalityDB)
-        result = await self.session.exec(statement=statement)  # type: ignore
-        all_result = result.all()
-        return NationalityReadMany(count=len(all_result), result=all_result)
+        keys = (NationalityDB.date_created, NationalityDB.uid)
+        result = await paginate(
+            self.session,
+            statement,
+            keys,
+            page,
+            estimate_from=NationalityDB.__tablename__,
+        )
+        return NationalityReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_by_uid(self, nationality_uid: UUID) -> Optional[NationalityDB]:
         """Read nationality by id."""
@@ -59,7 +84,8 @@ class NationalityCRUD:
             setattr(nationality, k, v)
 
         self.session.add(nationality)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name)
         await self.session.refresh(nationality)
 
         return nationality
@@ -70,6 +96,7 @@ class NationalityCRUD:
         if not nationality:
             return False
         await self.session.delete(nationality)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name)
 
         return True
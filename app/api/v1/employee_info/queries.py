@@ -1,94 +1,235 @@
 """Employee related queries module."""
+import re
+from typing import Final, Sequence, Union
 from uuid import UUID
 
+from sqlalchemy import (
+    ARRAY,
+    JSON,
+    Float,
+    Integer,
+    Table,
+    and_,
+    any_,
+    bindparam,
+    func,
+    literal,
+    literal_column,
+    or_,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlmodel import select
+from sqlmodel.sql.expression import Select, SelectOfScalar
+from sqlmodel.sql.sqltypes import GUID
 
 from app.models import (
-    CountryDB,
+    AddressDB,
+    ChildDB,
+    ContactPersonDB,
     DepartmentDB,
-    DesignationDB,
-    DivisionDB,
-    EducationalLevelDB,
     EmployeeDB,
-    NationalityDB,
+    EmployeeFullDB,
     SectionDB,
+    TerminationDB,
     UnitDB,
 )
+from app.models.employee_info.employee import EmployeeFilter
+from app.models.employee_info.employee_full import SEARCH_COLUMNS
+
+MIN_SEARCH_WORD_LENGTH: Final = 3
 
-pass
+EmployeeModel = Union[type[EmployeeDB], type[EmployeeFullDB]]
 
 
 def get_employee_relationships_query():
-    """Create employee and related tables join queries."""
-    statement = (
-        select(
-            EmployeeDB.uid,
-            EmployeeDB.badge_number,
-            EmployeeDB.first_name,
-            EmployeeDB.last_name,
-            EmployeeDB.grandfather_name,
-            EmployeeDB.gender,
-            EmployeeDB.birth_date,
-            EmployeeDB.birth_place,
-            EmployeeDB.origin_of_birth,
-            EmployeeDB.mother_first_name,
-            EmployeeDB.mother_last_name,
-            EmployeeDB.mother_grandfather_name,
-            EmployeeDB.section_uid,
-            EmployeeDB.educational_level_uid,
-            EmployeeDB.country_uid,
-            EmployeeDB.nationality_uid,
-            EmployeeDB.designation_uid,
-            EmployeeDB.current_hire_date,
-            EmployeeDB.current_salary,
-            EmployeeDB.marital_status,
-            EmployeeDB.national_id,
-            EmployeeDB.phone_number,
-            EmployeeDB.apprenticeship_from_date,
-            EmployeeDB.apprenticeship_to_date,
-            EmployeeDB.contract_type,
-            EmployeeDB.national_service,
-            EmployeeDB.is_active,
-            EmployeeDB.is_terminated,
-            EmployeeDB.created_by,
-            EmployeeDB.modified_by,
-            EmployeeDB.date_created,
-            EmployeeDB.date_modified,
-            DivisionDB.name.label("division"),
-            DepartmentDB.name.label("department"),
-            UnitDB.name.label("unit"),
-            SectionDB.name.label("section"),
-            EducationalLevelDB.level.label("educational_level"),
-            DesignationDB.title.label("designation"),
-            NationalityDB.name.label("nationality"),
-            CountryDB.name.label("country"),
-        )
-        .join(SectionDB, SectionDB.uid == EmployeeDB.section_uid)
-        .join(UnitDB, SectionDB.unit_uid == UnitDB.uid)
-        .join(DepartmentDB, UnitDB.department_uid == DepartmentDB.uid)
-        .join(DivisionDB, DepartmentDB.division_uid == DivisionDB.uid)
-        .join(
-            EducationalLevelDB,
-            EducationalLevelDB.uid == EmployeeDB.educational_level_uid,
-        )
-        .join(DesignationDB, DesignationDB.uid == EmployeeDB.designation_uid)
-        .join(NationalityDB, NationalityDB.uid == EmployeeDB.nationality_uid)
-        .join(CountryDB, CountryDB.uid == EmployeeDB.country_uid)
-    )
+    """Create employee with related tables names query.
+
+    Reads the trigger maintained ``employee_full`` read model instead of
+    joining employee with its eight related tables.
+    """
+    statement = select(*EmployeeFullDB.__table__.columns)  # type: ignore
+
     return statement
 
 
 def get_full_emp_info_by_uid_query(employee_uid: UUID):
-    """Create single employee and related tables join queries."""
-    statement = get_employee_relationships_query().where(EmployeeDB.uid == employee_uid)
+    """Create single employee and related tables names query."""
+    statement = get_employee_relationships_query().where(
+        EmployeeFullDB.uid == employee_uid
+    )
 
     return statement
 
 
 def get_full_emp_info_by_badge_number_query(badge_number: int):
-    """Create single employee by badge number and related tables join queries."""
+    """Create single employee by badge number and related tables names query."""
     statement = get_employee_relationships_query().where(
-        EmployeeDB.badge_number == badge_number
+        EmployeeFullDB.badge_number == badge_number
+    )
+
+    return statement
+
+
+def get_full_emp_info_by_uids_query(employee_uids: Sequence[UUID]):
+    """Create employees by uids and related tables names query.
+
+    The uids are bound as one array, so the statement is the same however
+    many uids are asked for.
+    """
+    uids = bindparam("employee_uids", list(employee_uids), type_=ARRAY(GUID()))
+    statement = get_employee_relationships_query().where(
+        EmployeeFullDB.uid == any_(uids)
+    )
+
+    return statement
+
+
+def get_full_emp_info_by_badge_numbers_query(badge_numbers: Sequence[int]):
+    """Create employees by badge numbers and related tables names query."""
+    numbers = bindparam("badge_numbers", list(badge_numbers), type_=ARRAY(Integer))
+    statement = get_employee_relationships_query().where(
+        EmployeeFullDB.badge_number == any_(numbers)
+    )
+
+    return statement
+
+
+def _json_object(table: Table):
+    """Create a json object of a table row, keyed by column name."""
+    pairs = []
+    for column in table.columns:
+        pairs.extend((literal_column(f"'{column.name}'"), column))
+    return func.json_build_object(*pairs, type_=JSON)
+
+
+def get_employee_profile_query(employee_uid: UUID):
+    """Create employee with related tables names and related records query.
+
+    Children, address, contact person and terminations are aggregated into
+    json by correlated subqueries, so the whole profile is one row read by
+    one statement.
+    """
+    child = ChildDB.__table__  # type: ignore
+    address = AddressDB.__table__  # type: ignore
+    contact_person = ContactPersonDB.__table__  # type: ignore
+    termination = TerminationDB.__table__  # type: ignore
+    children = (
+        select(
+            func.json_agg(
+                aggregate_order_by(_json_object(child), child.c.birth_date),
+                type_=JSON,
+            )
+        )
+        .where(child.c.parent_uid == EmployeeFullDB.uid)
+        .scalar_subquery()
+    )
+    terminations = (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    _json_object(termination), termination.c.termination_date.desc()
+                ),
+                type_=JSON,
+            )
+        )
+        .where(termination.c.employee_uid == EmployeeFullDB.uid)
+        .scalar_subquery()
     )
+    statement = get_employee_relationships_query().add_columns(
+        children.label("children"),
+        select(_json_object(address))
+        .where(address.c.employee_uid == EmployeeFullDB.uid)
+        .scalar_subquery()
+        .label("address"),
+        select(_json_object(contact_person))
+        .where(contact_person.c.employee_uid == EmployeeFullDB.uid)
+        .scalar_subquery()
+        .label("contact_person"),
+        terminations.label("terminations"),
+    )
+
+    return statement.where(EmployeeFullDB.uid == employee_uid)
+
+
+def search_words(search: str) -> list[str]:
+    """Get the words of the search text long enough to search with.
+
+    The trigram indexes can not serve words shorter than a trigram, a
+    search on them would scan the whole table, so they are dropped.
+    """
+    return [word for word in search.split() if len(word) >= MIN_SEARCH_WORD_LENGTH]
+
+
+def get_employee_search_query(search: str):
+    """Create employee search query ranked by trigram word similarity.
+
+    Every word of the search text must be a substring of, or similar to, one
+    of the searched columns, both matches are served by the trigram indexes
+    of the read model. The rank sums each word's best word similarity, which
+    compares the word with the best matching part of a column, so partial
+    names are not ranked down for the rest of the column.
+    """
+    columns = [EmployeeFullDB.__table__.c[name] for name in SEARCH_COLUMNS]
+    conditions = []
+    ranks = []
+    for word in search_words(search):
+        term = literal(word)
+        pattern = "%{}%".format(re.sub(r"([\\%_])", r"\\\1", word))
+        conditions.append(
+            or_(
+                *(column.ilike(pattern, escape="\\") for column in columns),
+                *(term.op("%")(column) for column in columns),
+            )
+        )
+        ranks.append(func.greatest(*(func.word_similarity(term, c) for c in columns)))
+    rank = type_coerce(sum(ranks[1:], ranks[0]), Float).label("rank")
+    statement = select(*EmployeeFullDB.__table__.columns, rank).where(  # type: ignore
+        and_(*conditions)
+    )
+
+    return statement
+
+
+def apply_employee_filters(
+    statement: Union[Select, SelectOfScalar],
+    filters: EmployeeFilter,
+    model: EmployeeModel = EmployeeDB,
+) -> Union[Select, SelectOfScalar]:
+    """Add employee list filters on the model's columns to the where clause."""
+    if filters.is_active is not None:
+        statement = statement.where(model.is_active == filters.is_active)
+    if filters.is_terminated is not None:
+        statement = statement.where(model.is_terminated == filters.is_terminated)
+    if filters.designation_uid is not None:
+        statement = statement.where(model.designation_uid == filters.designation_uid)
+    if filters.hired_from is not None:
+        statement = statement.where(model.current_hire_date >= filters.hired_from)
+    if filters.hired_to is not None:
+        statement = statement.where(model.current_hire_date <= filters.hired_to)
+
+    if filters.section_uid is not None:
+        statement = statement.where(model.section_uid == filters.section_uid)
+    sections = select(SectionDB.uid).join(UnitDB, SectionDB.unit_uid == UnitDB.uid)
+    if filters.unit_uid is not None:
+        statement = statement.where(
+            model.section_uid.in_(  # type: ignore
+                sections.where(UnitDB.uid == filters.unit_uid)
+            )
+        )
+    if filters.department_uid is not None:
+        statement = statement.where(
+            model.section_uid.in_(  # type: ignore
+                sections.where(UnitDB.department_uid == filters.department_uid)
+            )
+        )
+    if filters.division_uid is not None:
+        statement = statement.where(
+            model.section_uid.in_(  # type: ignore
+                sections.join(
+                    DepartmentDB, UnitDB.department_uid == DepartmentDB.uid
+                ).where(DepartmentDB.division_uid == filters.division_uid)
+            )
+        )
 
     return statement
@@ -3,7 +3,6 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_jwt_auth import AuthJWT  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.employee_info.dependencies import (
@@ -12,7 +11,9 @@ from app.api.v1.employee_info.dependencies import (
 )
 from app.api.v1.employee_info.employee_crud import EmployeeCRUD
 from app.api.v1.employee_info.termination_crud import TerminationCRUD
-from app.api.v1.utils import staff_user_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import StaffUserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
 from app.models.employee_info.employee import EmployeeUpdate
 from app.models.employee_info.termination import (
     TerminationBase,
@@ -23,11 +24,12 @@ from app.models.employee_info.termination import (
     TerminationUpdateBase,
 )
 
-router = APIRouter(prefix="/terminations", tags=["terminate"])
+router = APIRouter(
+    prefix="/terminations", tags=["terminate"], route_class=UnitOfWorkRoute
+)
 
 TerminationCRUDDep = Annotated[TerminationCRUD, Depends(get_termination_crud)]
 EmployeeCRUDDEp = Annotated[EmployeeCRUD, Depends(get_employee_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=TerminationRead, status_code=status.HTTP_201_CREATED)
@@ -35,13 +37,10 @@ async def create_termination(
     payload: TerminationBase,
     employees: EmployeeCRUDDEp,
     terminations: TerminationCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: StaffUserClaimsDep,
 ):
     """Create termination endpoint."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    user = UUID(Authorize.get_jwt_subject())  # type: ignore
+    user = UUID(user_claims["sub"])
     employee = await employees.read_by_uid(payload.employee_uid)
     if employee is None:
         raise HTTPException(
@@ -75,10 +74,9 @@ async def create_termination(
 
 @router.get("/{termination_uid}", response_model=TerminationRead)
 async def read_by_uid(
-    termination_uid: UUID, terminations: TerminationCRUDDep, Authorize: AuthJWTDep
+    termination_uid: UUID, terminations: TerminationCRUDDep, user_claims: UserClaimsDep
 ):
     """Read termination by uid."""
-    Authorize.jwt_required()
     termination = await terminations.read_by_uid(termination_uid=termination_uid)
 
     if termination is None:
@@ -90,11 +88,13 @@ async def read_by_uid(
 
 
 @router.get("", response_model=TerminationReadMany)
-async def read_many(terminations: TerminationCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    terminations: TerminationCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+):
     """Read many terminations."""
-    Authorize.jwt_required()
-
-    all_terminations = await terminations.read_many()
+    all_terminations = await terminations.read_many(page=page)
 
     return all_terminations
 
@@ -104,13 +104,10 @@ async def update_termination(
     termination_uid: UUID,
     payload: TerminationUpdateBase,
     terminations: TerminationCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: StaffUserClaimsDep,
 ):
     """Update termination."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-    user = UUID(Authorize.get_jwt_subject())  # type: ignore
+    user = UUID(user_claims["sub"])
     update_payload = TerminationUpdate(
         **payload.dict(exclude_unset=True), modified_by=user
     )
@@ -134,13 +131,11 @@ async def update_termination(
 
 @router.delete("/{termination_uid}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_termination(
-    termination_uid: UUID, terminations: TerminationCRUDDep, Authorize: AuthJWTDep
+    termination_uid: UUID,
+    terminations: TerminationCRUDDep,
+    user_claims: StaffUserClaimsDep,
 ):
     """Delete termination."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await staff_user_or_error(user_claims=user_claims)
-
     deleted = await terminations.delete_termination(termination_uid=termination_uid)
 
     if not deleted:
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.utils.pagination import PageParams, paginate
 from app.models.employee_info.termination import (
     TerminationCreate,
     TerminationDB,
@@ -28,17 +29,28 @@ class TerminationCRUD:
 
         termination = TerminationDB(**values)
         self.session.add(termination)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(termination)
 
         return termination
 
-    async def read_many(self) -> TerminationReadMany:
+    async def read_many(self, page: Optional[PageParams] = None) -> TerminationReadMany:
         """Fetch all termination records."""
         statement = select(TerminationDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
-        return TerminationReadMany(count=len(all_result), result=all_result)
+        keys = (TerminationDB.date_created, TerminationDB.uid)
+        result = await paginate(
+            self.session,
+            statement,
+            keys,
+            page,
+            estimate_from=TerminationDB.__tablename__,
+        )
+        return TerminationReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_many_by_employee(self, employee_uid: UUID) -> TerminationReadMany:
         """Fetch all termination records of an employee."""
@@ -70,7 +82,7 @@ class TerminationCRUD:
             setattr(termination, k, v)
 
         self.session.add(termination)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(termination)
 
         return termination
@@ -81,6 +93,6 @@ class TerminationCRUD:
         if termination is None:
             return False
         await self.session.delete(termination)
-        await self.session.commit()
+        await self.session.flush()
 
         return True
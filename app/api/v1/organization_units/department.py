@@ -1,17 +1,18 @@
 """Department api endpoints module."""
-import pathlib
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
-import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
-from fastapi_jwt_auth import AuthJWT  # type: ignore
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.organization_units.department_crud import DepartmentCRUD
 from app.api.v1.organization_units.dependencies import get_departments_crud
-from app.api.v1.utils import superuser_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import SuperuserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
+from app.exports.csv_export import csv_response
+from app.exports.xlsx_export import xlsx_response
 from app.models.organization_units.department import (
     DepartmentBase,
     DepartmentCreate,
@@ -24,21 +25,21 @@ from app.models.organization_units.department import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/departments", tags=["department"])
+router = APIRouter(
+    prefix="/departments", tags=["department"], route_class=UnitOfWorkRoute
+)
 
 DepartmentCRUDDep = Annotated[DepartmentCRUD, Depends(get_departments_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=DepartmentRead, status_code=status.HTTP_201_CREATED)
 async def create_department(
-    payload: DepartmentBase, departments: DepartmentCRUDDep, Authorize: AuthJWTDep
+    payload: DepartmentBase,
+    departments: DepartmentCRUDDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Create department."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     create_payload = DepartmentCreate(
         **payload.dict(), created_by=subject, modified_by=subject
@@ -54,29 +55,38 @@ async def create_department(
 
 
 @router.get("", response_model=DepartmentReadMany)
-async def read_many(departments: DepartmentCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    departments: DepartmentCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+    division_uid: Optional[UUID] = None,
+):
     """Read many departments."""
-    Authorize.jwt_required()
-    department_list = await departments.read_many()
+    department_list = await departments.read_many(page=page, division_uid=division_uid)
 
     return department_list
 
 
 @router.get("/for/print", response_model=DepartmentReadManyPrintFormat)
-async def read_many_print_format(departments: DepartmentCRUDDep, Authorize: AuthJWTDep):
+async def read_many_print_format(
+    departments: DepartmentCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+    division_uid: Optional[UUID] = None,
+):
     """Read many departments."""
-    Authorize.jwt_required()
-    department_list = await departments.read_many_print_format()
+    department_list = await departments.read_many_print_format(
+        page=page, division_uid=division_uid
+    )
 
     return department_list
 
 
 @router.get("/{department_uid}", response_model=DepartmentRead)
 async def read_by_uid(
-    department_uid: UUID, departments: DepartmentCRUDDep, Authorize: AuthJWTDep
+    department_uid: UUID, departments: DepartmentCRUDDep, user_claims: UserClaimsDep
 ):
     """Read department by uid."""
-    Authorize.jwt_required()
     department = await departments.read_by_uid(department_uid)
     if department is None:
         raise HTTPException(
@@ -87,10 +97,9 @@ async def read_by_uid(
 
 @router.get("/{department_uid}/for/print", response_model=DepartmentReadPrintFormat)
 async def read_by_uid_print_format(
-    department_uid: UUID, departments: DepartmentCRUDDep, Authorize: AuthJWTDep
+    department_uid: UUID, departments: DepartmentCRUDDep, user_claims: UserClaimsDep
 ):
     """Read department by uid."""
-    Authorize.jwt_required()
     department = await departments.read_by_uid_print_format(department_uid)
     if department is None:
         raise HTTPException(
@@ -104,13 +113,10 @@ async def update_department(
     department_uid: UUID,
     payload: DepartmentUpdateBase,
     departments: DepartmentCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Update department."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     update_payload = DepartmentUpdate(
         **payload.dict(exclude_unset=True), modified_by=subject
@@ -126,12 +132,11 @@ async def update_department(
 
 @router.delete("/{department_uid}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_department(
-    department_uid: UUID, departments: DepartmentCRUDDep, Authorize: AuthJWTDep
+    department_uid: UUID,
+    departments: DepartmentCRUDDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Delete department."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
     deleted = await departments.delete_department(department_uid)
     if not deleted:
         raise HTTPException(
@@ -139,29 +144,23 @@ async def delete_department(
         )
 
 
-@router.get("/download/csv", response_class=FileResponse)
-async def download_csv(departments: DepartmentCRUDDep, Authorize: AuthJWTDep):
+@router.get("/download/csv", response_class=StreamingResponse)
+async def download_csv(
+    departments: DepartmentCRUDDep, user_claims: UserClaimsDep
+) -> StreamingResponse:
     """Download departments as csv."""
-    Authorize.jwt_required()
-    department_list = await departments.read_many_print_format()
-    df = pd.DataFrame([d.dict() for d in department_list.result])
-    # TODO remove this when app lifespan works with pytest and httpx
-    p = pathlib.Path("hr_tmp")
-    p.mkdir(exist_ok=True)
-    df.to_csv("hr_tmp/departments.csv", index=False)
-    return FileResponse("hr_tmp/departments.csv")
+    return csv_response(
+        departments.stream_many_print_format(), filename="departments.csv"
+    )
 
 
-@router.get("/download/xlsx", response_class=FileResponse)
+@router.get("/download/xlsx", response_class=StreamingResponse)
 async def download_excel(
-    departments: DepartmentCRUDDep, Authorize: AuthJWTDep
-) -> FileResponse:
+    departments: DepartmentCRUDDep, user_claims: UserClaimsDep
+) -> StreamingResponse:
     """Download departments as excel."""
-    Authorize.jwt_required()
-    department_list = await departments.read_many()
-    # TODO remove this when app lifespan works with pytest and httpx
-    p = pathlib.Path("hr_tmp")
-    p.mkdir(exist_ok=True)
-    df = pd.DataFrame([d.dict() for d in department_list.result])
-    df.to_excel("hr_tmp/departments.xlsx", index=False)
-    return FileResponse("hr_tmp/departments.xlsx")
+    return xlsx_response(
+        departments.stream_many_print_format(),
+        filename="departments.xlsx",
+        sheet_title="departments",
+    )
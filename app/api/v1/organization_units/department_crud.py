@@ -5,6 +5,11 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.employee_info.headcount_crud import cache as headcount_cache
+from app.api.v1.organization_units.org_tree_crud import cache as org_tree_cache
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.api.v1.utils.streaming import RowStream, stream_statement
+from app.core.cache import invalidate_on_commit
 from app.models import DivisionDB
 from app.models.organization_units.department import (
     DepartmentCreate,
@@ -29,21 +34,39 @@ class DepartmentCRUD:
 
         department = DepartmentDB(**values)
         self.session.add(department)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
         await self.session.refresh(department)
 
         return department
 
-    async def read_many(self) -> DepartmentReadMany:
+    async def read_many(
+        self, page: Optional[PageParams] = None, division_uid: Optional[UUID] = None
+    ) -> DepartmentReadMany:
         """Fetch all departments."""
         statement = select(DepartmentDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
-        return DepartmentReadMany(count=len(all_result), result=all_result)
-
-    async def read_many_print_format(self) -> DepartmentReadManyPrintFormat:
-        """Fetch all departments in print format."""
-        statement = select(
+        if division_uid is not None:
+            statement = statement.where(DepartmentDB.division_uid == division_uid)
+        keys = (DepartmentDB.date_created, DepartmentDB.uid)
+        result = await paginate(
+            self.session,
+            statement,
+            keys,
+            page,
+            estimate_from=DepartmentDB.__tablename__,
+        )
+        return DepartmentReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
+
+    def _print_format_statement(self):
+        """Create departments with division name query."""
+        return select(
             DepartmentDB.uid,
             DepartmentDB.name,
             DivisionDB.name.label("division"),  # type: ignore
@@ -54,9 +77,30 @@ class DepartmentCRUD:
         ).join(
             DivisionDB
         )  # type: ignore
-        result = await self.session.execute(statement)
-        all_result = result.mappings().all()
-        return DepartmentReadManyPrintFormat(count=len(all_result), result=all_result)
+
+    async def read_many_print_format(
+        self, page: Optional[PageParams] = None, division_uid: Optional[UUID] = None
+    ) -> DepartmentReadManyPrintFormat:
+        """Fetch all departments in print format."""
+        statement = self._print_format_statement()
+        if division_uid is not None:
+            statement = statement.where(DepartmentDB.division_uid == division_uid)
+        keys = (DepartmentDB.date_created, DepartmentDB.uid)
+        result = await paginate(self.session, statement, keys, page)
+        return DepartmentReadManyPrintFormat(
+            count=len(result.rows),
+            result=[row._mapping for row in result.rows],
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
+
+    def stream_many_print_format(self) -> RowStream:
+        """Stream all departments in print format from a server side cursor."""
+        statement = self._print_format_statement().order_by(
+            DepartmentDB.date_created, DepartmentDB.uid
+        )
+
+        return stream_statement(self.session, statement)
 
     async def read_by_uid(self, department_uid: UUID) -> Optional[DepartmentDB]:
         """Read department by id."""
@@ -100,7 +144,10 @@ class DepartmentCRUD:
             setattr(department, k, v)
 
         self.session.add(department)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
         await self.session.refresh(department)
 
         return department
@@ -111,6 +158,9 @@ class DepartmentCRUD:
         if not department:
             return False
         await self.session.delete(department)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
 
         return True
@@ -5,6 +5,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.api.v1.organization_units.department_crud import DepartmentCRUD
 from app.api.v1.organization_units.designation_crud import DesignationCRUD
 from app.api.v1.organization_units.division_crud import DivisionCRUD
+from app.api.v1.organization_units.org_tree_crud import OrgTreeCRUD
 from app.api.v1.organization_units.section_crud import SectionCRUD
 from app.api.v1.organization_units.unit_crud import UnitCRUD
 from app.core.db import get_async_session
@@ -43,3 +44,10 @@ async def get_designation_crud(
 ) -> DesignationCRUD:
     """Dependency function that initialize designation crud operations class."""
     return DesignationCRUD(session=session)
+
+
+async def get_org_tree_crud(
+    session: AsyncSession = Depends(get_async_session),
+) -> OrgTreeCRUD:
+    """Dependency function that initialize org tree operations class."""
+    return OrgTreeCRUD(session=session)
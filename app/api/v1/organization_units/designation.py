@@ -3,12 +3,13 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_jwt_auth import AuthJWT  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.organization_units.dependencies import get_designation_crud
 from app.api.v1.organization_units.designation_crud import DesignationCRUD
-from app.api.v1.utils import superuser_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import SuperuserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
 from app.models.organization_units.designation import (
     DesignationBase,
     DesignationCreate,
@@ -18,21 +19,21 @@ from app.models.organization_units.designation import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/designations", tags=["designation"])
+router = APIRouter(
+    prefix="/designations", tags=["designation"], route_class=UnitOfWorkRoute
+)
 
 DesignationCRUDDep = Annotated[DesignationCRUD, Depends(get_designation_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=DesignationRead, status_code=status.HTTP_201_CREATED)
 async def create_designation(
-    payload: DesignationBase, designations: DesignationCRUDDep, Authorize: AuthJWTDep
+    payload: DesignationBase,
+    designations: DesignationCRUDDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Create designation endpoint."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     create_payload = DesignationCreate(
         **payload.dict(), created_by=subject, modified_by=subject
@@ -48,20 +49,22 @@ async def create_designation(
 
 
 @router.get("", response_model=DesignationReadMany)
-async def read_many(designations: DesignationCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    designations: DesignationCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+):
     """Read many designations."""
-    Authorize.jwt_required()
-    designation_list = await designations.read_many()
+    designation_list = await designations.read_many(page=page)
 
     return designation_list
 
 
 @router.get("/{designation_uid}", response_model=DesignationRead)
 async def read_by_uid(
-    designation_uid: UUID, designations: DesignationCRUDDep, Authorize: AuthJWTDep
+    designation_uid: UUID, designations: DesignationCRUDDep, user_claims: UserClaimsDep
 ):
     """Read designation by id."""
-    Authorize.jwt_required()
     designation = await designations.read_by_uid(designation_uid)
     if designation is None:
         raise HTTPException(
@@ -75,13 +78,10 @@ async def update_designation(
     designation_uid: UUID,
     payload: DesignationBase,
     designations: DesignationCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Update designation."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     update_payload = DesignationUpdate(**payload.dict(), modified_by=subject)
     designation = await designations.update_designation(designation_uid, update_payload)
@@ -94,12 +94,11 @@ async def update_designation(
 
 @router.delete("/{designation_uid}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_designation(
-    designation_uid: UUID, designations: DesignationCRUDDep, Authorize: AuthJWTDep
+    designation_uid: UUID,
+    designations: DesignationCRUDDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Delete designation."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
     deleted = await designations.delete_designation(designation_uid)
     if not deleted:
         raise HTTPException(
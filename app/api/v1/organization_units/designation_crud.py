@@ -5,6 +5,9 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.employee_info.headcount_crud import cache as headcount_cache
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.core.cache import get_cache, invalidate_on_commit
 from app.models.organization_units.designation import (
     DesignationCreate,
     DesignationDB,
@@ -12,6 +15,8 @@ from app.models.organization_units.designation import (
     DesignationUpdate,
 )
 
+cache = get_cache("designations")
+
 
 class DesignationCRUD:
     """Class defining all database related operations."""
@@ -26,17 +31,38 @@ class DesignationCRUD:
 
         designation = DesignationDB(**values)
         self.session.add(designation)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name, headcount_cache.name)
         await self.session.refresh(designation)
 
         return designation
 
-    async def read_many(self) -> DesignationReadMany:
+    async def read_many(self, page: Optional[PageParams] = None) -> DesignationReadMany:
         """Fetch all designations."""
+        key = page.cache_key() if page is not None else None
+        return await cache.get_or_load(
+            key, lambda: self._read_many(page), session=self.session
+        )
+
+    async def _read_many(
+        self, page: Optional[PageParams] = None
+    ) -> DesignationReadMany:
+        """Fetch all designations from the database."""
         statement = select(DesignationDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
-        return DesignationReadMany(count=len(all_result), result=all_result)
+        keys = (DesignationDB.date_created, DesignationDB.uid)
+        result = await paginate(
+            self.session,
+            statement,
+            keys,
+            page,
+            estimate_from=DesignationDB.__tablename__,
+        )
+        return DesignationReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_by_uid(self, designation_uid: UUID) -> Optional[DesignationDB]:
         """Read designation by uid."""
@@ -59,7 +85,8 @@ class DesignationCRUD:
             setattr(designation, k, v)
 
         self.session.add(designation)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name, headcount_cache.name)
         await self.session.refresh(designation)
 
         return designation
@@ -71,6 +98,7 @@ class DesignationCRUD:
             return False
 
         await self.session.delete(designation)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(self.session, cache.name, headcount_cache.name)
 
         return True
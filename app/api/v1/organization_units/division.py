@@ -1,17 +1,18 @@
 """Division api endpoints module."""
-import pathlib
 from typing import Annotated
 from uuid import UUID
 
-import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
-from fastapi_jwt_auth import AuthJWT  # type: ignore
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.organization_units.dependencies import get_divisions_crud
 from app.api.v1.organization_units.division_crud import DivisionCRUD
-from app.api.v1.utils import superuser_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import SuperuserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
+from app.exports.csv_export import csv_response
+from app.exports.xlsx_export import xlsx_response
 from app.models.organization_units.division import (
     DivisionBase,
     DivisionCreate,
@@ -21,21 +22,17 @@ from app.models.organization_units.division import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/divisions", tags=["division"])
+router = APIRouter(prefix="/divisions", tags=["division"], route_class=UnitOfWorkRoute)
 
 DivisionCRUDDep = Annotated[DivisionCRUD, Depends(get_divisions_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=DivisionRead, status_code=status.HTTP_201_CREATED)
 async def create_division(
-    payload: DivisionBase, divisions: DivisionCRUDDep, Authorize: AuthJWTDep
+    payload: DivisionBase, divisions: DivisionCRUDDep, user_claims: SuperuserClaimsDep
 ):
     """Create division endpoint."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
 
     lower_str_attrs(payload)
     create_payload = DivisionCreate(
@@ -52,20 +49,22 @@ async def create_division(
 
 
 @router.get("", response_model=DivisionReadMany)
-async def read_many(divisions: DivisionCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    divisions: DivisionCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+):
     """Read many divisions."""
-    Authorize.jwt_required()
-    division_list = await divisions.read_many()
+    division_list = await divisions.read_many(page=page)
 
     return division_list
 
 
 @router.get("/{division_uid}", response_model=DivisionRead)
 async def read_by_uid(
-    division_uid: UUID, divisions: DivisionCRUDDep, Authorize: AuthJWTDep
+    division_uid: UUID, divisions: DivisionCRUDDep, user_claims: UserClaimsDep
 ):
     """Read division by uid."""
-    Authorize.jwt_required()
     division = await divisions.read_by_uid(division_uid)
     if division is None:
         raise HTTPException(
@@ -79,13 +78,10 @@ async def updated_division(
     division_uid: UUID,
     payload: DivisionBase,
     divisions: DivisionCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Update division."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
 
     lower_str_attrs(payload)
     update_payload = DivisionUpdate(**payload.dict(), modified_by=subject)
@@ -99,12 +95,9 @@ async def updated_division(
 
 @router.delete("/{division_uid}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_division(
-    division_uid: UUID, divisions: DivisionCRUDDep, Authorize: AuthJWTDep
+    division_uid: UUID, divisions: DivisionCRUDDep, user_claims: SuperuserClaimsDep
 ):
     """Delete division."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
     deleted = await divisions.delete_division(division_uid)
     if not deleted:
         raise HTTPException(
@@ -112,31 +105,19 @@ async def delete_division(
         )
 
 
-@router.get("/download/csv", response_class=FileResponse)
+@router.get("/download/csv", response_class=StreamingResponse)
 async def download_csv(
-    divisions: DivisionCRUDDep, Authorize: AuthJWTDep
-) -> FileResponse:
+    divisions: DivisionCRUDDep, user_claims: UserClaimsDep
+) -> StreamingResponse:
     """Download divisions as csv."""
-    Authorize.jwt_required()
-    divisions_list = await divisions.read_many()
-    df = pd.DataFrame([d.dict() for d in divisions_list.result])
-    # TODO remove this when app lifespan works with pytest and httpx
-    p = pathlib.Path("hr_tmp")
-    p.mkdir(exist_ok=True)
-    df.to_csv("hr_tmp/divisions.csv", index=False)
-    return FileResponse("hr_tmp/divisions.csv")
+    return csv_response(divisions.stream_many(), filename="divisions.csv")
 
 
-@router.get("/download/xlsx", response_class=FileResponse)
+@router.get("/download/xlsx", response_class=StreamingResponse)
 async def download_excel(
-    divisions: DivisionCRUDDep, Authorize: AuthJWTDep
-) -> FileResponse:
+    divisions: DivisionCRUDDep, user_claims: UserClaimsDep
+) -> StreamingResponse:
     """Download divisions as excel."""
-    Authorize.jwt_required()
-    divisions_list = await divisions.read_many()
-    df = pd.DataFrame([d.dict() for d in divisions_list.result])
-    # TODO remove this when app lifespan works with pytest and httpx
-    p = pathlib.Path("hr_tmp")
-    p.mkdir(exist_ok=True)
-    df.to_excel("hr_tmp/divisions.xlsx", index=False)
-    return FileResponse("hr_tmp/divisions.xlsx", filename="divisions.xlsx")
+    return xlsx_response(
+        divisions.stream_many(), filename="divisions.xlsx", sheet_title="divisions"
+    )
@@ -5,6 +5,11 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.employee_info.headcount_crud import cache as headcount_cache
+from app.api.v1.organization_units.org_tree_crud import cache as org_tree_cache
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.api.v1.utils.streaming import RowStream, stream_statement
+from app.core.cache import invalidate_on_commit
 from app.models.organization_units.division import (
     DivisionCreate,
     DivisionDB,
@@ -26,17 +31,40 @@ class DivisionCRUD:
 
         division = DivisionDB(**values)
         self.session.add(division)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
         await self.session.refresh(division)
 
         return division
 
-    async def read_many(self) -> DivisionReadMany:
+    async def read_many(self, page: Optional[PageParams] = None) -> DivisionReadMany:
         """Fetch all divisions."""
         statement = select(DivisionDB)
-        result = await self.session.exec(statement=statement)  # type: ignore
-        all_result = result.all()
-        return DivisionReadMany(count=len(all_result), result=all_result)
+        keys = (DivisionDB.date_created, DivisionDB.uid)
+        result = await paginate(
+            self.session, statement, keys, page, estimate_from=DivisionDB.__tablename__
+        )
+        return DivisionReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
+
+    def stream_many(self) -> RowStream:
+        """Stream all divisions in batches from a server side cursor."""
+        statement = select(
+            DivisionDB.uid,
+            DivisionDB.name,
+            DivisionDB.created_by,
+            DivisionDB.modified_by,
+            DivisionDB.date_created,
+            DivisionDB.date_modified,
+        ).order_by(DivisionDB.date_created, DivisionDB.uid)
+
+        return stream_statement(self.session, statement)
 
     async def read_by_uid(self, division_uid: UUID) -> Optional[DivisionDB]:
         """Read division by id."""
@@ -59,7 +87,10 @@ class DivisionCRUD:
             setattr(division, k, v)
 
         self.session.add(division)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
         await self.session.refresh(division)
 
         return division
@@ -70,6 +101,9 @@ class DivisionCRUD:
         if not division:
             return False
         await self.session.delete(division)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, org_tree_cache.name, headcount_cache.name
+        )
 
         return True
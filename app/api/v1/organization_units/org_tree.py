@@ -0,0 +1,45 @@
+"""Organization tree api endpoints module."""
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Header, Response, status
+
+from app.api.v1.organization_units.dependencies import get_org_tree_crud
+from app.api.v1.organization_units.org_tree_crud import OrgTreeCRUD
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import UserClaimsDep
+from app.models.organization_units.org_tree import OrgTree
+
+router = APIRouter(prefix="/org-tree", tags=["org tree"], route_class=UnitOfWorkRoute)
+
+OrgTreeCRUDDep = Annotated[OrgTreeCRUD, Depends(get_org_tree_crud)]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header matches the entity tag."""
+    if if_none_match is None:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+@router.get(
+    "",
+    response_model=OrgTree,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Tree not modified."}},
+)
+async def read_org_tree(
+    org_tree: OrgTreeCRUDDep,
+    user_claims: UserClaimsDep,
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
+    """Read division, department, unit and section hierarchy.
+
+    Every node carries the number of active employees under it.
+    """
+    snapshot = await org_tree.read_snapshot()
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=snapshot.body, media_type="application/json", headers=headers
+    )
@@ -0,0 +1,123 @@
+"""Organization tree database operations module."""
+import hashlib
+from dataclasses import dataclass
+from typing import Final
+
+from sqlalchemy import func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import get_cache
+from app.models import DepartmentDB, DivisionDB, EmployeeDB, SectionDB, UnitDB
+from app.models.organization_units.org_tree import (
+    DepartmentNode,
+    DivisionNode,
+    OrgTree,
+    SectionNode,
+    UnitNode,
+)
+
+ORG_TREE_KEY: Final = "tree"
+
+cache = get_cache("org_tree")
+
+
+@dataclass(frozen=True)
+class OrgTreeSnapshot:
+    """Serialized organization tree and its entity tag."""
+
+    body: bytes
+    etag: str
+
+
+def get_org_tree_query():
+    """Create division to section hierarchy with active employee counts query."""
+    employee_counts = (
+        select(EmployeeDB.section_uid, func.count().label("employee_count"))
+        .where(EmployeeDB.is_active)
+        .group_by(EmployeeDB.section_uid)
+        .subquery()
+    )
+    statement = (
+        select(
+            DivisionDB.uid.label("division_uid"),
+            DivisionDB.name.label("division"),
+            DepartmentDB.uid.label("department_uid"),
+            DepartmentDB.name.label("department"),
+            UnitDB.uid.label("unit_uid"),
+            UnitDB.name.label("unit"),
+            SectionDB.uid.label("section_uid"),
+            SectionDB.name.label("section"),
+            func.coalesce(employee_counts.c.employee_count, 0).label("employee_count"),
+        )
+        .outerjoin(DepartmentDB, DepartmentDB.division_uid == DivisionDB.uid)
+        .outerjoin(UnitDB, UnitDB.department_uid == DepartmentDB.uid)
+        .outerjoin(SectionDB, SectionDB.unit_uid == UnitDB.uid)
+        .outerjoin(employee_counts, employee_counts.c.section_uid == SectionDB.uid)
+        .order_by(DivisionDB.name, DepartmentDB.name, UnitDB.name, SectionDB.name)
+    )
+    return statement
+
+
+def build_org_tree(rows) -> OrgTree:
+    """Build the organization tree from flat hierarchy rows."""
+    tree = OrgTree()
+    divisions: dict = {}
+    departments: dict = {}
+    units: dict = {}
+    for row in rows:
+        division = divisions.get(row.division_uid)
+        if division is None:
+            division = DivisionNode(uid=row.division_uid, name=row.division)
+            divisions[row.division_uid] = division
+            tree.divisions.append(division)
+        if row.department_uid is None:
+            continue
+        department = departments.get(row.department_uid)
+        if department is None:
+            department = DepartmentNode(uid=row.department_uid, name=row.department)
+            departments[row.department_uid] = department
+            division.departments.append(department)
+        if row.unit_uid is None:
+            continue
+        unit = units.get(row.unit_uid)
+        if unit is None:
+            unit = UnitNode(uid=row.unit_uid, name=row.unit)
+            units[row.unit_uid] = unit
+            department.units.append(unit)
+        if row.section_uid is None:
+            continue
+        count = row.employee_count
+        unit.sections.append(
+            SectionNode(uid=row.section_uid, name=row.section, employee_count=count)
+        )
+        for node in (unit, department, division, tree):
+            node.employee_count += count
+
+    return tree
+
+
+class OrgTreeCRUD:
+    """Organization tree database operations."""
+
+    def __init__(self, session: AsyncSession):
+        """Database operations initializer."""
+        self.session = session
+
+    async def read_tree(self) -> OrgTree:
+        """Read the organization tree from the database."""
+        result = await self.session.execute(get_org_tree_query())
+        return build_org_tree(result.all())
+
+    async def read_snapshot(self) -> OrgTreeSnapshot:
+        """Read the serialized organization tree, cached until org units change."""
+        return await cache.get_or_load(
+            ORG_TREE_KEY, self._read_snapshot, session=self.session
+        )
+
+    async def _read_snapshot(self) -> OrgTreeSnapshot:
+        """Read and serialize the organization tree."""
+        tree = await self.read_tree()
+        body = tree.json().encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return OrgTreeSnapshot(body=body, etag=etag)
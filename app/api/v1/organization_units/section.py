@@ -1,14 +1,15 @@
 """Section api endpoints module."""
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_jwt_auth import AuthJWT  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.organization_units.dependencies import get_sections_crud
 from app.api.v1.organization_units.section_crud import SectionCRUD
-from app.api.v1.utils import superuser_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import SuperuserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
 from app.models.organization_units.section import (
     SectionBase,
     SectionCreate,
@@ -19,21 +20,17 @@ from app.models.organization_units.section import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/sections", tags=["section"])
+router = APIRouter(prefix="/sections", tags=["section"], route_class=UnitOfWorkRoute)
 
 SectionCRUDDep = Annotated[SectionCRUD, Depends(get_sections_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=SectionRead, status_code=status.HTTP_201_CREATED)
 async def create_section(
-    payload: SectionBase, sections: SectionCRUDDep, Authorize: AuthJWTDep
+    payload: SectionBase, sections: SectionCRUDDep, user_claims: SuperuserClaimsDep
 ):
     """Create section."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
 
     lower_str_attrs(payload)
     create_payload = SectionCreate(
@@ -50,20 +47,23 @@ async def create_section(
 
 
 @router.get("", response_model=SectionReadMany)
-async def read_many(sections: SectionCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    sections: SectionCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+    unit_uid: Optional[UUID] = None,
+):
     """Read many sections."""
-    Authorize.jwt_required()
-    section_list = await sections.read_many()
+    section_list = await sections.read_many(page=page, unit_uid=unit_uid)
 
     return section_list
 
 
 @router.get("/{section_uid}", response_model=SectionRead)
 async def read_by_uid(
-    section_uid: UUID, sections: SectionCRUDDep, Authorize: AuthJWTDep
+    section_uid: UUID, sections: SectionCRUDDep, user_claims: UserClaimsDep
 ):
     """Read section by uid."""
-    Authorize.jwt_required()
     section = await sections.read_by_uid(section_uid)
     if section is None:
         raise HTTPException(
@@ -77,13 +77,10 @@ async def update_section(
     section_uid: UUID,
     payload: SectionUpdateBase,
     sections: SectionCRUDDep,
-    Authorize: AuthJWTDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Update section."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
 
     lower_str_attrs(payload)
     update_payload = SectionUpdate(
@@ -99,12 +96,9 @@ async def update_section(
 
 @router.delete("/{section_uid}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_section(
-    section_uid: UUID, sections: SectionCRUDDep, Authorize: AuthJWTDep
+    section_uid: UUID, sections: SectionCRUDDep, user_claims: SuperuserClaimsDep
 ):
     """Delete section."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
     deleted = await sections.delete_section(section_uid)
     if not deleted:
         raise HTTPException(
@@ -5,6 +5,10 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.employee_info.headcount_crud import cache as headcount_cache
+from app.api.v1.organization_units.org_tree_crud import cache as org_tree_cache
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.core.cache import get_cache, invalidate_on_commit
 from app.models.organization_units.section import (
     SectionCreate,
     SectionDB,
@@ -12,6 +16,8 @@ from app.models.organization_units.section import (
     SectionUpdate,
 )
 
+cache = get_cache("sections")
+
 
 class SectionCRUD:
     """Section's database operations."""
@@ -26,17 +32,31 @@ class SectionCRUD:
 
         section = SectionDB(**values)
         self.session.add(section)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, cache.name, org_tree_cache.name, headcount_cache.name
+        )
         await self.session.refresh(section)
 
         return section
 
-    async def read_many(self) -> SectionReadMany:
+    async def read_many(
+        self, page: Optional[PageParams] = None, unit_uid: Optional[UUID] = None
+    ) -> SectionReadMany:
         """Fetch all sections."""
         statement = select(SectionDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
-        return SectionReadMany(count=len(all_result), result=all_result)
+        if unit_uid is not None:
+            statement = statement.where(SectionDB.unit_uid == unit_uid)
+        keys = (SectionDB.date_created, SectionDB.uid)
+        result = await paginate(
+            self.session, statement, keys, page, estimate_from=SectionDB.__tablename__
+        )
+        return SectionReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_by_uid(self, section_uid: UUID) -> Optional[SectionDB]:
         """Read section by uid."""
@@ -59,7 +79,10 @@ class SectionCRUD:
             setattr(section, k, v)
 
         self.session.add(section)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, cache.name, org_tree_cache.name, headcount_cache.name
+        )
         await self.session.refresh(section)
 
         return section
@@ -70,6 +93,9 @@ class SectionCRUD:
         if not section:
             return False
         await self.session.delete(section)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session, cache.name, org_tree_cache.name, headcount_cache.name
+        )
 
         return True
@@ -1,14 +1,15 @@
 """Unit api endpoints module."""
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_jwt_auth import AuthJWT  # type: ignore
 from sqlalchemy.exc import IntegrityError
 
 from app.api.v1.organization_units.dependencies import get_units_crud
 from app.api.v1.organization_units.unit_crud import UnitCRUD
-from app.api.v1.utils import superuser_or_error
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import SuperuserClaimsDep, UserClaimsDep
+from app.api.v1.utils.pagination import PageParamsDep
 from app.models.organization_units.unit import (
     UnitBase,
     UnitCreate,
@@ -19,19 +20,17 @@ from app.models.organization_units.unit import (
 )
 from app.utils.lower_case_attrs import lower_str_attrs
 
-router = APIRouter(prefix="/units", tags=["unit"])
+router = APIRouter(prefix="/units", tags=["unit"], route_class=UnitOfWorkRoute)
 
 UnitCRUDDep = Annotated[UnitCRUD, Depends(get_units_crud)]
-AuthJWTDep = Annotated[AuthJWT, Depends()]
 
 
 @router.post("", response_model=UnitRead, status_code=status.HTTP_201_CREATED)
-async def create_unit(payload: UnitBase, units: UnitCRUDDep, Authorize: AuthJWTDep):
+async def create_unit(
+    payload: UnitBase, units: UnitCRUDDep, user_claims: SuperuserClaimsDep
+):
     """Create unit."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
     lower_str_attrs(payload)
     create_payload = UnitCreate(
         **payload.dict(),
@@ -49,18 +48,21 @@ async def create_unit(payload: UnitBase, units: UnitCRUDDep, Authorize: AuthJWTD
 
 
 @router.get("", response_model=UnitReadMany)
-async def read_many(units: UnitCRUDDep, Authorize: AuthJWTDep):
+async def read_many(
+    units: UnitCRUDDep,
+    user_claims: UserClaimsDep,
+    page: PageParamsDep,
+    department_uid: Optional[UUID] = None,
+):
     """Read many units."""
-    Authorize.jwt_required()
-    unit_list = await units.read_many()
+    unit_list = await units.read_many(page=page, department_uid=department_uid)
 
     return unit_list
 
 
 @router.get("/{unit_uid}", response_model=UnitRead)
-async def read_by_uid(unit_uid: UUID, units: UnitCRUDDep, Authorize: AuthJWTDep):
+async def read_by_uid(unit_uid: UUID, units: UnitCRUDDep, user_claims: UserClaimsDep):
     """Read unit by uid."""
-    Authorize.jwt_required()
     unit = await units.read_by_uid(unit_uid)
     if unit is None:
         raise HTTPException(
@@ -71,13 +73,13 @@ async def read_by_uid(unit_uid: UUID, units: UnitCRUDDep, Authorize: AuthJWTDep)
 
 @router.patch("/{unit_uid}", response_model=UnitRead)
 async def update_unit(
-    unit_uid: UUID, payload: UnitUpdateBase, units: UnitCRUDDep, Authorize: AuthJWTDep
+    unit_uid: UUID,
+    payload: UnitUpdateBase,
+    units: UnitCRUDDep,
+    user_claims: SuperuserClaimsDep,
 ):
     """Update unit."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
-    subject = UUID(Authorize.get_jwt_subject())  # type: ignore
+    subject = UUID(user_claims["sub"])
 
     lower_str_attrs(payload)
     update_payload = UnitUpdate(**payload.dict(exclude_unset=True), modified_by=subject)
@@ -90,11 +92,10 @@ async def update_unit(
 
 
 @router.delete("/{unit_uid}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_unit(unit_uid: UUID, units: UnitCRUDDep, Authorize: AuthJWTDep):
+async def delete_unit(
+    unit_uid: UUID, units: UnitCRUDDep, user_claims: SuperuserClaimsDep
+):
     """Delete unit."""
-    Authorize.jwt_required()
-    user_claims = Authorize.get_raw_jwt()
-    await superuser_or_error(user_claims)
     deleted = await units.delete_unit(unit_uid)
     if not deleted:
         raise HTTPException(
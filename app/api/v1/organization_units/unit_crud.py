@@ -5,6 +5,11 @@ from uuid import UUID
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.employee_info.headcount_crud import cache as headcount_cache
+from app.api.v1.organization_units.org_tree_crud import cache as org_tree_cache
+from app.api.v1.organization_units.section_crud import cache as section_cache
+from app.api.v1.utils.pagination import PageParams, paginate
+from app.core.cache import invalidate_on_commit
 from app.models.organization_units.unit import (
     UnitCreate,
     UnitDB,
@@ -26,17 +31,34 @@ class UnitCRUD:
 
         unit = UnitDB(**values)
         self.session.add(unit)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session,
+            section_cache.name,
+            org_tree_cache.name,
+            headcount_cache.name,
+        )
         await self.session.refresh(unit)
 
         return unit
 
-    async def read_many(self) -> UnitReadMany:
+    async def read_many(
+        self, page: Optional[PageParams] = None, department_uid: Optional[UUID] = None
+    ) -> UnitReadMany:
         """Fetch all units."""
         statement = select(UnitDB)
-        result = await self.session.exec(statement)  # type: ignore
-        all_result = result.all()
-        return UnitReadMany(count=len(all_result), result=all_result)
+        if department_uid is not None:
+            statement = statement.where(UnitDB.department_uid == department_uid)
+        keys = (UnitDB.date_created, UnitDB.uid)
+        result = await paginate(
+            self.session, statement, keys, page, estimate_from=UnitDB.__tablename__
+        )
+        return UnitReadMany(
+            count=len(result.rows),
+            result=result.rows,
+            next_cursor=result.next_cursor,
+            total=result.total,
+        )
 
     async def read_by_uid(self, unit_uid: UUID) -> Optional[UnitDB]:
         """Read unit by uid."""
@@ -59,7 +81,13 @@ class UnitCRUD:
             setattr(unit, k, v)
 
         self.session.add(unit)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session,
+            section_cache.name,
+            org_tree_cache.name,
+            headcount_cache.name,
+        )
         await self.session.refresh(unit)
 
         return unit
@@ -70,6 +98,12 @@ class UnitCRUD:
         if not unit:
             return False
         await self.session.delete(unit)
-        await self.session.commit()
+        await self.session.flush()
+        await invalidate_on_commit(
+            self.session,
+            section_cache.name,
+            org_tree_cache.name,
+            headcount_cache.name,
+        )
 
         return True
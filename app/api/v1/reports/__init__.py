@@ -0,0 +1 @@
+"""Package containing report endpoints related modules."""
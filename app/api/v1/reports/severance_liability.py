@@ -0,0 +1,65 @@
+"""Severance liability report api endpoints module."""
+from datetime import date
+from enum import Enum
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+from app.api.v1.employee_info.dependencies import get_employee_crud
+from app.api.v1.employee_info.employee_crud import EmployeeCRUD
+from app.api.v1.utils import UnitOfWorkRoute
+from app.api.v1.utils.auth import StaffUserClaimsDep
+from app.reports.severance_calculation import SeveranceLiability
+
+router = APIRouter(prefix="/reports", tags=["reports"], route_class=UnitOfWorkRoute)
+
+EmployeeCRUDDep = Annotated[EmployeeCRUD, Depends(get_employee_crud)]
+
+
+class ReportFormat(str, Enum):
+    """Report output format enum class."""
+
+    JSON = "json"
+    CSV = "csv"
+
+
+@router.get(
+    "/severance-liability",
+    response_model=SeveranceLiability,
+    responses={200: {"content": {"text/csv": {}}}},
+)
+async def read_severance_liability(
+    employees: EmployeeCRUDDep,
+    user_claims: StaffUserClaimsDep,
+    as_of: Optional[date] = None,
+    include_end_date: bool = False,
+    report_format: ReportFormat = Query(default=ReportFormat.JSON, alias="format"),
+):
+    """Read the severance service pay liability of active employees.
+
+    The liability is what would be owed if every active employee left on
+    ``as_of``, today by default, summed per department.
+    """
+    # numpy and pandas are imported on the first request, not at startup
+    from app.reports.severance_liability import (
+        calculate_liability,
+        department_liability,
+        summarize_liability,
+    )
+
+    as_of = as_of or date.today()
+    columns = await employees.read_severance_liability_columns(as_of)
+    departments, salaries, hire_dates = columns
+    pay = calculate_liability(salaries, hire_dates, as_of, include_end_date)
+    totals = department_liability(departments, pay)
+    if report_format == ReportFormat.CSV:
+        return Response(
+            content=totals.to_csv(index=False),
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": (
+                    f'attachment; filename="severance_liability_{as_of}.csv"'
+                )
+            },
+        )
+    return summarize_liability(as_of, totals)
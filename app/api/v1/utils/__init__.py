@@ -1,5 +1,6 @@
-"""API endpoints exception responses package."""
+"""API endpoints utilities package."""
 
 from app.api.v1.utils.exception_responses import staff_user_or_error, superuser_or_error
+from app.api.v1.utils.unit_of_work import UnitOfWorkRoute
 
-__all__ = ["superuser_or_error", "staff_user_or_error"]
+__all__ = ["superuser_or_error", "staff_user_or_error", "UnitOfWorkRoute"]
@@ -0,0 +1,38 @@
+"""API endpoints authentication dependencies module."""
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.api.v1.utils.exception_responses import staff_user_or_error, superuser_or_error
+from app.core.auth import CachedAuthJWT
+
+AuthJWTDep = Annotated[CachedAuthJWT, Depends()]
+
+
+async def get_user_claims(Authorize: AuthJWTDep) -> dict:
+    """Require an access token and get its claims.
+
+    FastAPI caches dependencies per request, so the token is decoded once
+    however many dependencies of an endpoint need the claims.
+    """
+    Authorize.jwt_required()
+    return Authorize.get_raw_jwt()
+
+
+UserClaimsDep = Annotated[dict, Depends(get_user_claims)]
+
+
+async def get_staff_user_claims(user_claims: UserClaimsDep) -> dict:
+    """Get the token claims of a staff member."""
+    await staff_user_or_error(user_claims=user_claims)
+    return user_claims
+
+
+async def get_superuser_claims(user_claims: UserClaimsDep) -> dict:
+    """Get the token claims of a superuser."""
+    await superuser_or_error(user_claims=user_claims)
+    return user_claims
+
+
+StaffUserClaimsDep = Annotated[dict, Depends(get_staff_user_claims)]
+SuperuserClaimsDep = Annotated[dict, Depends(get_superuser_claims)]
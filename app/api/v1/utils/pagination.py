@@ -0,0 +1,200 @@
+"""Keyset pagination utilities module."""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Annotated, Any, Optional, Sequence
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Query, status
+from sqlalchemy import func, literal, select, text, tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+ESTIMATED_COUNT_QUERY = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+)
+
+
+class SortOrder(str, Enum):
+    """Sort order enum class."""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+class TotalCount(str, Enum):
+    """Total count mode enum class."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+
+
+class PageParams:
+    """Keyset pagination query parameters."""
+
+    def __init__(
+        self,
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        order: SortOrder = SortOrder.ASC,
+        total: Optional[TotalCount] = None,
+    ) -> None:
+        """Page parameters initializer."""
+        self.limit = limit
+        self.cursor = cursor
+        self.order = order
+        self.total = total
+
+    def cache_key(self) -> tuple:
+        """Get a hashable key identifying the requested page."""
+        return (self.limit, self.cursor, self.order, self.total)
+
+
+PageParamsDep = Annotated[PageParams, Depends()]
+
+
+@dataclass
+class Page:
+    """One page of query results."""
+
+    rows: Sequence[Any]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+def _encode_value(value: Any) -> list:
+    """Encode a sort key value as a type tagged json value."""
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    return ["v", value]
+
+
+def _decode_value(key: Any, value: list) -> Any:
+    """Decode a type tagged json value, checking it fits the sort key."""
+    if not isinstance(value, list) or len(value) != 2:
+        raise ValueError("cursor value is not tagged")
+    tag, raw = value
+    if tag == "dt":
+        decoded = datetime.fromisoformat(raw)
+    elif tag == "d":
+        decoded = date.fromisoformat(raw)
+    elif tag == "u":
+        decoded = UUID(raw)
+    elif tag == "v" and (raw is None or isinstance(raw, (str, int, float))):
+        decoded = raw
+    else:
+        raise ValueError("cursor value is not a scalar")
+    try:
+        python_type = key.type.python_type
+    except NotImplementedError:
+        # only uuid columns, eg. GUID, have no python type
+        python_type = UUID
+    if decoded is not None and type(decoded) is not python_type:
+        raise ValueError("cursor value does not match its sort key")
+    return decoded
+
+
+def encode_cursor(keys: Sequence[Any], row: Any) -> str:
+    """Create an opaque cursor pointing after the given row."""
+    payload = {
+        "k": [key.key for key in keys],
+        "v": [_encode_value(getattr(row, key.key)) for key in keys],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(keys: Sequence[Any], cursor: str) -> list:
+    """Decode cursor into sort key values."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["k"] != [key.key for key in keys]:
+            raise ValueError("cursor sort keys mismatch")
+        if not isinstance(payload["v"], list) or len(payload["v"]) != len(keys):
+            raise ValueError("cursor values do not match the sort keys")
+        return [_decode_value(key, value) for key, value in zip(keys, payload["v"])]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="invalid cursor."
+        )
+
+
+async def count_total(
+    session: AsyncSession,
+    statement,
+    mode: TotalCount,
+    estimate_from: Optional[str] = None,
+) -> int:
+    """Count statement rows exactly or estimate them from table statistics.
+
+    Estimates come from the planner statistics of ``estimate_from`` and are
+    only used for unfiltered statements, filtered ones are counted exactly.
+    """
+    if (
+        mode == TotalCount.ESTIMATED
+        and estimate_from is not None
+        and statement.whereclause is None
+    ):
+        result = await session.execute(
+            ESTIMATED_COUNT_QUERY, {"table_name": estimate_from}
+        )
+        estimate = result.scalar_one_or_none()
+        if estimate is not None and estimate >= 0:
+            return estimate
+
+    count_statement = select(func.count()).select_from(
+        statement.order_by(None).subquery()
+    )
+    result = await session.execute(count_statement)
+    return result.scalar_one()
+
+
+async def paginate(
+    session: AsyncSession,
+    statement,
+    keys: Sequence[Any],
+    page: Optional[PageParams] = None,
+    estimate_from: Optional[str] = None,
+) -> Page:
+    """Run statement one keyset page at a time.
+
+    ``keys`` must uniquely identify a row, eg. ``(date_created, uid)``. When
+    no page is given all rows are returned in key order.
+    """
+    if page is None:
+        result = await session.exec(statement.order_by(*keys))
+        return Page(rows=result.all())
+
+    total = None
+    if page.total is not None:
+        total = await count_total(session, statement, page.total, estimate_from)
+
+    paged = statement
+    descending = page.order == SortOrder.DESC
+    if page.cursor:
+        values = decode_cursor(keys, page.cursor)
+        after = tuple_(*(literal(v, key.type) for key, v in zip(keys, values)))
+        if descending:
+            paged = paged.where(tuple_(*keys) < after)
+        else:
+            paged = paged.where(tuple_(*keys) > after)
+    order_by = [key.desc() if descending else key.asc() for key in keys]
+    paged = paged.order_by(*order_by).limit(page.limit + 1)
+
+    result = await session.exec(paged)
+    rows = result.all()
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(keys, rows[-1])
+
+    return Page(rows=rows, next_cursor=next_cursor, total=total)
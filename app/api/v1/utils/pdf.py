@@ -0,0 +1,54 @@
+"""Pdf responses utilities module."""
+import base64
+from enum import Enum
+from typing import Optional
+
+from fastapi import Header, Query
+from fastapi.responses import Response
+
+PDF_MEDIA_TYPE = "application/pdf"
+
+
+class PdfEncoding(str, Enum):
+    """Pdf response body encoding enum class."""
+
+    BINARY = "binary"
+    BASE64 = "base64"
+
+
+def _accepts_pdf(accept: str) -> bool:
+    """Check whether an accept header explicitly lists the pdf media type."""
+    media_types = (
+        media_range.split(";")[0].strip() for media_range in accept.split(",")
+    )
+    return PDF_MEDIA_TYPE in media_types
+
+
+def pdf_encoding(
+    encoding: Optional[PdfEncoding] = Query(default=None),
+    accept: Optional[str] = Header(default=None),
+) -> PdfEncoding:
+    """Choose the pdf response encoding.
+
+    The ``encoding`` query parameter wins, otherwise clients asking for
+    ``application/pdf`` get the raw pdf. Everything else, wildcards included,
+    gets base64 which is what the frontend expects.
+    """
+    if encoding is not None:
+        return encoding
+    if accept and _accepts_pdf(accept):
+        return PdfEncoding.BINARY
+    return PdfEncoding.BASE64
+
+
+def pdf_response(content: bytes, filename: str, encoding: PdfEncoding) -> Response:
+    """Create a raw or base64 encoded pdf response."""
+    headers = {"Vary": "Accept"}
+    if encoding == PdfEncoding.BASE64:
+        return Response(
+            content=base64.b64encode(content),
+            media_type=PDF_MEDIA_TYPE,
+            headers=headers,
+        )
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return Response(content=content, media_type=PDF_MEDIA_TYPE, headers=headers)
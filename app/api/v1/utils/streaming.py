@@ -0,0 +1,78 @@
+"""Streaming json responses utilities module."""
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, AsyncIterator, Sequence
+
+from fastapi.responses import StreamingResponse
+from pydantic.json import pydantic_encoder
+from sqlalchemy.engine import Row
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+STREAM_BATCH_SIZE = 500
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class StreamFormat(str, Enum):
+    """Streaming response format enum class."""
+
+    NDJSON = "ndjson"
+    JSON = "json"
+
+
+@dataclass
+class RowStream:
+    """Column names and row batches of a query streamed from the database."""
+
+    columns: list[str]
+    batches: AsyncIterator[Sequence[Row]]
+
+
+def stream_statement(session: AsyncSession, statement: Any) -> RowStream:
+    """Stream statement rows in batches from a server side cursor.
+
+    The statement is only executed once the batches are iterated, ie. while
+    the response body is sent and after the request's unit of work ended.
+    """
+
+    async def batches() -> AsyncIterator[Sequence[Row]]:
+        result = await session.stream(
+            statement.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+    return RowStream(columns=list(statement.selected_columns.keys()), batches=batches())
+
+
+def dump_row(row: Any) -> str:
+    """Serialize one result row to a json string."""
+    return json.dumps(dict(row._mapping), default=pydantic_encoder)
+
+
+async def ndjson_chunks(rows: RowStream) -> AsyncIterator[str]:
+    """Serialize row batches as newline delimited json, one row per line."""
+    async for batch in rows.batches:
+        yield "".join(f"{dump_row(row)}\n" for row in batch)
+
+
+async def json_array_chunks(rows: RowStream) -> AsyncIterator[str]:
+    """Serialize row batches as one json array sent in chunks."""
+    separator = "["
+    async for batch in rows.batches:
+        if not batch:
+            continue
+        yield separator + ",".join(dump_row(row) for row in batch)
+        separator = ","
+    yield "[]" if separator == "[" else "]"
+
+
+def stream_rows(rows: RowStream, stream_format: StreamFormat) -> StreamingResponse:
+    """Create a response serializing row batches as they are fetched.
+
+    Memory use is bounded by the batch size regardless of the number of
+    rows, the first rows are sent before the query finished.
+    """
+    if stream_format == StreamFormat.NDJSON:
+        return StreamingResponse(ndjson_chunks(rows), media_type=NDJSON_MEDIA_TYPE)
+    return StreamingResponse(json_array_chunks(rows), media_type="application/json")
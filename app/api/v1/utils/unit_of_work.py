@@ -0,0 +1,64 @@
+"""Request scoped unit of work module."""
+from collections.abc import Callable, Coroutine
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.orm import Session, UOWTransaction
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import db
+from app.core.replica import CONSISTENCY_TOKEN_HEADER
+
+HAS_WRITES = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_session_writes(session: Session, flush_context: UOWTransaction) -> None:
+    """Remember that the session flushed changes to the database."""
+    session.info[HAS_WRITES] = True
+
+
+def get_request_session(request: Request) -> Optional[AsyncSession]:
+    """Get the database session opened for the request, if any."""
+    return getattr(request.state, "db_session", None)
+
+
+class UnitOfWorkRoute(APIRoute):
+    """Route that commits the request's database session once.
+
+    CRUD classes only flush their changes. The shared request session is
+    committed after the endpoint returned and before the response is sent,
+    or rolled back when the endpoint raised. Responses of requests that
+    wrote to the primary carry a consistency token, which the client sends
+    back to read its own writes from the replica.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the default route handler in a transaction."""
+        route_handler = super().get_route_handler()
+
+        async def unit_of_work_handler(request: Request) -> Response:
+            try:
+                response = await route_handler(request)
+            except Exception:
+                session = get_request_session(request)
+                if session is not None and session.in_transaction():
+                    await session.rollback()
+                raise
+
+            session = get_request_session(request)
+            if session is None or not session.in_transaction():
+                return response
+            await session.commit()
+
+            has_writes = session.sync_session.info.pop(HAS_WRITES, False)
+            if has_writes and db.replica_router.enabled:
+                conn = await session.connection()
+                token = await db.replica_router.consistency_token(conn)
+                if token is not None:
+                    response.headers[CONSISTENCY_TOKEN_HEADER] = token
+            return response
+
+        return unit_of_work_handler
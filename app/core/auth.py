@@ -0,0 +1,106 @@
+"""Verified json web token claims cache module."""
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from threading import Lock
+from typing import Callable, Optional
+
+from fastapi_jwt_auth import AuthJWT  # type: ignore
+from fastapi_jwt_auth.exceptions import JWTDecodeError  # type: ignore
+
+from app.core.metrics import Counter, registry
+from app.core.settings import settings
+
+
+class VerifiedTokenCache:
+    """Size bounded least recently used cache of verified token claims.
+
+    Claims are kept until their token expires, an expired token is verified
+    again and fails like it would without the cache.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize verified token cache."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = registry.register(
+            Counter("hr_jwt_cache_hits_total", "Number of verified token cache hits.")
+        )
+        self.misses = registry.register(
+            Counter(
+                "hr_jwt_cache_misses_total", "Number of verified token cache misses."
+            )
+        )
+
+    def __len__(self) -> int:
+        """Get number of cached tokens."""
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[dict]:
+        """Get claims of a verified token, if still valid."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses.inc()
+                return None
+            self._entries.move_to_end(key)
+        self.hits.inc()
+        return entry[1]
+
+    def set(self, key: bytes, expires_at: float, claims: dict) -> None:
+        """Store claims of a verified token until it expires."""
+        with self._lock:
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all verified tokens."""
+        with self._lock:
+            self._entries.clear()
+
+
+token_cache = VerifiedTokenCache(settings.jwt_cache_max_entries)
+
+
+class CachedAuthJWT(AuthJWT):
+    """AuthJWT reusing the claims of tokens it already verified.
+
+    Checking the RS256 signature is the most expensive part of handling a
+    request, and clients send the same token with every request. Entries
+    are keyed by a hash of the verification key, the issuer and the token,
+    so a rotated key verifies tokens again. Denylist checks are not cached.
+    Tokens without an expiry are always verified.
+    """
+
+    # called when a token signature does not match, the key may have rotated
+    invalid_signature_callbacks: list[Callable[[], None]] = []
+
+    def _verified_token(self, encoded_token: str, issuer: Optional[str] = None) -> dict:
+        """Verify a token, or get its claims from the cache, and return them."""
+        digest = hashlib.sha256()
+        for part in (self._public_key or self._secret_key, issuer, encoded_token):
+            digest.update(f"{part}\0".encode())
+        key = digest.digest()
+
+        claims = token_cache.get(key)
+        if claims is None:
+            try:
+                claims = super()._verified_token(encoded_token, issuer)
+            except JWTDecodeError as e:
+                if e.message == "Signature verification failed":
+                    for callback in self.invalid_signature_callbacks:
+                        callback()
+                raise
+            if "exp" in claims:
+                leeway = self._decode_leeway
+                if isinstance(leeway, timedelta):
+                    leeway = leeway.total_seconds()
+                token_cache.set(key, claims["exp"] + leeway, claims)
+        return dict(claims)
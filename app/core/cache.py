@@ -0,0 +1,230 @@
+"""In-process reference data cache module."""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Optional, TypeVar
+
+import asyncpg  # type: ignore
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.metrics import Counter, registry
+from app.core.replica import REPLICA_SESSION
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+STALE_CACHES = "stale_caches"
+NOTIFY_QUERY = text("SELECT pg_notify(:channel, :payload)")
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Size bounded least recently used cache with expiring entries.
+
+    Every invalidation starts a new generation. Values loaded during an
+    older generation are not stored, so a read racing with a write can not
+    put stale data back into the cache. Values loaded through the replica
+    are not stored either, it may not have replayed the write that
+    invalidated the cache yet.
+    """
+
+    def __init__(self, name: str, ttl: float, max_entries: int) -> None:
+        """TTL cache initializer."""
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        labels = {"cache": name}
+        self.hits = registry.register(
+            Counter("hr_cache_hits_total", "Number of cache hits.", labels)
+        )
+        self.misses = registry.register(
+            Counter("hr_cache_misses_total", "Number of cache misses.", labels)
+        )
+
+    def __len__(self) -> int:
+        """Get number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Get cached value or the missing sentinel."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Store value, evicting the least recently used entries when full."""
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self.generation += 1
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        session: Optional[AsyncSession] = None,
+    ) -> T:
+        """Get cached value, loading it on a miss.
+
+        The loaded value is stored unless ``session``, the one the loader
+        reads with, is bound to the replica.
+        """
+        value = self.get(key)
+        if value is not _MISSING:
+            self.hits.inc()
+            return value
+        self.misses.inc()
+        generation = self.generation
+        value = await loader()
+        if session is None or not session.sync_session.info.get(REPLICA_SESSION):
+            self.set(key, value, generation)
+        return value
+
+
+caches: dict[str, TTLCache] = {}
+
+
+def get_cache(name: str) -> TTLCache:
+    """Get the named cache, creating it on first use."""
+    if name not in caches:
+        caches[name] = TTLCache(
+            name, ttl=settings.cache_ttl, max_entries=settings.cache_max_entries
+        )
+    return caches[name]
+
+
+def invalidate(name: str) -> None:
+    """Invalidate the named cache of this process."""
+    cache = caches.get(name)
+    if cache is not None:
+        cache.invalidate()
+
+
+def invalidate_all() -> None:
+    """Invalidate all caches of this process."""
+    for cache in caches.values():
+        cache.invalidate()
+
+
+async def invalidate_on_commit(session: AsyncSession, *names: str) -> None:
+    """Invalidate the named caches in every worker once the session commits.
+
+    The local caches are dropped right after the commit. Other workers are
+    told through postgres notifications, which postgres only delivers when
+    the transaction commits.
+    """
+    session.sync_session.info.setdefault(STALE_CACHES, set()).update(names)
+    for name in names:
+        await session.execute(
+            NOTIFY_QUERY,
+            {"channel": settings.cache_invalidation_channel, "payload": name},
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    """Invalidate caches of data changed by the committed transaction."""
+    for name in session.info.pop(STALE_CACHES, ()):
+        invalidate(name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    """Keep caches of data whose changes were rolled back."""
+    session.info.pop(STALE_CACHES, None)
+
+
+class CacheInvalidationListener:
+    """Listen for cache invalidations committed by other workers.
+
+    Notifications sent while the listener is disconnected are lost, so all
+    caches are dropped whenever the connection is (re)established.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[asyncpg.Connection]],
+        channel: str,
+        retry_interval: float = 1.0,
+        max_retry_interval: float = 30.0,
+    ) -> None:
+        """Cache invalidation listener initializer."""
+        self.connect = connect
+        self.channel = channel
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.listening = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        """Invalidate the cache named in the notification payload."""
+        invalidate(payload)
+
+    async def _listen(self) -> None:
+        """Listen on one connection until it is lost."""
+        connection = await self.connect()
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        try:
+            await connection.add_listener(self.channel, self._on_notification)
+            invalidate_all()
+            self.listening.set()
+            await lost.wait()
+        finally:
+            self.listening.clear()
+            if not connection.is_closed():
+                await connection.close()
+
+    async def _run(self) -> None:
+        """Keep listening, reconnecting with exponential backoff."""
+        delay = self.retry_interval
+        while True:
+            started = time.monotonic()
+            try:
+                await self._listen()
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+                logger.warning("Cache invalidation listener failed: %s", e)
+            if time.monotonic() - started > self.max_retry_interval:
+                delay = self.retry_interval
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_retry_interval)
+
+    def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
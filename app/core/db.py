@@ -1,12 +1,19 @@
 """Database engine and session creation module."""
+import time
 from collections.abc import AsyncGenerator
 from operator import attrgetter
 from sys import modules
 
-from sqlalchemy.ext.asyncio import create_async_engine
+import asyncpg  # type: ignore
+from fastapi import Request
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.metrics import CallbackGauge, Counter, Histogram, registry
+from app.core.replica import CONSISTENCY_TOKEN_HEADER, REPLICA_SESSION, ReplicaRouter
 from app.core.settings import settings
 
 user, password, db, host, port, test_db, test_port = attrgetter(
@@ -21,18 +28,140 @@ user, password, db, host, port, test_db, test_port = attrgetter(
 
 db_connection_str = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db}"
 if "pytest" in modules:
+    db, port = test_db, test_port
     db_connection_str = (
         f"postgresql+asyncpg://{user}:{password}@{host}:{test_port}/{test_db}"
     )
 
+replica_connection_str = None
+if settings.pg_replica_server is not None:
+    replica_host = settings.pg_replica_server
+    replica_port = settings.pg_replica_port or port
+    replica_connection_str = (
+        f"postgresql+asyncpg://{user}:{password}@{replica_host}:{replica_port}/{db}"
+    )
+
+pool_checkout_wait = registry.register(
+    Histogram(
+        "hr_db_pool_checkout_wait_seconds",
+        "Time spent waiting for a pooled database connection.",
+    )
+)
+pool_checkout_timeouts = registry.register(
+    Counter(
+        "hr_db_pool_checkout_timeouts_total",
+        "Number of connection checkouts that hit the pool timeout.",
+    )
+)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Async queue pool that records connection checkout wait time."""
+
+    def _do_get(self):
+        """Checkout a connection and record how long it took."""
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_checkout_timeouts.inc()
+            raise
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - start)
+
+
+def create_pooled_engine(connection_str: str) -> AsyncEngine:
+    """Create async engine with the configured connection pool."""
+    return create_async_engine(
+        connection_str,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.pg_pool_size,
+        max_overflow=settings.pg_max_overflow,
+        pool_timeout=settings.pg_pool_timeout,
+        pool_recycle=settings.pg_pool_recycle,
+        pool_pre_ping=settings.pg_pool_pre_ping,
+        connect_args={"statement_cache_size": settings.pg_statement_cache_size},
+    )
+
+
+async_engine = create_pooled_engine(db_connection_str)
+replica_engine = (
+    create_pooled_engine(replica_connection_str) if replica_connection_str else None
+)
+replica_router = ReplicaRouter(
+    replica_engine,
+    max_lag=settings.pg_replica_max_lag,
+    check_interval=settings.pg_replica_check_interval,
+    min_refresh_interval=settings.pg_replica_min_refresh_interval,
+    check_timeout=settings.pg_replica_check_timeout,
+)
+
+
+def _pool_stat(name: str):
+    """Create callback that reads a statistic of the current engine pool."""
+    return lambda: getattr(async_engine.pool, name)()
 
-async_engine = create_async_engine(db_connection_str, echo=False, future=True)
 
+for _name, _doc in (
+    ("size", "Configured number of persistent pool connections."),
+    ("checkedin", "Number of idle connections in the pool."),
+    ("checkedout", "Number of connections currently checked out of the pool."),
+    ("overflow", "Overflow connections in use, negative while the pool fills up."),
+):
+    registry.register(CallbackGauge(f"hr_db_pool_{_name}", _doc, _pool_stat(_name)))
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Provide async session."""
-    async_session = sessionmaker(
-        bind=async_engine, class_=AsyncSession, expire_on_commit=False
+registry.register(
+    CallbackGauge(
+        "hr_db_replica_lag_seconds",
+        "Last observed replication lag of the read replica.",
+        lambda: replica_router.lag,
     )
-    async with async_session() as session:
+)
+
+
+async_session_factory = sessionmaker(
+    bind=async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+READ_ONLY_METHODS = frozenset(("GET", "HEAD"))
+
+
+def read_only(request: Request) -> None:
+    """Mark a request that only reads, whatever its method, as read only.
+
+    Meant for route ``dependencies``, which are solved before the session
+    dependency, eg. for POST endpoints taking their query in the body.
+    """
+    request.state.read_only = True
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Provide request scoped async session.
+
+    The session is shared by every CRUD dependency of the request and is
+    committed once by the request's unit of work route. Read only requests
+    are served by the replica when it is configured, healthy and has caught
+    up with the client's consistency token.
+    """
+    bind = async_engine
+    from_replica = False
+    is_read_only = request.method in READ_ONLY_METHODS or getattr(
+        request.state, "read_only", False
+    )
+    if is_read_only and replica_router.enabled:
+        token = request.headers.get(CONSISTENCY_TOKEN_HEADER)
+        if await replica_router.can_serve(token):
+            bind = replica_engine  # type: ignore
+            from_replica = True
+    async with async_session_factory(bind=bind) as session:
+        session.sync_session.info[REPLICA_SESSION] = from_replica
+        request.state.db_session = session
         yield session
+
+
+async def connect_raw() -> asyncpg.Connection:
+    """Open a dedicated connection to the primary outside of the pool."""
+    return await asyncpg.connect(db_connection_str.replace("+asyncpg", "", 1))
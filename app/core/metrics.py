@@ -0,0 +1,187 @@
+"""In-process metrics and prometheus text exposition module."""
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable
+from threading import Lock
+from typing import Optional, TypeVar
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _format_labels(labels: dict[str, str], extra: Optional[dict] = None) -> str:
+    """Render metric labels in prometheus text format."""
+    values = {**labels, **(extra or {})}
+    if not values:
+        return ""
+    body = ",".join(f'{k}="{v}"' for k, v in values.items())
+    return f"{{{body}}}"
+
+
+class Metric(ABC):
+    """Base class of all metrics."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labels: Optional[dict[str, str]] = None
+    ) -> None:
+        """Metric class initializer."""
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels or {}
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """Return metric samples in prometheus text format."""
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labels: Optional[dict[str, str]] = None
+    ) -> None:
+        """Counter class initializer."""
+        super().__init__(name, documentation, labels)
+        self._value = 0.0
+        self._lock = Lock()
+
+    @property
+    def value(self) -> float:
+        """Get current counter value."""
+        return self._value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment counter."""
+        with self._lock:
+            self._value += amount
+
+    def samples(self) -> list[str]:
+        """Return counter samples."""
+        return [f"{self.name}{_format_labels(self.labels)} {self._value}"]
+
+
+class CallbackGauge(Metric):
+    """Gauge whose value is read from a callback at collection time."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], float],
+        labels: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Initialize callback gauge."""
+        super().__init__(name, documentation, labels)
+        self._callback = callback
+
+    @property
+    def value(self) -> float:
+        """Get current gauge value."""
+        return float(self._callback())
+
+    def samples(self) -> list[str]:
+        """Return gauge samples."""
+        return [f"{self.name}{_format_labels(self.labels)} {self.value}"]
+
+
+class Histogram(Metric):
+    """Histogram with cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        labels: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Histogram class initializer."""
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = Lock()
+
+    @property
+    def count(self) -> int:
+        """Get number of observations."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Get sum of observations."""
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self) -> list[str]:
+        """Return histogram samples."""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self._counts):
+            cumulative += count
+            labels = _format_labels(self.labels, {"le": str(bound)})
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        cumulative += self._counts[-1]
+        labels = _format_labels(self.labels, {"le": "+Inf"})
+        lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        lines.append(f"{self.name}_sum{_format_labels(self.labels)} {self._sum}")
+        lines.append(f"{self.name}_count{_format_labels(self.labels)} {cumulative}")
+        return lines
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class MetricsRegistry:
+    """Collection of metrics exposed by the service."""
+
+    def __init__(self) -> None:
+        """Metrics registry initializer."""
+        self._metrics: list[Metric] = []
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Register a metric and return it."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render all registered metrics in prometheus text format."""
+        families: dict[str, list[Metric]] = {}
+        for metric in self._metrics:
+            families.setdefault(metric.name, []).append(metric)
+
+        lines = []
+        for name, metrics in families.items():
+            lines.append(f"# HELP {name} {metrics[0].documentation}")
+            lines.append(f"# TYPE {name} {metrics[0].type_name}")
+            for metric in metrics:
+                lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
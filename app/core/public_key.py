@@ -0,0 +1,214 @@
+"""Auth service public key provider module."""
+import asyncio
+import logging
+import os
+import pathlib
+import stat
+import tempfile
+import time
+from typing import Optional
+
+import httpx
+from fastapi_jwt_auth import AuthJWT  # type: ignore
+
+from app.core.auth import CachedAuthJWT, token_cache
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+PUBLIC_KEY_PATH = "/api/v1/auth/public-key"
+
+
+def apply_public_key(public_key: str) -> None:
+    """Verify tokens with a new public key from now on."""
+    settings.authjwt_public_key = public_key
+    AuthJWT.load_config(lambda: settings)
+    token_cache.clear()
+
+
+class PublicKeyProvider:
+    """Fetch the auth service public key and keep it up to date.
+
+    The last fetched key is saved to disk, so a restarted worker can verify
+    tokens before, or without, reaching the auth service. The key is fetched
+    again every ``refresh_interval`` seconds to pick up rotated keys, failed
+    fetches are retried with exponential backoff. A token failing signature
+    verification asks for an early fetch, in case the key was rotated, but
+    fetches stay at least ``min_refresh_interval`` seconds apart.
+    """
+
+    def __init__(
+        self,
+        auth_api: Optional[str],
+        cache_path: pathlib.Path,
+        refresh_interval: float = 300.0,
+        min_refresh_interval: float = 30.0,
+        retry_interval: float = 1.0,
+        max_retry_interval: float = 60.0,
+        timeout: float = 5.0,
+    ) -> None:
+        """Public key provider initializer."""
+        self.auth_api = auth_api
+        self.cache_path = cache_path
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.timeout = timeout
+        self.public_key: Optional[str] = None
+        self.loaded = asyncio.Event()
+        self._refresh_requested = asyncio.Event()
+        self._fetched_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def _set(self, public_key: str) -> None:
+        """Use a public key, unless it is the current one."""
+        if public_key == self.public_key:
+            return
+        if self.public_key is not None:
+            logger.info("Auth service public key rotated.")
+        self.public_key = public_key
+        apply_public_key(public_key)
+        self.loaded.set()
+
+    def _read_saved(self) -> Optional[str]:
+        """Read the saved public key, unless someone else could have written it.
+
+        Tokens are verified with the saved key, a file not owned by this
+        user or writable by others, or a symlink, is not trusted.
+        """
+        try:
+            fd = os.open(self.cache_path, os.O_RDONLY | os.O_NOFOLLOW)
+        except OSError:
+            return None
+        with os.fdopen(fd) as file:
+            status = os.fstat(file.fileno())
+            if status.st_uid != os.getuid() or status.st_mode & (
+                stat.S_IWGRP | stat.S_IWOTH
+            ):
+                logger.warning(
+                    "Ignoring saved public key %s, it is not owned by this user "
+                    "or is writable by others.",
+                    self.cache_path,
+                )
+                return None
+            return file.read()
+
+    def load_cached(self) -> Optional[str]:
+        """Use the public key saved by a previous run, if any."""
+        try:
+            public_key = self._read_saved()
+        except OSError:
+            return None
+        if public_key:
+            self._set(public_key)
+        return public_key or None
+
+    def _save(self, public_key: str) -> None:
+        """Save the public key for the next run, replacing the file atomically.
+
+        The file is only readable and writable by this user, in a directory
+        only this user can access when it is created here.
+        """
+        self.cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{self.cache_path.name}.",
+            suffix=".tmp",
+            dir=self.cache_path.parent,
+        )
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(public_key)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+    async def fetch(self) -> str:
+        """Fetch the public key from the auth service."""
+        async with httpx.AsyncClient(base_url=self.auth_api) as client:
+            response = await client.get(PUBLIC_KEY_PATH, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()["public_key"]
+
+    async def refresh(self) -> None:
+        """Fetch the public key and use it if it changed.
+
+        The key is used before it is saved, failing to save it only costs
+        the next run its head start.
+        """
+        public_key = await self.fetch()
+        self._fetched_at = time.monotonic()
+        if public_key != self.public_key:
+            self._set(public_key)
+            try:
+                await asyncio.to_thread(self._save, public_key)
+            except OSError as e:
+                logger.warning("Can not save the auth service public key: %s", e)
+
+    def request_refresh(self) -> None:
+        """Ask for the public key to be fetched again soon."""
+        self._refresh_requested.set()
+
+    async def _wait(self, delay: float) -> None:
+        """Sleep until the delay passed or a refresh is requested."""
+        self._refresh_requested.clear()
+        try:
+            await asyncio.wait_for(self._refresh_requested.wait(), delay)
+        except asyncio.TimeoutError:
+            return
+        next_refresh = self._fetched_at + self.min_refresh_interval
+        await asyncio.sleep(max(0.0, next_refresh - time.monotonic()))
+
+    async def _run(self) -> None:
+        """Keep the public key fresh, retrying failures with exponential backoff."""
+        delay = self.retry_interval
+        while True:
+            try:
+                await self.refresh()
+            except (httpx.HTTPError, KeyError, ValueError) as e:
+                logger.warning("Can not fetch the auth service public key: %s", e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_retry_interval)
+                continue
+            delay = self.retry_interval
+            await self._wait(self.refresh_interval)
+
+    async def start(self, wait: float = 0.0) -> None:
+        """Start keeping the public key fresh in the background.
+
+        Without a saved key, wait up to ``wait`` seconds for the first fetch
+        so that the first requests can be authenticated.
+        """
+        if self.auth_api is None:
+            logger.warning("auth_api is not set, using the configured public key.")
+            return
+        self.load_cached()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            CachedAuthJWT.invalid_signature_callbacks.append(self.request_refresh)
+        if self.public_key is None and wait:
+            try:
+                await asyncio.wait_for(self.loaded.wait(), wait)
+            except asyncio.TimeoutError:
+                logger.warning("No auth service public key after %s seconds.", wait)
+
+    async def stop(self) -> None:
+        """Stop refreshing the public key."""
+        if self._task is None:
+            return
+        CachedAuthJWT.invalid_signature_callbacks.remove(self.request_refresh)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+public_key_provider = PublicKeyProvider(
+    settings.auth_api,
+    pathlib.Path(settings.public_key_cache_path),
+    refresh_interval=settings.public_key_refresh_interval,
+    timeout=settings.public_key_timeout,
+)
@@ -0,0 +1,212 @@
+"""Bounded report rendering worker pool module."""
+import asyncio
+import logging
+import multiprocessing
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Any, Optional
+
+from app.core.metrics import CallbackGauge, Counter, Histogram, registry
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+RENDER_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class RenderQueueFull(Exception):
+    """Raised when the rendering pool can not accept more reports."""
+
+
+def _timed_render(submitted_at: float, render: Callable, *args: Any) -> tuple:
+    """Run a render function in a worker, timing queue wait and rendering.
+
+    Wall clock time is used because ``submitted_at`` comes from another
+    process.
+    """
+    started_at = time.time()
+    content = render(*args)
+    return started_at - submitted_at, time.time() - started_at, content
+
+
+class RenderService:
+    """Render reports in worker processes, off the event loop.
+
+    Reportlab rendering is CPU bound and holds the GIL, so a thread pool
+    would still stall the API. At most ``max_workers`` reports render at
+    once and ``max_queued`` more may wait; beyond that submissions are
+    rejected instead of piling up. A report keeps its slot until its worker
+    is done with it, even when the waiting request went away.
+    """
+
+    def __init__(self, max_workers: int, max_queued: int) -> None:
+        """Render service initializer."""
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._lock = Lock()
+        self.queue_wait = registry.register(
+            Histogram(
+                "hr_report_queue_wait_seconds",
+                "Time reports spent queued before a worker started rendering.",
+                RENDER_BUCKETS,
+            )
+        )
+        self.render_time = registry.register(
+            Histogram(
+                "hr_report_render_seconds",
+                "Time spent rendering a report in a worker.",
+                RENDER_BUCKETS,
+            )
+        )
+        self.rejected = registry.register(
+            Counter(
+                "hr_report_rejected_total",
+                "Number of reports rejected because the render queue was full.",
+            )
+        )
+        registry.register(
+            CallbackGauge(
+                "hr_report_pending",
+                "Number of reports rendering or waiting for a worker.",
+                lambda: self.pending,
+            )
+        )
+
+    @property
+    def pending(self) -> int:
+        """Get number of reports rendering or queued."""
+        return self._pending
+
+    @property
+    def capacity(self) -> int:
+        """Get maximum number of reports rendering or queued."""
+        return self.max_workers + self.max_queued
+
+    def start(self) -> None:
+        """Start worker processes unless already started."""
+        if self._executor is None:
+            # forking a process running an event loop and a connection pool
+            # is not safe, workers start from a fresh interpreter instead
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop worker processes, dropping queued reports.
+
+        Without ``wait`` the workers are reaped in the background, so it is
+        safe to call on the event loop.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _acquire(self, slots: int = 1) -> None:
+        """Take slots for reports or raise when there are not enough left."""
+        with self._lock:
+            if self._pending + slots > self.capacity:
+                self.rejected.inc()
+                raise RenderQueueFull
+            self._pending += slots
+
+    def _release(self, slots: int = 1) -> None:
+        """Give back slots of finished reports."""
+        with self._lock:
+            self._pending -= slots
+
+    def _submit(self, render: Callable[..., bytes], *args: Any) -> Future:
+        """Queue a report for the workers."""
+        self.start()
+        assert self._executor is not None
+        return self._executor.submit(_timed_render, time.time(), render, *args)
+
+    async def _result(self, future: Future) -> bytes:
+        """Wait for a queued report and record its timings."""
+        try:
+            queue_wait, render_time, content = await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            logger.exception("Report rendering worker died, restarting the pool.")
+            self.shutdown(wait=False)
+            raise
+        self.queue_wait.observe(queue_wait)
+        self.render_time.observe(render_time)
+        return content
+
+    async def render(self, render: Callable[..., bytes], *args: Any) -> bytes:
+        """Render a report in a worker process and return its content.
+
+        ``render`` and its arguments must be picklable, a module level
+        function with plain arguments is.
+        """
+        self._acquire()
+        try:
+            future = self._submit(render, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return await self._result(future)
+
+    def batch(self, size: int) -> "RenderBatch":
+        """Reserve slots to render ``size`` reports, as many at once as workers."""
+        return RenderBatch(self, max(1, min(size, self.max_workers)))
+
+
+class RenderBatch:
+    """Many reports rendered in parallel through slots reserved up front.
+
+    Reserving when the batch is created lets a saturated service reject it
+    before a response is started. ``close`` gives the slots back, running
+    reports keep theirs until they finish. It is idempotent so it can be
+    called both when rendering ends and once the response is done.
+    """
+
+    def __init__(self, service: RenderService, slots: int) -> None:
+        """Render batch initializer."""
+        service._acquire(slots)
+        self.service = service
+        self.slots = slots
+        self._futures: deque[Future] = deque()
+        self._closed = False
+
+    async def render(
+        self, render: Callable[..., bytes], arguments: Iterable[tuple]
+    ) -> AsyncIterator[bytes]:
+        """Render reports of each arguments tuple and yield them in order."""
+        try:
+            for args in arguments:
+                if len(self._futures) == self.slots:
+                    yield await self._next()
+                self._futures.append(self.service._submit(render, *args))
+            while self._futures:
+                yield await self._next()
+        finally:
+            self.close()
+
+    async def _next(self) -> bytes:
+        """Wait for the oldest queued report."""
+        content = await self.service._result(self._futures[0])
+        self._futures.popleft()
+        return content
+
+    def close(self) -> None:
+        """Drop queued reports and give back the reserved slots."""
+        if self._closed:
+            return
+        self._closed = True
+        for future in self._futures:
+            future.cancel()
+        running = [future for future in self._futures if not future.done()]
+        self.service._release(self.slots - len(running))
+        for future in running:
+            future.add_done_callback(lambda _: self.service._release())
+
+
+render_service = RenderService(settings.report_workers, settings.report_max_queued)
@@ -0,0 +1,180 @@
+"""Read replica routing module."""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.metrics import Counter, registry
+
+logger = logging.getLogger(__name__)
+
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+# session info key set on sessions bound to the replica
+REPLICA_SESSION = "replica"
+
+REPLICA_STATUS_QUERY = text(
+    """
+    SELECT
+        CASE WHEN pg_is_in_recovery()
+            THEN pg_last_wal_replay_lsn()
+            ELSE pg_current_wal_lsn()
+        END::text AS replay_lsn,
+        CASE WHEN NOT pg_is_in_recovery()
+                OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            THEN 0
+            ELSE COALESCE(
+                EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+            )
+        END AS lag
+    """
+)
+PRIMARY_LSN_QUERY = text("SELECT pg_current_wal_lsn()::text")
+
+replica_fallbacks = registry.register(
+    Counter(
+        "hr_db_replica_fallbacks_total",
+        "Number of read requests routed to the primary instead of the replica.",
+    )
+)
+
+
+def parse_lsn(lsn: str) -> int:
+    """Convert a postgres log sequence number like '16/B374D848' to int."""
+    high, _, low = lsn.partition("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+
+@dataclass
+class ReplicaStatus:
+    """Replication status of the replica at a point in time."""
+
+    replay_lsn: Optional[int]
+    lag: float
+    checked_at: float
+
+
+class ReplicaRouter:
+    """Decide whether read only work may be served by the replica.
+
+    The replica is used as long as its replication lag stays below
+    ``max_lag`` seconds and, when the client presents a consistency token,
+    it has replayed the primary's WAL up to that token.
+
+    One request at a time checks the replica, giving up after
+    ``check_timeout`` seconds, while the others go on with the last known
+    status. Tokens ahead of the replica force a check, at most every
+    ``min_refresh_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        replica_engine: Optional[AsyncEngine],
+        max_lag: float = 5.0,
+        check_interval: float = 1.0,
+        min_refresh_interval: float = 0.1,
+        check_timeout: float = 1.0,
+    ) -> None:
+        """Replica router initializer."""
+        self.replica_engine = replica_engine
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.check_timeout = check_timeout
+        self._status: Optional[ReplicaStatus] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether a replica is configured."""
+        return self.replica_engine is not None
+
+    @property
+    def lag(self) -> float:
+        """Get the last observed replication lag in seconds."""
+        if self._status is None:
+            return 0.0
+        return self._status.lag
+
+    async def _fetch_status(self) -> Optional[ReplicaStatus]:
+        """Query the replica for its replay position and lag."""
+        if self.replica_engine is None:
+            return None
+        try:
+            async with self.replica_engine.connect() as conn:
+                row = (await conn.execute(REPLICA_STATUS_QUERY)).one()
+        except (DBAPIError, OSError, asyncio.TimeoutError) as e:
+            logger.warning("Replica status check failed: %s", e)
+            return ReplicaStatus(
+                replay_lsn=None, lag=float("inf"), checked_at=time.monotonic()
+            )
+        replay_lsn = parse_lsn(row.replay_lsn) if row.replay_lsn else None
+        return ReplicaStatus(
+            replay_lsn=replay_lsn, lag=float(row.lag), checked_at=time.monotonic()
+        )
+
+    async def status(self, refresh: bool = False) -> Optional[ReplicaStatus]:
+        """Get replica status, re-checking it at most every check interval.
+
+        A forced refresh re-checks at most every minimum refresh interval.
+        While another request is checking, the last known status is used,
+        which is None before the first check completes.
+        """
+        if self._status is not None:
+            interval = self.min_refresh_interval if refresh else self.check_interval
+            if time.monotonic() - self._status.checked_at < interval:
+                return self._status
+        if self._lock.locked():
+            return self._status
+        async with self._lock:
+            try:
+                self._status = await asyncio.wait_for(
+                    self._fetch_status(), self.check_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Replica status check timed out after %s seconds.",
+                    self.check_timeout,
+                )
+                self._status = ReplicaStatus(
+                    replay_lsn=None, lag=float("inf"), checked_at=time.monotonic()
+                )
+            return self._status
+
+    async def can_serve(self, consistency_token: Optional[str] = None) -> bool:
+        """Check whether the replica may serve a read."""
+        if not self.enabled:
+            return False
+        status = await self.status()
+        if status is None or status.lag > self.max_lag:
+            replica_fallbacks.inc()
+            return False
+        if not consistency_token:
+            return True
+        try:
+            token_lsn = parse_lsn(consistency_token)
+        except ValueError:
+            replica_fallbacks.inc()
+            return False
+
+        if status.replay_lsn is None or status.replay_lsn < token_lsn:
+            # replay position only moves forward, re-check once before giving up
+            status = await self.status(refresh=True)
+        if status is None or status.replay_lsn is None:
+            replica_fallbacks.inc()
+            return False
+        if status.replay_lsn < token_lsn:
+            replica_fallbacks.inc()
+            return False
+        return True
+
+    async def consistency_token(self, conn: AsyncConnection) -> Optional[str]:
+        """Get the primary's current WAL position to hand out to the client."""
+        if not self.enabled:
+            return None
+        result = await conn.execute(PRIMARY_LSN_QUERY)
+        return result.scalar_one()
@@ -1,71 +1,34 @@
 """Human resources application settings module."""
 import os
-import sys
 from urllib.parse import quote_plus
 
-import requests
 from dotenv import load_dotenv
 from pydantic import BaseSettings, validator
-from requests.exceptions import ConnectionError
 
 load_dotenv()
 
 
-def get_pytest_keys() -> dict:
-    """Generate keys for testing."""
-    from cryptography.hazmat.primitives import serialization
-    from cryptography.hazmat.primitives.asymmetric import rsa
-
-    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
-    private_key_bytes = key.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption(),
-    )
-    public_key = key.public_key()
-    public_key_bytes = public_key.public_bytes(
-        encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.PKCS1
-    )
-    public_key_str = public_key_bytes.decode()
-    private_key_str = private_key_bytes.decode()
-    return dict(private_key=private_key_str, public_key=public_key_str)
-
-
-_pytest_private_key = None
-_pytest_public_key = None
-
-if "pytest" in sys.modules:
-    keys = get_pytest_keys()
-    _pytest_private_key = keys.get("private_key")
-    _pytest_public_key = keys.get("public_key")
-
-
-def get_public_key() -> str | None:
-    """Get public key."""
-    # TODO clean up this check for pytest
-    if "pytest" in sys.modules:
-        return _pytest_public_key
-
-    auth_api = os.environ.get("auth_api")
-    if auth_api is None:
-        print("auth_api environment variable not set.")
-        return None
-    try:
-        response = requests.get(f"{auth_api}/api/v1/auth/public-key")
-    except ConnectionError:
-        print("Can not obtain public key. Check Auth service.")
-        return None
-
-    return response.json()["public_key"]
-
-
 class Settings(BaseSettings):
     """Settings configuration class."""
 
     # fastapi_jwt_auth
-    authjwt_private_key: str | None = _pytest_private_key
-    authjwt_public_key: str | None = get_public_key()
+    authjwt_private_key: str | None = None
+    authjwt_public_key: str | None = None
     authjwt_algorithm: str = "RS256"
+    jwt_cache_max_entries: int = 1024
+
+    # Auth service public key
+    auth_api: str | None = None
+    # in a directory only the service user can write to, tokens are trusted
+    # on the saved key while the auth service is unreachable
+    public_key_cache_path: str = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "zaer_hr",
+        "public_key.pem",
+    )
+    public_key_refresh_interval: float = 300.0
+    public_key_timeout: float = 5.0
+    public_key_startup_wait: float = 10.0
 
     # Base
     api_v1_prefix: str
@@ -83,6 +46,32 @@ class Settings(BaseSettings):
     pg_test_db: str
     pg_test_port: int
 
+    # Database connection pool
+    pg_pool_size: int = 5
+    pg_max_overflow: int = 10
+    pg_pool_timeout: float = 30.0
+    pg_pool_recycle: int = 1800
+    pg_pool_pre_ping: bool = True
+    pg_statement_cache_size: int = 100
+
+    # Read replica
+    pg_replica_server: str | None = None
+    pg_replica_port: int | None = None
+    pg_replica_max_lag: float = 5.0
+    pg_replica_check_interval: float = 1.0
+    pg_replica_min_refresh_interval: float = 0.1
+    pg_replica_check_timeout: float = 1.0
+
+    # Reference data cache
+    cache_ttl: float = 300.0
+    cache_max_entries: int = 128
+    cache_invalidation_channel: str = "hr_cache_invalidation"
+
+    # Report rendering worker pool
+    report_workers: int = 2
+    report_max_queued: int = 8
+    report_retry_after: int = 5
+
     @validator("pg_user", "pg_password", "pg_db", "pg_test_db")
     def url_encode(cls, v):
         """Url quote strings."""
@@ -0,0 +1 @@
+"""Data export formats package."""
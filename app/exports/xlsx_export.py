@@ -0,0 +1,66 @@
+"""Streaming xlsx export module."""
+import tempfile
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Sequence
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.api.v1.utils.streaming import RowStream
+
+if TYPE_CHECKING:
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet  # type: ignore
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def _cell_value(value: Any) -> Any:
+    """Convert database values to values excel can store."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # excel has no time zones, store utc time
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _append_rows(sheet: "WriteOnlyWorksheet", rows: Sequence[Any]) -> None:
+    """Append a batch of rows to the sheet."""
+    for row in rows:
+        sheet.append([_cell_value(value) for value in row])
+
+
+async def xlsx_chunks(rows: RowStream, sheet_title: str) -> AsyncIterator[bytes]:
+    """Write streamed rows into a write only workbook and send it in chunks.
+
+    Write only worksheets keep appended rows in a temporary file instead of
+    memory. The finished workbook is saved to an anonymous temporary file,
+    private to the request, and read back in chunks. Openpyxl is imported
+    on the first export, it is slow to import and most workers never need it.
+    """
+    from openpyxl import Workbook  # type: ignore
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title)
+    sheet.append(rows.columns)
+    async for batch in rows.batches:
+        await run_in_threadpool(_append_rows, sheet, batch)
+
+    with tempfile.TemporaryFile() as file:
+        await run_in_threadpool(workbook.save, file)
+        file.seek(0)
+        while chunk := await run_in_threadpool(file.read, FILE_CHUNK_SIZE):
+            yield chunk
+
+
+def xlsx_response(
+    rows: RowStream, filename: str, sheet_title: str
+) -> StreamingResponse:
+    """Create an xlsx attachment response fed from the database."""
+    return StreamingResponse(
+        xlsx_chunks(rows, sheet_title),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,56 @@
+"""Streaming zip export module."""
+import zipfile
+from typing import AsyncIterator, Optional
+
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+
+class _ChunkBuffer:
+    """Write only file like object collecting what the zip writer writes."""
+
+    def __init__(self) -> None:
+        """Chunk buffer initializer."""
+        self._chunks: list[bytes] = []
+
+    def write(self, value: bytes) -> int:
+        """Collect written bytes."""
+        self._chunks.append(bytes(value))
+        return len(value)
+
+    def flush(self) -> None:
+        """Do nothing, chunks are handed back by ``pop``."""
+
+    def pop(self) -> bytes:
+        """Return and forget the bytes written so far."""
+        value = b"".join(self._chunks)
+        self._chunks.clear()
+        return value
+
+
+async def zip_chunks(files: AsyncIterator[tuple[str, bytes]]) -> AsyncIterator[bytes]:
+    """Archive files as they come, one chunk per file and the directory last.
+
+    The buffer is not seekable so sizes and checksums follow each file's
+    data. Files are stored, not deflated, as pdfs are already compressed.
+    """
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        async for name, content in files:
+            archive.writestr(name, content)
+            yield buffer.pop()
+    yield buffer.pop()
+
+
+def zip_response(
+    files: AsyncIterator[tuple[str, bytes]],
+    filename: str,
+    background: Optional[BackgroundTask] = None,
+) -> StreamingResponse:
+    """Create a zip attachment response built while it is sent."""
+    return StreamingResponse(
+        zip_chunks(files),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        background=background,
+    )
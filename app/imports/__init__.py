@@ -0,0 +1 @@
+"""Data import formats package."""
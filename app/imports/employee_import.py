@@ -0,0 +1,183 @@
+"""Employee bulk import module.
+
+Rows name their designation, section, nationality, country and educational
+level instead of giving uids. Names are resolved with cached lookups, rows
+are validated against ``EmployeeBase`` batch by batch and the valid ones are
+inserted with one statement per batch, all in the request's transaction.
+"""
+from typing import Any, AsyncIterator, Final, Optional
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from app.api.v1.employee_info.employee_import_crud import (
+    EmployeeImportCRUD,
+    EmployeeLookups,
+)
+from app.imports.table_import import TableError, TableRow
+from app.models.employee_info.employee import (
+    EmployeeBase,
+    EmployeeImportError,
+    EmployeeImportResult,
+)
+
+MAX_IMPORT_ROWS: Final = 10_000
+
+# name column: (employee field, lookup)
+NAME_COLUMNS: Final = {
+    "designation": ("designation_uid", "designations"),
+    "nationality": ("nationality_uid", "nationalities"),
+    "country": ("country_uid", "countries"),
+    "educational_level": ("educational_level_uid", "educational_levels"),
+}
+FIELD_COLUMNS: Final = {
+    **{field: column for column, (field, _) in NAME_COLUMNS.items()},
+    "section_uid": "section",
+}
+UNIQUE_COLUMNS: Final = ("phone_number", "national_id")
+
+
+def _resolve_section(
+    section: Any, unit: Any, lookups: EmployeeLookups
+) -> tuple[Optional[UUID], Optional[str]]:
+    """Get the section uid by name, narrowed down by unit name if given."""
+    candidates = lookups.sections.get(str(section).lower(), [])
+    if unit is not None:
+        candidates = [c for c in candidates if c[0] == str(unit).lower()]
+    if len(candidates) == 1:
+        return candidates[0][1], None
+    if not candidates:
+        return None, f"unknown section '{section}'."
+    return None, f"section '{section}' exists in several units, add a unit column."
+
+
+def _resolve_names(
+    row: TableRow, lookups: EmployeeLookups
+) -> tuple[dict[str, Any], list[EmployeeImportError]]:
+    """Replace related data names with their uids."""
+    values = dict(row.values)
+    errors = []
+    for column, (field, lookup) in NAME_COLUMNS.items():
+        name = values.pop(column, None)
+        if name is None:
+            continue
+        uid = getattr(lookups, lookup).get(str(name).lower())
+        if uid is None:
+            message = f"unknown {column.replace('_', ' ')} '{name}'."
+            errors.append(
+                EmployeeImportError(row=row.number, column=column, message=message)
+            )
+        else:
+            values[field] = uid
+
+    unit = values.pop("unit", None)
+    section = values.pop("section", None)
+    if section is not None:
+        uid, message = _resolve_section(section, unit, lookups)
+        if message is not None:
+            errors.append(
+                EmployeeImportError(row=row.number, column="section", message=message)
+            )
+        else:
+            values["section_uid"] = uid
+    return values, errors
+
+
+def validate_row(
+    row: TableRow, lookups: EmployeeLookups
+) -> tuple[Optional[dict[str, Any]], list[EmployeeImportError]]:
+    """Validate one row, reporting every problem it has.
+
+    Text is lower cased like ``lower_str_attrs`` does for single creates,
+    on the validated values rather than through the model's attributes.
+    """
+    values, errors = _resolve_names(row, lookups)
+    try:
+        payload = EmployeeBase(**values)
+    except ValidationError as e:
+        reported = {error.column for error in errors}
+        for error in e.errors():
+            field = str(error["loc"][0])
+            column = FIELD_COLUMNS.get(field, field)
+            if column not in reported:
+                errors.append(
+                    EmployeeImportError(
+                        row=row.number, column=column, message=error["msg"]
+                    )
+                )
+        return None, errors
+    if errors:
+        return None, errors
+    values = {
+        k: v.strip().lower() if isinstance(v, str) else v
+        for k, v in payload.dict().items()
+    }
+    return values, errors
+
+
+async def import_employees(
+    batches: AsyncIterator[list[TableRow]],
+    imports: EmployeeImportCRUD,
+    subject: UUID,
+    dry_run: bool = False,
+) -> EmployeeImportResult:
+    """Validate and insert employees batch by batch.
+
+    Phone numbers and national ids are unique, rows reusing one from an
+    earlier row or from an existing employee are reported instead of
+    failing the whole import. Nothing is inserted on a dry run.
+    """
+    lookups = await imports.read_lookups()
+    result = EmployeeImportResult(rows=0, created=0, dry_run=dry_run, errors=[])
+    seen: dict[str, dict[Any, int]] = {column: {} for column in UNIQUE_COLUMNS}
+
+    async for batch in batches:
+        result.rows += len(batch)
+        if result.rows > MAX_IMPORT_ROWS:
+            raise TableError(f"the file has more than {MAX_IMPORT_ROWS} rows.")
+
+        valid: dict[int, dict[str, Any]] = {}
+        for row in batch:
+            values, errors = validate_row(row, lookups)
+            if values is not None:
+                for column in UNIQUE_COLUMNS:
+                    first = seen[column].get(values[column])
+                    if first is not None:
+                        message = f"{column} is already used by row {first}."
+                        errors.append(
+                            EmployeeImportError(
+                                row=row.number, column=column, message=message
+                            )
+                        )
+            if values is None or errors:
+                result.errors.extend(errors)
+                continue
+            for column in UNIQUE_COLUMNS:
+                if values[column] is not None:
+                    seen[column][values[column]] = row.number
+            valid[row.number] = values
+
+        taken = await imports.read_taken(
+            [v["phone_number"] for v in valid.values() if v["phone_number"]],
+            [v["national_id"] for v in valid.values() if v["national_id"]],
+        )
+        for number, values in list(valid.items()):
+            for column, taken_values in zip(UNIQUE_COLUMNS, taken):
+                if values[column] in taken_values:
+                    message = f"an employee with this {column} already exists."
+                    result.errors.append(
+                        EmployeeImportError(row=number, column=column, message=message)
+                    )
+                    valid.pop(number, None)
+
+        if not dry_run:
+            await imports.create_many(
+                [
+                    {**values, "created_by": subject, "modified_by": subject}
+                    for values in valid.values()
+                ]
+            )
+        result.created += len(valid)
+
+    result.errors.sort(key=lambda error: error.row)
+    return result
@@ -0,0 +1,116 @@
+"""Uploaded csv and xlsx table reading module."""
+import csv
+import io
+import zipfile
+from dataclasses import dataclass
+from enum import Enum
+from itertools import islice
+from typing import Any, AsyncIterator, BinaryIO, Iterable, Iterator, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.exports.xlsx_export import XLSX_MEDIA_TYPE
+
+IMPORT_BATCH_SIZE = 500
+
+
+class TableFormat(str, Enum):
+    """Uploaded table format enum class."""
+
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
+class TableError(ValueError):
+    """Uploaded table can not be read."""
+
+
+@dataclass
+class TableRow:
+    """Uploaded table row values by lower case column name.
+
+    ``number`` is the row number shown by spreadsheet programs, the header
+    being row 1. Empty cells are left out so model defaults apply.
+    """
+
+    number: int
+    values: dict[str, Any]
+
+
+def table_format(
+    filename: Optional[str], content_type: Optional[str]
+) -> Optional[TableFormat]:
+    """Get the format of an uploaded table from its name or content type."""
+    name = (filename or "").lower()
+    if name.endswith(".csv") or content_type == "text/csv":
+        return TableFormat.CSV
+    if name.endswith(".xlsx") or content_type == XLSX_MEDIA_TYPE:
+        return TableFormat.XLSX
+    return None
+
+
+def _csv_rows(file: BinaryIO) -> Iterator[list[str]]:
+    """Read csv rows, accepting the byte order mark excel writes."""
+    yield from csv.reader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+
+
+def _xlsx_rows(file: BinaryIO) -> Iterator[tuple]:
+    """Read the rows of the first sheet without loading the whole workbook."""
+    from openpyxl import load_workbook  # type: ignore
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _cell_value(value: Any) -> Any:
+    """Strip text and turn whole floats, how excel stores numbers, into ints."""
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _table_rows(rows: Iterable[Any]) -> Iterator[TableRow]:
+    """Map rows to the header columns, skipping empty rows."""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        raise TableError("the file is empty.")
+    columns = [str(c).strip().lower() if c is not None else "" for c in header]
+    for number, row in enumerate(rows, start=2):
+        values = {}
+        for column, value in zip(columns, row):
+            value = _cell_value(value)
+            if column and value is not None:
+                values[column] = value
+        if values:
+            yield TableRow(number=number, values=values)
+
+
+def _next_batch(rows: Iterator[TableRow], size: int) -> list[TableRow]:
+    """Read the next batch of rows."""
+    try:
+        return list(islice(rows, size))
+    except TableError:
+        raise
+    except (ValueError, KeyError, csv.Error, zipfile.BadZipFile) as e:
+        raise TableError(f"the file can not be read: {e}") from e
+
+
+async def read_table(
+    file: BinaryIO, table: TableFormat, batch_size: int = IMPORT_BATCH_SIZE
+) -> AsyncIterator[list[TableRow]]:
+    """Read an uploaded table in batches of rows.
+
+    Rows are parsed in a worker thread one batch at a time, so a large
+    upload is never held in memory as python objects all at once.
+    """
+    rows = _table_rows(
+        _csv_rows(file) if table == TableFormat.CSV else _xlsx_rows(file)
+    )
+    while batch := await run_in_threadpool(_next_batch, rows, batch_size):
+        yield batch
@@ -1,17 +1,21 @@
 """FastAPI application entry point module."""
 import logging
-import pathlib
-import shutil
 from contextlib import asynccontextmanager
 from typing import Final
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi_jwt_auth import AuthJWT  # type: ignore
 from fastapi_jwt_auth.exceptions import AuthJWTException  # type: ignore
 
 from app.api import api_router
+from app.core.cache import CacheInvalidationListener
+from app.core.db import connect_raw
+from app.core.metrics import registry
+from app.core.public_key import public_key_provider
+from app.core.render import render_service
+from app.core.replica import CONSISTENCY_TOKEN_HEADER
 from app.core.settings import settings
 from app.models.health.health_check import HealthCheck
 
@@ -25,12 +29,16 @@ origins: Final = ["*"]
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown hook."""
-    logger.info("Creating hr_tmp dir...")
-    p = pathlib.Path("hr_tmp")
-    p.mkdir(exist_ok=True)
+    await public_key_provider.start(wait=settings.public_key_startup_wait)
+    cache_listener = CacheInvalidationListener(
+        connect_raw, channel=settings.cache_invalidation_channel
+    )
+    cache_listener.start()
+    render_service.start()
     yield
-    logger.info("Removing hr_tmp dir...")
-    shutil.rmtree(p)
+    render_service.shutdown()
+    await cache_listener.stop()
+    await public_key_provider.stop()
 
 
 app = FastAPI(lifespan=lifespan, description="ZaEr Human Resources App")
@@ -46,6 +54,12 @@ async def health_check() -> HealthCheck:
     )
 
 
+@app.get("/metrics", response_class=PlainTextResponse, tags=["status"])
+async def metrics() -> PlainTextResponse:
+    """Get service metrics in prometheus text format."""
+    return PlainTextResponse(registry.render())
+
+
 # callback to get your configuration
 @AuthJWT.load_config
 def get_config():
@@ -60,7 +74,11 @@ def authjwt_exception_handler(request: Request, exc: AuthJWTException):
 
 
 app.add_middleware(
-    CORSMiddleware, allow_origins=origins, allow_methods=["*"], allow_headers=["*"]
+    CORSMiddleware,
+    allow_origins=origins,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=[CONSISTENCY_TOKEN_HEADER, "ETag"],
 )
 
 app.include_router(api_router, prefix=settings.api_v1_prefix)
@@ -5,6 +5,7 @@ from app.models.employee_info.contact_person import ContactPersonDB
 from app.models.employee_info.country import CountryDB
 from app.models.employee_info.educational_level import EducationalLevelDB
 from app.models.employee_info.employee import EmployeeDB
+from app.models.employee_info.employee_full import EmployeeFullDB
 from app.models.employee_info.nationalities import NationalityDB
 from app.models.employee_info.termination import TerminationDB
 from app.models.organization_units.department import DepartmentDB
@@ -23,6 +24,7 @@ __all__ = (
     "CountryDB",
     "EducationalLevelDB",
     "EmployeeDB",
+    "EmployeeFullDB",
     "ChildDB",
     "AddressDB",
     "ContactPersonDB",
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class AddressBase(SQLModel):
@@ -56,7 +56,7 @@ class AddressRead(AddressCreate):
     date_modified: datetime
 
 
-class AddressReadMany(SQLModel):
+class AddressReadMany(ReadManyPage):
     """Address read many model."""
 
     count: int
@@ -6,7 +6,7 @@ from uuid import UUID
 from sqlmodel import CheckConstraint, Field, SQLModel, UniqueConstraint
 
 from app.models.employee_info.employee import Gender
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class ChildBase(SQLModel):
@@ -63,7 +63,7 @@ class ChildRead(ChildCreate):
     date_modified: datetime
 
 
-class ChildReadMany(SQLModel):
+class ChildReadMany(ReadManyPage):
     """Child read many model."""
 
     count: int
@@ -6,7 +6,7 @@ from uuid import UUID
 from pydantic import validator
 from sqlmodel import Field, SQLModel
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class ContactPersonBase(SQLModel):
@@ -71,7 +71,7 @@ class ContactPersonRead(ContactPersonCreate):
     date_modified: datetime
 
 
-class ContactPersonReadMany(SQLModel):
+class ContactPersonReadMany(ReadManyPage):
     """Contact person read many model."""
 
     count: int
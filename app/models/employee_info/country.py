@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class CountryBase(SQLModel):
@@ -49,7 +49,7 @@ class CountryRead(CountryCreate):
     date_modified: datetime
 
 
-class CountryReadMany(SQLModel):
+class CountryReadMany(ReadManyPage):
     """Country read many model."""
 
     count: int
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class EducationalLevelBase(SQLModel):
@@ -51,7 +51,7 @@ class EducationalLevelRead(EducationalLevelCreate):
     date_modified: datetime
 
 
-class EducationalLevelReadMany(SQLModel):
+class EducationalLevelReadMany(ReadManyPage):
     """Educational level read many model."""
 
     count: int
@@ -6,9 +6,9 @@ from typing import Callable, ClassVar, Optional, Union
 from uuid import UUID
 
 from pydantic import validator
-from sqlmodel import CheckConstraint, Field, Identity, SQLModel
+from sqlmodel import CheckConstraint, Field, Identity, Index, SQLModel
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class Gender(str, Enum):
@@ -183,6 +183,11 @@ class EmployeeDB(Base, EmployeeBase, table=True):
     """Employee model for database table."""
 
     __tablename__: ClassVar[Union[str, Callable[..., str]]] = "employee"
+    __table_args__ = (
+        Index("ix_employee_date_created_uid", "date_created", "uid"),
+        Index("ix_employee_section_uid", "section_uid"),
+        Index("ix_employee_current_hire_date", "current_hire_date"),
+    )
     badge_number: int = Field(
         nullable=False, unique=True, index=True, sa_column_args=(Identity(always=True),)
     )
@@ -234,20 +239,85 @@ class EmployeeReadFull(EmployeeRead):
     designation: str
 
 
-class EmployeeReadMany(SQLModel):
+class EmployeeReadMany(ReadManyPage):
     """Employee read many model."""
 
     count: int
     result: list[EmployeeRead]
 
 
-class EmployeeReadManyFull(SQLModel):
+class EmployeeReadManyFull(ReadManyPage):
     """Employee read many full info model."""
 
     count: int
     result: list[EmployeeReadFull]
 
 
+EMPLOYEE_BATCH_MAX_SIZE = 1000
+
+
+class EmployeeUidBatch(SQLModel):
+    """Employee uids to read at once model."""
+
+    uids: list[UUID] = Field(min_items=1, max_items=EMPLOYEE_BATCH_MAX_SIZE)
+
+
+class EmployeeBadgeNumberBatch(SQLModel):
+    """Employee badge numbers to read at once model."""
+
+    badge_numbers: list[int] = Field(min_items=1, max_items=EMPLOYEE_BATCH_MAX_SIZE)
+
+
+class EmployeeReadFullByUids(SQLModel):
+    """Employees full info in requested uids order model."""
+
+    count: int
+    result: list[EmployeeReadFull]
+    not_found: list[UUID]
+
+
+class EmployeeReadFullByBadgeNumbers(SQLModel):
+    """Employees full info in requested badge numbers order model."""
+
+    count: int
+    result: list[EmployeeReadFull]
+    not_found: list[int]
+
+
+class EmployeeSearchResult(EmployeeReadFull):
+    """Employee search match model."""
+
+    rank: float
+
+
+class EmployeeSearchResults(ReadManyPage):
+    """Employee search matches ordered by descending rank model."""
+
+    count: int
+    result: list[EmployeeSearchResult]
+
+
+class EmployeeSortKey(str, Enum):
+    """Employee list sort key enum class."""
+
+    DATE_CREATED = "date_created"
+    BADGE_NUMBER = "badge_number"
+
+
+class EmployeeFilter(SQLModel):
+    """Employee list filters model."""
+
+    is_active: Optional[bool] = None
+    is_terminated: Optional[bool] = None
+    section_uid: Optional[UUID] = None
+    unit_uid: Optional[UUID] = None
+    department_uid: Optional[UUID] = None
+    division_uid: Optional[UUID] = None
+    designation_uid: Optional[UUID] = None
+    hired_from: Optional[date] = None
+    hired_to: Optional[date] = None
+
+
 class EmployeeSeverancePay(SQLModel):
     """Employee model for severance pay calculation."""
 
@@ -259,3 +329,20 @@ class EmployeeSeverancePay(SQLModel):
     termination_date: date
     department: str
     current_salary: Decimal
+
+
+class EmployeeImportError(SQLModel):
+    """Employee import row error model."""
+
+    row: int
+    column: Optional[str] = None
+    message: str
+
+
+class EmployeeImportResult(SQLModel):
+    """Employee import outcome model."""
+
+    rows: int
+    created: int
+    dry_run: bool
+    errors: list[EmployeeImportError]
@@ -0,0 +1,272 @@
+"""Denormalized employee read model module.
+
+The ``employee_full`` table holds one row per employee with the names of
+its organization units and reference data. Statement level triggers keep
+it up to date in the same transaction as writes to ``employee`` and to the
+tables it is joined with, eg. renaming a division refreshes the rows of
+every employee under it.
+
+Name, phone number and national id columns have trigram indexes, provided
+by the ``pg_trgm`` extension, backing the employee search.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, ClassVar, Final, Union
+from uuid import UUID
+
+from sqlalchemy import DDL, Column, ForeignKey, event
+from sqlmodel import Field, Index, SQLModel
+from sqlmodel.sql.sqltypes import GUID
+
+from app.models.employee_info.employee import (
+    ContractType,
+    Gender,
+    MaritalStatus,
+    NationalService,
+)
+
+SEARCH_COLUMNS: Final = (
+    "first_name",
+    "last_name",
+    "grandfather_name",
+    "mother_first_name",
+    "mother_last_name",
+    "mother_grandfather_name",
+    "phone_number",
+    "national_id",
+)
+
+
+def _trigram_index(column: str) -> Index:
+    """Create a trigram gin index speeding up similarity and ilike matches."""
+    return Index(
+        f"ix_employee_full_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
+class EmployeeFullDB(SQLModel, table=True):
+    """Denormalized employee read model for database table."""
+
+    __tablename__: ClassVar[Union[str, Callable[..., str]]] = "employee_full"
+    __table_args__ = (
+        Index("ix_employee_full_date_created_uid", "date_created", "uid"),
+        Index("ix_employee_full_section_uid", "section_uid"),
+        Index("ix_employee_full_current_hire_date", "current_hire_date"),
+        *(_trigram_index(column) for column in SEARCH_COLUMNS),
+    )
+    uid: UUID = Field(
+        sa_column=Column(
+            GUID(),
+            ForeignKey("employee.uid", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    badge_number: int = Field(nullable=False, unique=True)
+    first_name: str = Field(nullable=False)
+    last_name: str = Field(nullable=False)
+    grandfather_name: str = Field(nullable=False)
+    gender: Gender = Field(nullable=False)
+    birth_date: date = Field(nullable=False)
+    birth_place: str = Field(nullable=False)
+    origin_of_birth: str = Field(nullable=False)
+    mother_first_name: str = Field(nullable=False)
+    mother_last_name: str = Field(nullable=False)
+    mother_grandfather_name: str = Field(nullable=False)
+    section_uid: UUID = Field(nullable=False)
+    educational_level_uid: UUID = Field(nullable=False)
+    country_uid: UUID = Field(nullable=False)
+    nationality_uid: UUID = Field(nullable=False)
+    designation_uid: UUID = Field(nullable=False)
+    current_hire_date: date = Field(nullable=False)
+    current_salary: Decimal = Field(nullable=False)
+    marital_status: MaritalStatus = Field(nullable=False)
+    national_id: str = Field(nullable=True)
+    phone_number: str = Field(nullable=True)
+    apprenticeship_from_date: date = Field(nullable=False)
+    apprenticeship_to_date: date = Field(nullable=False)
+    contract_type: ContractType = Field(nullable=False)
+    national_service: NationalService = Field(nullable=False)
+    is_active: bool = Field(nullable=False)
+    is_terminated: bool = Field(nullable=False)
+    created_by: UUID = Field(nullable=False)
+    modified_by: UUID = Field(nullable=False)
+    date_created: datetime = Field(nullable=False)
+    date_modified: datetime = Field(nullable=False)
+    division: str = Field(nullable=False)
+    department: str = Field(nullable=False)
+    unit: str = Field(nullable=False)
+    section: str = Field(nullable=False)
+    educational_level: str = Field(nullable=False)
+    designation: str = Field(nullable=False)
+    nationality: str = Field(nullable=False)
+    country: str = Field(nullable=False)
+
+
+_UPSERT_ASSIGNMENTS: Final = ",\n        ".join(
+    f"{column.name} = EXCLUDED.{column.name}"
+    for column in EmployeeFullDB.__table__.columns  # type: ignore
+    if column.name != "uid"
+)
+
+# rows are locked, then upserted rather than deleted and inserted again:
+# transactions refreshing the same employee concurrently, eg. renaming its
+# unit while updating it, wait for each other's row instead of both
+# inserting it, and the upsert's select, run after the wait, sees the
+# other transaction's committed changes
+REFRESH_FUNCTION: Final = f"""
+CREATE OR REPLACE FUNCTION employee_full_refresh(employee_uids uuid[])
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM employee_full
+    WHERE uid = ANY(employee_uids)
+    ORDER BY uid
+    FOR UPDATE;
+    INSERT INTO employee_full
+    SELECT
+        e.uid,
+        e.badge_number,
+        e.first_name,
+        e.last_name,
+        e.grandfather_name,
+        e.gender,
+        e.birth_date,
+        e.birth_place,
+        e.origin_of_birth,
+        e.mother_first_name,
+        e.mother_last_name,
+        e.mother_grandfather_name,
+        e.section_uid,
+        e.educational_level_uid,
+        e.country_uid,
+        e.nationality_uid,
+        e.designation_uid,
+        e.current_hire_date,
+        e.current_salary,
+        e.marital_status,
+        e.national_id,
+        e.phone_number,
+        e.apprenticeship_from_date,
+        e.apprenticeship_to_date,
+        e.contract_type,
+        e.national_service,
+        e.is_active,
+        e.is_terminated,
+        e.created_by,
+        e.modified_by,
+        e.date_created,
+        e.date_modified,
+        dv.name,
+        dp.name,
+        u.name,
+        s.name,
+        el.level,
+        ds.title,
+        n.name,
+        c.name
+    FROM employee e
+    JOIN section s ON s.uid = e.section_uid
+    JOIN unit u ON u.uid = s.unit_uid
+    JOIN department dp ON dp.uid = u.department_uid
+    JOIN division dv ON dv.uid = dp.division_uid
+    JOIN educational_level el ON el.uid = e.educational_level_uid
+    JOIN designation ds ON ds.uid = e.designation_uid
+    JOIN nationality n ON n.uid = e.nationality_uid
+    JOIN country c ON c.uid = e.country_uid
+    WHERE e.uid = ANY(employee_uids)
+    ORDER BY e.uid
+    ON CONFLICT (uid) DO UPDATE SET
+        {_UPSERT_ASSIGNMENTS};
+END $$
+"""
+
+# employees whose read model rows depend on the changed rows of each table
+AFFECTED_EMPLOYEES: Final = {
+    "employee": "SELECT uid FROM changed_rows",
+    "section": (
+        "SELECT e.uid FROM employee e JOIN changed_rows r ON e.section_uid = r.uid"
+    ),
+    "unit": (
+        "SELECT e.uid FROM employee e "
+        "JOIN section s ON s.uid = e.section_uid "
+        "JOIN changed_rows r ON s.unit_uid = r.uid"
+    ),
+    "department": (
+        "SELECT e.uid FROM employee e "
+        "JOIN section s ON s.uid = e.section_uid "
+        "JOIN unit u ON u.uid = s.unit_uid "
+        "JOIN changed_rows r ON u.department_uid = r.uid"
+    ),
+    "division": (
+        "SELECT e.uid FROM employee e "
+        "JOIN section s ON s.uid = e.section_uid "
+        "JOIN unit u ON u.uid = s.unit_uid "
+        "JOIN department dp ON dp.uid = u.department_uid "
+        "JOIN changed_rows r ON dp.division_uid = r.uid"
+    ),
+    "designation": (
+        "SELECT e.uid FROM employee e "
+        "JOIN changed_rows r ON e.designation_uid = r.uid"
+    ),
+    "educational_level": (
+        "SELECT e.uid FROM employee e "
+        "JOIN changed_rows r ON e.educational_level_uid = r.uid"
+    ),
+    "nationality": (
+        "SELECT e.uid FROM employee e "
+        "JOIN changed_rows r ON e.nationality_uid = r.uid"
+    ),
+    "country": (
+        "SELECT e.uid FROM employee e JOIN changed_rows r ON e.country_uid = r.uid"
+    ),
+}
+
+
+def _trigger_statements(table: str, affected: str, operation: str) -> list[str]:
+    """Create statements refreshing affected employees after the operation."""
+    function = f"employee_full_on_{table}_{operation.lower()}"
+    return [
+        f"""
+CREATE OR REPLACE FUNCTION {function}()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM employee_full_refresh(ARRAY({affected}));
+    RETURN NULL;
+END $$
+""",
+        f"DROP TRIGGER IF EXISTS {function} ON {table}",
+        f"""
+CREATE TRIGGER {function}
+AFTER {operation} ON {table}
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION {function}()
+""",
+    ]
+
+
+def get_read_model_statements() -> list[str]:
+    """Create the statements installing the read model refresh triggers.
+
+    Employees are removed from the read model by the foreign key cascade,
+    inserting or deleting organization units and reference data does not
+    affect existing employees, so only their updates are tracked.
+    """
+    statements = [REFRESH_FUNCTION]
+    statements += _trigger_statements(
+        "employee", AFFECTED_EMPLOYEES["employee"], "INSERT"
+    )
+    for table, affected in AFFECTED_EMPLOYEES.items():
+        statements += _trigger_statements(table, affected, "UPDATE")
+    return statements
+
+
+event.listen(
+    EmployeeFullDB.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+for statement in get_read_model_statements():
+    event.listen(EmployeeFullDB.__table__, "after_create", DDL(statement))
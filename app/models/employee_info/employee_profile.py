@@ -0,0 +1,17 @@
+"""Employee profile models module."""
+from typing import Optional
+
+from app.models.employee_info.address import AddressRead
+from app.models.employee_info.child import ChildRead
+from app.models.employee_info.contact_person import ContactPersonRead
+from app.models.employee_info.employee import EmployeeReadFull
+from app.models.employee_info.termination import TerminationRead
+
+
+class EmployeeProfile(EmployeeReadFull):
+    """Employee full info with all related records model."""
+
+    children: list[ChildRead]
+    address: Optional[AddressRead]
+    contact_person: Optional[ContactPersonRead]
+    terminations: list[TerminationRead]
@@ -0,0 +1,35 @@
+"""Employee headcount aggregates models module."""
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from sqlmodel import SQLModel
+
+
+class HeadcountDimension(str, Enum):
+    """Employee attribute headcounts are grouped by enum class."""
+
+    DIVISION = "division"
+    DEPARTMENT = "department"
+    UNIT = "unit"
+    SECTION = "section"
+    DESIGNATION = "designation"
+    EDUCATIONAL_LEVEL = "educational_level"
+    GENDER = "gender"
+    CONTRACT_TYPE = "contract_type"
+    NATIONAL_SERVICE = "national_service"
+
+
+class HeadcountGroup(SQLModel):
+    """Number of employees sharing one value of a dimension model."""
+
+    uid: Optional[UUID] = None
+    name: str
+    count: int
+
+
+class Headcount(SQLModel):
+    """Employee headcount, total and grouped by each dimension model."""
+
+    total: int = 0
+    groups: dict[HeadcountDimension, list[HeadcountGroup]] = {}
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class NationalityBase(SQLModel):
@@ -49,7 +49,7 @@ class NationalityRead(NationalityCreate):
     date_modified: datetime
 
 
-class NationalityReadMany(SQLModel):
+class NationalityReadMany(ReadManyPage):
     """Nationality read many model."""
 
     count: int
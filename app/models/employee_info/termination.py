@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel, UniqueConstraint
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class TerminationBase(SQLModel):
@@ -59,7 +59,7 @@ class TerminationRead(TerminationCreate):
     date_modified: datetime
 
 
-class TerminationReadMany(SQLModel):
+class TerminationReadMany(ReadManyPage):
     """Termination read many model."""
 
     count: int
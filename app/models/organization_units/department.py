@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 if TYPE_CHECKING:
     from app.models import DivisionDB, UnitDB
@@ -70,14 +70,14 @@ class DepartmentReadPrintFormat(SQLModel):
     date_modified: datetime
 
 
-class DepartmentReadMany(SQLModel):
+class DepartmentReadMany(ReadManyPage):
     """Department model for reading many departments."""
 
     count: int
     result: list[DepartmentRead]
 
 
-class DepartmentReadManyPrintFormat(SQLModel):
+class DepartmentReadManyPrintFormat(ReadManyPage):
     """Department read many departments for printing."""
 
     count: int
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 
 class DesignationBase(SQLModel):
@@ -46,7 +46,7 @@ class DesignationRead(DesignationCreate):
     date_modified: datetime
 
 
-class DesignationReadMany(SQLModel):
+class DesignationReadMany(ReadManyPage):
     """Designation model for reading many."""
 
     count: int
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 if TYPE_CHECKING:
     from app.models import DepartmentDB
@@ -50,7 +50,7 @@ class DivisionRead(DivisionBase):
     date_modified: datetime
 
 
-class DivisionReadMany(SQLModel):
+class DivisionReadMany(ReadManyPage):
     """Division model for reading many divisions."""
 
     count: int
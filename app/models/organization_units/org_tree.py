@@ -0,0 +1,41 @@
+"""Organization hierarchy tree models module."""
+from uuid import UUID
+
+from sqlmodel import SQLModel
+
+
+class OrgNode(SQLModel):
+    """Organization tree node base model."""
+
+    uid: UUID
+    name: str
+    employee_count: int = 0
+
+
+class SectionNode(OrgNode):
+    """Section node of the organization tree."""
+
+
+class UnitNode(OrgNode):
+    """Unit node of the organization tree."""
+
+    sections: list[SectionNode] = []
+
+
+class DepartmentNode(OrgNode):
+    """Department node of the organization tree."""
+
+    units: list[UnitNode] = []
+
+
+class DivisionNode(OrgNode):
+    """Division node of the organization tree."""
+
+    departments: list[DepartmentNode] = []
+
+
+class OrgTree(SQLModel):
+    """Organization hierarchy tree model."""
+
+    employee_count: int = 0
+    divisions: list[DivisionNode] = []
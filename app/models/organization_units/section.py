@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 if TYPE_CHECKING:
     from app.models import UnitDB
@@ -57,7 +57,7 @@ class SectionRead(SectionCreate):
     date_modified: datetime
 
 
-class SectionReadMany(SQLModel):
+class SectionReadMany(ReadManyPage):
     """section read many model."""
 
     count: int
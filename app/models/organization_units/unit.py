@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
 
-from app.models.shared.base import Base
+from app.models.shared.base import Base, ReadManyPage
 
 if TYPE_CHECKING:
     from app.models import DepartmentDB, SectionDB
@@ -58,7 +58,7 @@ class UnitRead(UnitCreate):
     date_modified: datetime
 
 
-class UnitReadMany(SQLModel):
+class UnitReadMany(ReadManyPage):
     """unit read many model."""
 
     count: int
@@ -1,6 +1,7 @@
 """Module that contains Base model that holds shared attributes."""
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from sqlmodel import Field, SQLModel, func, text
 
@@ -36,3 +37,10 @@ class Base(TimestampModel):
     )
     created_by: uuid.UUID = Field(nullable=False)
     modified_by: uuid.UUID = Field(nullable=False)
+
+
+class ReadManyPage(SQLModel):
+    """Model that defines pagination attributes of read many models."""
+
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
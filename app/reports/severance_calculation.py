@@ -0,0 +1,244 @@
+"""Employee severance pay calculation module.
+
+The calculation is kept apart from the pdf report so that it can be reused
+without rendering anything.
+"""
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+
+from dateutil.relativedelta import relativedelta
+from pydantic import BaseModel
+
+MONTH_DAYS = 26
+CACHE_SIZE = 4096
+
+
+class DurationType(str, Enum):
+    """Duration type enum."""
+
+    YEARS = "years"
+    MONTHS = "months"
+    DAYS = "days"
+
+
+class ServicePay(BaseModel):
+    """Sevice pay model."""
+
+    duration_type: DurationType
+    duration: int
+    amount: Decimal
+
+    class Config:
+        """Service pay model configuration."""
+
+        frozen = True
+
+
+class SeverancePayBreakdown(BaseModel):
+    """Severance service pay per period of service and total model."""
+
+    salary: Decimal
+    hire_date: date
+    termination_date: date
+    include_end_date: bool
+    years: int
+    months: int
+    days: int
+    first_five_years: ServicePay
+    between_five_and_ten_years: ServicePay
+    more_than_ten_years: ServicePay
+    remaining_months: ServicePay
+    remaining_days: ServicePay
+    total: Decimal
+
+    class Config:
+        """Severance pay breakdown model configuration."""
+
+        frozen = True
+
+
+class DepartmentSeveranceLiability(BaseModel):
+    """Severance liability of one department model."""
+
+    department: str
+    employee_count: int
+    total: Decimal
+
+
+class SeveranceLiability(BaseModel):
+    """Severance liability of the active workforce model."""
+
+    as_of: date
+    employee_count: int
+    total: Decimal
+    departments: list[DepartmentSeveranceLiability]
+
+
+class SeveranceCalculator:
+    """Severance service pay calculation class."""
+
+    def __init__(
+        self,
+        salary: Decimal,
+        hire_date: date,
+        termination_date: date,
+        include_end_date: bool = False,
+    ) -> None:
+        """Severance calculator class initializer."""
+        self.salary = salary
+        self.hire_date = hire_date
+        self.termination_date = termination_date
+        self.include_end_date = include_end_date
+        self._relative_delta = relativedelta(termination_date, hire_date)
+        self.years = self._relative_delta.years
+        self.months = self._relative_delta.months
+        self.days = (
+            self._relative_delta.days + 1
+            if include_end_date
+            else self._relative_delta.days
+        )  # include end date
+
+    def calc_fist_five_years_pay(self) -> ServicePay:
+        """Calculate severance pay for the first five or less years of service."""
+        if self.years <= 5:
+            result = (self.salary / MONTH_DAYS) * 2 * 6 * self.years
+            amount = round(result, 2)
+            return ServicePay(
+                duration_type=DurationType.YEARS, duration=self.years, amount=amount
+            )
+        if self.years > 5:
+            result = (self.salary / MONTH_DAYS) * 2 * 6 * 5
+            amount = round(result, 2)
+            return ServicePay(
+                duration_type=DurationType.YEARS, duration=5, amount=amount
+            )
+
+        return ServicePay(
+            duration_type=DurationType.YEARS, duration=0, amount=Decimal()
+        )
+
+    def calc_between_five_and_ten_years_pay(self) -> ServicePay:
+        """Calculate severance pay for service years between five to ten."""
+        years = 0
+        if self.years > 5 and self.years <= 10:
+            years = self.years - 5
+        elif self.years > 10:
+            years = 5
+
+        result = (self.salary / MONTH_DAYS) * 3 * 6 * years
+        amount = round(result, 2)
+        return ServicePay(
+            duration_type=DurationType.YEARS, duration=years, amount=amount
+        )
+
+    def calc_more_than_ten_years_pay(self) -> ServicePay:
+        """Calculate severance pay for more than ten years of service."""
+        if self.years > 10:
+            years = self.years - 10
+            result = (self.salary / MONTH_DAYS) * 4 * 6 * years
+            amount = round(result, 2)
+            return ServicePay(
+                duration_type=DurationType.YEARS, duration=years, amount=amount
+            )
+        return ServicePay(
+            duration_type=DurationType.YEARS, duration=0, amount=Decimal()
+        )
+
+    def calc_remaining_months(self) -> ServicePay:
+        """Calculate severance pay for any remaining months."""
+        multiplier = 0
+        if (self.years <= 5) and (self.months < 1) and (self.days < 1):
+            multiplier = 2
+        elif (
+            (self.years >= 5)
+            and ((self.months > 0) or (self.days > 0))
+            and (self.years < 10)
+        ):
+            multiplier = 3
+        else:
+            multiplier = 4
+
+        if self.months:
+            result = (
+                (self.salary / MONTH_DAYS) * multiplier * 6 * Decimal(self.months / 12)
+            )
+            amount = round(result, 2)
+            return ServicePay(
+                duration_type=DurationType.MONTHS, duration=self.months, amount=amount
+            )
+        return ServicePay(
+            duration_type=DurationType.MONTHS, duration=0, amount=Decimal()
+        )
+
+    def calc_remaining_days(self) -> ServicePay:
+        """Calculate severance pay for any remaining days."""
+        multiplier = 0
+        if self.years <= 5:
+            multiplier = 2
+        elif (self.years > 5) and (self.years < 10):
+            multiplier = 3
+        else:
+            multiplier = 4
+        if self.days:
+            result = (
+                (self.salary / MONTH_DAYS) * multiplier * 6 * Decimal(self.days / 313)
+            )
+            amount = round(result, 2)
+            return ServicePay(
+                duration_type=DurationType.DAYS, duration=self.days, amount=amount
+            )
+        return ServicePay(duration_type=DurationType.DAYS, duration=0, amount=Decimal())
+
+    def calc_total_service_pay(self) -> Decimal:
+        """Calculate the total serverance service pay."""
+        return self.calc_breakdown().total
+
+    def calc_breakdown(self) -> SeverancePayBreakdown:
+        """Calculate the service pay of every period of service and the total."""
+        first_five_years = self.calc_fist_five_years_pay()
+        between_five_and_ten = self.calc_between_five_and_ten_years_pay()
+        more_than_ten = self.calc_more_than_ten_years_pay()
+        remaining_months = self.calc_remaining_months()
+        remaining_days = self.calc_remaining_days()
+        result = (
+            first_five_years.amount
+            + between_five_and_ten.amount
+            + more_than_ten.amount
+            + remaining_months.amount
+            + remaining_days.amount
+        )
+        return SeverancePayBreakdown(
+            salary=self.salary,
+            hire_date=self.hire_date,
+            termination_date=self.termination_date,
+            include_end_date=self.include_end_date,
+            years=self.years,
+            months=self.months,
+            days=self.days,
+            first_five_years=first_five_years,
+            between_five_and_ten_years=between_five_and_ten,
+            more_than_ten_years=more_than_ten,
+            remaining_months=remaining_months,
+            remaining_days=remaining_days,
+            total=round(result, 2),
+        )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def calculate_severance(
+    salary: Decimal,
+    hire_date: date,
+    termination_date: date,
+    include_end_date: bool = False,
+) -> SeverancePayBreakdown:
+    """Calculate the severance pay breakdown, memoized by its arguments.
+
+    The result only depends on the arguments, the returned model is frozen
+    so cached breakdowns can be shared safely.
+    """
+    calculator = SeveranceCalculator(
+        salary, hire_date, termination_date, include_end_date
+    )
+    return calculator.calc_breakdown()
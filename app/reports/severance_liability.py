@@ -0,0 +1,142 @@
+"""Workforce severance liability module.
+
+Computes the severance service pay of many employees at once on numpy
+columns, following the same rules as ``SeveranceCalculator``. Amounts are
+computed in floating point and rounded to cents per period of service, so
+an employee's total may differ by a cent from the decimal calculation.
+
+Numpy and pandas are slow to import, the api imports this module on the
+first liability request only. The response models live in
+``severance_calculation`` for that reason.
+"""
+from datetime import date
+from decimal import Decimal
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.reports.severance_calculation import (
+    MONTH_DAYS,
+    DepartmentSeveranceLiability,
+    SeveranceLiability,
+)
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+AMOUNT_COLUMNS = (
+    "first_five_years",
+    "between_five_and_ten_years",
+    "more_than_ten_years",
+    "remaining_months",
+    "remaining_days",
+)
+
+
+def to_date_column(dates: Sequence[date]) -> np.ndarray:
+    """Convert dates to a day precision datetime64 column.
+
+    Going through ordinals is much faster than letting numpy parse each
+    date object.
+    """
+    ordinals = np.fromiter((d.toordinal() for d in dates), np.int64, len(dates))
+    return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+def _add_months(start: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """Add months to dates, clamping the day to the end of the month."""
+    start_month = start.astype("datetime64[M]")
+    start_day = (start - start_month.astype("datetime64[D]")).astype(int)
+    month = start_month + months.astype("timedelta64[M]")
+    month_start = month.astype("datetime64[D]")
+    month_days = ((month + 1).astype("datetime64[D]") - month_start).astype(int)
+    return month_start + np.minimum(start_day, month_days - 1)
+
+
+def service_periods(
+    hire_dates: np.ndarray, end_date: date, include_end_date: bool = False
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split service periods into years, months and days like relativedelta."""
+    start = hire_dates.astype("datetime64[D]")
+    end = np.datetime64(end_date, "D")
+    start_month = start.astype("datetime64[M]").astype(int)
+    months = end.astype("datetime64[M]").astype(int) - start_month
+    months = months - (_add_months(start, months) > end)
+    days = (end - _add_months(start, months)).astype(int)
+    if include_end_date:
+        days = days + 1
+    return months // 12, months % 12, days
+
+
+def calculate_service_pay(
+    salaries: np.ndarray, years: np.ndarray, months: np.ndarray, days: np.ndarray
+) -> pd.DataFrame:
+    """Calculate the service pay of each period of service and the total."""
+    day_pay = salaries / MONTH_DAYS
+    months_multiplier = np.select(
+        [
+            (years <= 5) & (months < 1) & (days < 1),
+            (years >= 5) & ((months > 0) | (days > 0)) & (years < 10),
+        ],
+        [2, 3],
+        default=4,
+    )
+    days_multiplier = np.select([years <= 5, years < 10], [2, 3], default=4)
+    pay = pd.DataFrame(
+        {
+            "first_five_years": day_pay * 2 * 6 * np.minimum(years, 5),
+            "between_five_and_ten_years": day_pay * 3 * 6 * np.clip(years - 5, 0, 5),
+            "more_than_ten_years": day_pay * 4 * 6 * np.maximum(years - 10, 0),
+            "remaining_months": day_pay * months_multiplier * 6 * (months / 12),
+            "remaining_days": day_pay * days_multiplier * 6 * (days / 313),
+        }
+    ).round(2)
+    pay["total"] = pay[list(AMOUNT_COLUMNS)].sum(axis=1).round(2)
+    return pay
+
+
+def calculate_liability(
+    salaries: Sequence[float],
+    hire_dates: Sequence[date],
+    end_date: date,
+    include_end_date: bool = False,
+) -> pd.DataFrame:
+    """Calculate every employee's service periods and severance service pay."""
+    salary_column = np.asarray(salaries, dtype=float)
+    years, months, days = service_periods(
+        to_date_column(hire_dates), end_date, include_end_date
+    )
+    pay = calculate_service_pay(salary_column, years, months, days)
+    pay.insert(0, "days", days)
+    pay.insert(0, "months", months)
+    pay.insert(0, "years", years)
+    return pay
+
+
+def department_liability(departments: Sequence[str], pay: pd.DataFrame) -> pd.DataFrame:
+    """Sum employees' total service pay per department."""
+    totals = (
+        pd.DataFrame({"department": departments, "total": pay["total"]})
+        .groupby("department", sort=True)["total"]
+        .agg(employee_count="count", total="sum")
+        .reset_index()
+    )
+    totals["total"] = totals["total"].round(2)
+    return totals
+
+
+def summarize_liability(as_of: date, totals: pd.DataFrame) -> SeveranceLiability:
+    """Create the liability model from per department totals."""
+    departments = [
+        DepartmentSeveranceLiability(
+            department=row.department,
+            employee_count=row.employee_count,
+            total=Decimal(str(row.total)).quantize(Decimal("0.01")),
+        )
+        for row in totals.itertuples(index=False)
+    ]
+    return SeveranceLiability(
+        as_of=as_of,
+        employee_count=sum(d.employee_count for d in departments),
+        total=sum((d.total for d in departments), Decimal("0.00")),
+        departments=departments,
+    )
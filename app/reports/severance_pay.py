@@ -1,186 +1,48 @@
 """Employee severance pay report module."""
+import io
 from datetime import date
-from decimal import Decimal
-from enum import Enum
 
-from dateutil.relativedelta import relativedelta
-from pydantic import BaseModel
 from reportlab.lib.styles import ParagraphStyle  # type: ignore
 from reportlab.pdfgen import canvas  # type: ignore
 from reportlab.platypus import Paragraph  # type: ignore
 
 from app.models.employee_info.employee import EmployeeSeverancePay
-
-MONTH_DAYS = 26
-
-
-class DurationType(str, Enum):
-    """Duration type enum."""
-
-    YEARS = "years"
-    MONTHS = "months"
-    DAYS = "days"
-
-
-class ServicePay(BaseModel):
-    """Sevice pay model."""
-
-    duration_type: DurationType
-    duration: int
-    amount: Decimal
-
-
-class SeverancePayReport:
+from app.reports.severance_calculation import (
+    DurationType,
+    ServicePay,
+    SeveranceCalculator,
+)
+from app.reports.template import letterhead
+
+__all__ = (
+    "DurationType",
+    "ServicePay",
+    "SeverancePayReport",
+    "render_severance_pay_report",
+)
+
+
+class SeverancePayReport(SeveranceCalculator):
     """Severance pay reporting class."""
 
     def __init__(
         self, employee: EmployeeSeverancePay, include_end_date: bool = False
     ) -> None:
         """Service pay class initializer."""
-        self.employee = employee
-        self._relative_delta = relativedelta(
-            employee.termination_date, employee.current_hire_date
+        super().__init__(
+            employee.current_salary,
+            employee.current_hire_date,
+            employee.termination_date,
+            include_end_date,
         )
-        self.years = self._relative_delta.years
-        self.months = self._relative_delta.months
-        self.days = (
-            self._relative_delta.days + 1
-            if include_end_date
-            else self._relative_delta.days
-        )  # include end date
-
-    def calc_fist_five_years_pay(self) -> ServicePay:
-        """Calculate severance pay for the first five or less years of service."""
-        if self.years <= 5:
-            result = (self.employee.current_salary / MONTH_DAYS) * 2 * 6 * self.years
-            amount = round(result, 2)
-            return ServicePay(
-                duration_type=DurationType.YEARS, duration=self.years, amount=amount
-            )
-        if self.years > 5:
-            result = (self.employee.current_salary / MONTH_DAYS) * 2 * 6 * 5
-            amount = round(result, 2)
-            return ServicePay(
-                duration_type=DurationType.YEARS, duration=5, amount=amount
-            )
-
-        return ServicePay(
-            duration_type=DurationType.YEARS, duration=0, amount=Decimal()
-        )
-
-    def calc_between_five_and_ten_years_pay(self) -> ServicePay:
-        """Calculate severance pay for service years between five to ten."""
-        years = 0
-        if self.years > 5 and self.years <= 10:
-            years = self.years - 5
-        elif self.years > 10:
-            years = 5
-
-        result = (self.employee.current_salary / MONTH_DAYS) * 3 * 6 * years
-        amount = round(result, 2)
-        return ServicePay(
-            duration_type=DurationType.YEARS, duration=years, amount=amount
-        )
-
-    def calc_more_than_ten_years_pay(self) -> ServicePay:
-        """Calculate severance pay for more than ten years of service."""
-        if self.years > 10:
-            years = self.years - 10
-            result = (self.employee.current_salary / MONTH_DAYS) * 4 * 6 * years
-            amount = round(result, 2)
-            return ServicePay(
-                duration_type=DurationType.YEARS, duration=years, amount=amount
-            )
-        return ServicePay(
-            duration_type=DurationType.YEARS, duration=0, amount=Decimal()
-        )
-
-    def calc_remaining_months(self) -> ServicePay:
-        """Calculate severance pay for any remaining months."""
-        multiplier = 0
-        if (self.years <= 5) and (self.months < 1) and (self.days < 1):
-            multiplier = 2
-        elif (
-            (self.years >= 5)
-            and ((self.months > 0) or (self.days > 0))
-            and (self.years < 10)
-        ):
-            multiplier = 3
-        else:
-            multiplier = 4
-
-        if self.months:
-            result = (
-                (self.employee.current_salary / MONTH_DAYS)
-                * multiplier
-                * 6
-                * Decimal(self.months / 12)
-            )
-            amount = round(result, 2)
-            return ServicePay(
-                duration_type=DurationType.MONTHS, duration=self.months, amount=amount
-            )
-        return ServicePay(
-            duration_type=DurationType.MONTHS, duration=0, amount=Decimal()
-        )
-
-    def calc_remaining_days(self) -> ServicePay:
-        """Calculate severance pay for any remaining days."""
-        multiplier = 0
-        if self.years <= 5:
-            multiplier = 2
-        elif (self.years > 5) and (self.years < 10):
-            multiplier = 3
-        else:
-            multiplier = 4
-        if self.days:
-            result = (
-                (self.employee.current_salary / MONTH_DAYS)
-                * multiplier
-                * 6
-                * Decimal(self.days / 313)
-            )
-            amount = round(result, 2)
-            return ServicePay(
-                duration_type=DurationType.DAYS, duration=self.days, amount=amount
-            )
-        return ServicePay(duration_type=DurationType.DAYS, duration=0, amount=Decimal())
-
-    def calc_total_service_pay(self) -> Decimal:
-        """Calculate the total serverance service pay."""
-        first_five_years = self.calc_fist_five_years_pay()
-        between_five_and_ten = self.calc_between_five_and_ten_years_pay()
-        more_than_ten = self.calc_more_than_ten_years_pay()
-        remaining_months = self.calc_remaining_months()
-        remaining_days = self.calc_remaining_days()
-        result = (
-            first_five_years.amount
-            + between_five_and_ten.amount
-            + more_than_ten.amount
-            + remaining_months.amount
-            + remaining_days.amount
-        )
-        return round(result, 2)
+        self.employee = employee
 
     def _draw_header(self, c: canvas.Canvas):
         """Draw severance pay report header."""
         c.setFontSize(9)
         c.drawString(30, 12, f"Date:- {date.today()}")
         c.setFontSize(10)
-        c.drawImage("../app/assets/images/small_logo.jpg", 30, 30, 80, 40)
-        c.setFontSize(15)
-        c.drawString(140, 40, "ZaEr plc - Asmara")
-        c.setFontSize(10)
-        c.drawString(310, 40, "Tegadelti Avenue n.13")
-        c.drawString(450, 40, "Tel: 00291-1-182383")
-        c.setFontSize(8)
-        c.drawString(135, 55, "Integrated Textiles & Garment Factory")
-        c.setFontSize(10)
-        c.drawString(320, 55, "P.O.Box 11933")
-        c.drawString(448, 55, "Fax: 00291-1-181493")
-        c.drawString(140, 70, "ZAMBAITI GROUP - ITALY")
-        c.drawString(317, 70, "Asmara - Eritrea")
-        c.drawString(445, 70, "zaer@zaerasmara.com")
+        letterhead.draw(c)
 
     def _draw_employee_info(self, c: canvas.Canvas):
         """Draw employee severance pay report info."""
@@ -232,11 +94,12 @@ class SeverancePayReport:
         p = Paragraph(content)
         p.wrapOn(c, 350, 50)
         p.drawOn(c, 60, 335)
-        ffy = self.calc_fist_five_years_pay()
-        bfat = self.calc_between_five_and_ten_years_pay()
-        mtt = self.calc_more_than_ten_years_pay()
-        rm = self.calc_remaining_months()
-        rd = self.calc_remaining_days()
+        breakdown = self.calc_breakdown()
+        ffy = breakdown.first_five_years
+        bfat = breakdown.between_five_and_ten_years
+        mtt = breakdown.more_than_ten_years
+        rm = breakdown.remaining_months
+        rd = breakdown.remaining_days
         c.drawString(
             70,
             400,
@@ -262,7 +125,7 @@ class SeverancePayReport:
             460,
             f"Salary / 26 x 2 x 6 x ({rd.duration} Days / 313): {rd.amount}",
         )
-        c.drawString(60, 475, f"SUB-TOTAL: {self.calc_total_service_pay()}")
+        c.drawString(60, 475, f"SUB-TOTAL: {breakdown.total}")
 
     def _draw_notice_for_termination(self, c: canvas.Canvas):
         """Draw employee severance pay report notice for termination."""
@@ -286,10 +149,10 @@ class SeverancePayReport:
         c.drawString(60, 660, "Salary / 26 x Days")
         c.drawString(60, 675, "TOTAL GROSS PAYABLE (1 + 2 + 3 + 4)")
 
-    def create_report(self) -> str:
-        """Create severance report pdf file."""
-        filename = f"employee_{self.employee.badge_number}_severance_pay.pdf"
-        c = canvas.Canvas(filename, bottomup=0)
+    def create_report(self) -> bytes:
+        """Create severance report pdf in memory and return its content."""
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, bottomup=0)
         self._draw_header(c)
         self._draw_employee_info(c)
         self._draw_compensation_info(c)
@@ -298,4 +161,11 @@ class SeverancePayReport:
         self._draw_annual_leave(c)
         c.showPage()
         c.save()
-        return filename
+        return buffer.getvalue()
+
+
+def render_severance_pay_report(
+    employee: EmployeeSeverancePay, include_end_date: bool = False
+) -> bytes:
+    """Render the severance pay report pdf and return its content."""
+    return SeverancePayReport(employee, include_end_date).create_report()
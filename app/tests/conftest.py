@@ -2,7 +2,10 @@
 import asyncio
 from typing import AsyncGenerator, Final, Generator
 
+import pytest
 import pytest_asyncio
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi_jwt_auth import AuthJWT  # type: ignore
 from httpx import AsyncClient, Headers
 from sqlalchemy.orm import sessionmaker
@@ -11,7 +14,9 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 # for models to be detected before calling metadata.create_all
 from app import models  # noqa: F401
+from app.core.cache import invalidate_all
 from app.core.db import async_engine
+from app.core.public_key import apply_public_key
 from app.core.settings import settings
 from app.main import app
 
@@ -20,6 +25,32 @@ TEST_URL: Final = f"http://{settings.api_v1_prefix}"
 USER_ID: Final = "38eb651b-bd33-4f9a-beb2-0f9d52d7acc6"
 
 
+def get_pytest_keys() -> dict:
+    """Generate keys for testing."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key_bytes = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_key = key.public_key()
+    public_key_bytes = public_key.public_bytes(
+        encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.PKCS1
+    )
+    public_key_str = public_key_bytes.decode()
+    private_key_str = private_key_bytes.decode()
+    return dict(private_key=private_key_str, public_key=public_key_str)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def jwt_keys() -> dict:
+    """Sign and verify test tokens with a key pair generated per session."""
+    keys = get_pytest_keys()
+    settings.authjwt_private_key = keys["private_key"]
+    apply_public_key(keys["public_key"])
+    return keys
+
+
 def event_loop(request) -> Generator:  # noqa: indirect usage
     """Get the event loop."""
     loop = asyncio.get_event_loop_policy().new_event_loop()
@@ -30,6 +61,7 @@ def event_loop(request) -> Generator:  # noqa: indirect usage
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def session() -> AsyncGenerator[AsyncSession, None]:
     """Fixture that provide async session."""
+    invalidate_all()
     session = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
     async with session() as s:
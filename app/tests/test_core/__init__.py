@@ -0,0 +1 @@
+"""Core modules tests package."""
@@ -0,0 +1,80 @@
+"""Verified json web token cache tests module."""
+import time
+
+import pytest
+from fastapi import status
+from fastapi_jwt_auth import AuthJWT  # type: ignore
+from fastapi_jwt_auth.exceptions import JWTDecodeError  # type: ignore
+from httpx import AsyncClient
+
+from app.core.auth import CachedAuthJWT, VerifiedTokenCache, token_cache
+from app.tests.conftest import USER_ID
+
+
+def create_token(**user_claims) -> str:
+    return AuthJWT().create_access_token(subject=USER_ID, user_claims=user_claims)
+
+
+@pytest.mark.asyncio
+async def test_token_is_verified_once(client: AsyncClient):
+    token_cache.clear()
+    misses = token_cache.misses.value
+
+    for _ in range(3):
+        response = await client.get("/divisions")
+        assert response.status_code == status.HTTP_200_OK, response.json()
+
+    assert token_cache.misses.value == misses + 1
+    assert len(token_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_claims_still_check_privileges(client: AsyncClient):
+    token = create_token(is_staff=False, is_superuser=False, is_active=True)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for _ in range(2):
+        response = await client.get("/reports/severance-liability", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["detail"] == "insufficient privileges."
+
+
+def test_token_is_verified_again_once_expired(monkeypatch: pytest.MonkeyPatch):
+    token_cache.clear()
+    token = create_token()
+    exp = CachedAuthJWT().get_raw_jwt(token)["exp"]
+    misses = token_cache.misses.value
+
+    CachedAuthJWT().get_raw_jwt(token)
+    assert token_cache.misses.value == misses
+
+    monkeypatch.setattr(time, "time", lambda: exp + 1)
+    assert token_cache.get(next(iter(token_cache._entries))) is None
+    assert len(token_cache) == 0
+
+
+def test_invalid_token_is_not_cached():
+    token_cache.clear()
+    with pytest.raises(JWTDecodeError):
+        CachedAuthJWT().get_raw_jwt(create_token()[:-4] + "AAAA")
+    assert len(token_cache) == 0
+
+
+def test_tampered_claims_are_not_shared():
+    token = create_token(is_staff=True)
+    claims = CachedAuthJWT().get_raw_jwt(token)
+    claims["is_staff"] = False
+
+    assert CachedAuthJWT().get_raw_jwt(token)["is_staff"] is True
+
+
+def test_cache_evicts_least_recently_used():
+    cache = VerifiedTokenCache(max_entries=2)
+    expires_at = time.time() + 60
+    cache.set(b"a", expires_at, {"sub": "a"})
+    cache.set(b"b", expires_at, {"sub": "b"})
+    cache.get(b"a")
+    cache.set(b"c", expires_at, {"sub": "c"})
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == {"sub": "a"}
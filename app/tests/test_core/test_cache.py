@@ -0,0 +1,128 @@
+"""Reference data cache tests module."""
+import asyncio
+import time
+from typing import Final
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from app.core import db
+from app.core.cache import CacheInvalidationListener, TTLCache, get_cache
+from app.core.db import async_engine, connect_raw
+from app.core.replica import ReplicaRouter
+from app.core.settings import settings
+
+ENDPOINT: Final = "countries"
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_expire(monkeypatch: pytest.MonkeyPatch):
+    cache = TTLCache("test_expire", ttl=10, max_entries=8)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert await cache.get_or_load("key", _load("new value")) == "new value"
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    cache = TTLCache("test_lru", ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert await cache.get_or_load("a", _load(0)) == 1
+    assert await cache.get_or_load("b", _load(0)) == 0
+    assert cache.hits.value == 1
+    assert cache.misses.value == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_values_loaded_before_invalidation():
+    cache = TTLCache("test_generation", ttl=60, max_entries=8)
+
+    async def stale_loader() -> str:
+        cache.invalidate()
+        return "stale"
+
+    assert await cache.get_or_load("key", stale_loader) == "stale"
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cache_on_commit(client: AsyncClient):
+    cache = get_cache("countries")
+    hits = cache.hits.value
+
+    response = await client.get(f"/{ENDPOINT}")
+    assert response.json()["count"] == 0
+    response = await client.get(f"/{ENDPOINT}")
+    assert response.json()["count"] == 0
+    assert cache.hits.value == hits + 1
+
+    response = await client.post(f"/{ENDPOINT}", json={"name": "eritrea"})
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+    response = await client.post(f"/{ENDPOINT}", json={"name": "eritrea"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.json()
+
+    response = await client.get(f"/{ENDPOINT}")
+    assert response.json()["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_values_loaded_from_replica_are_not_cached(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    cache = get_cache("countries")
+    cache.invalidate()
+    monkeypatch.setattr(db, "replica_engine", async_engine)
+    monkeypatch.setattr(
+        db, "replica_router", ReplicaRouter(async_engine, check_interval=0)
+    )
+
+    response = await client.get(f"/{ENDPOINT}")
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert len(cache) == 0
+
+    monkeypatch.setattr(db, "replica_router", ReplicaRouter(None))
+    response = await client.get(f"/{ENDPOINT}")
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_listener_invalidates_on_notification():
+    cache = get_cache("countries")
+    listener = CacheInvalidationListener(
+        connect_raw, channel=settings.cache_invalidation_channel
+    )
+    listener.start()
+    try:
+        await asyncio.wait_for(listener.listening.wait(), timeout=5)
+        cache.set("key", "value")
+
+        async with async_engine.begin() as conn:
+            await conn.exec_driver_sql(
+                f"NOTIFY {settings.cache_invalidation_channel}, 'countries'"
+            )
+        for _ in range(50):
+            if len(cache) == 0:
+                break
+            await asyncio.sleep(0.05)
+        assert len(cache) == 0
+    finally:
+        await listener.stop()
+
+
+def _load(value):
+    """Create a loader returning the value."""
+
+    async def loader():
+        return value
+
+    return loader
@@ -0,0 +1,42 @@
+"""Application startup imports tests module."""
+import json
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from app.core.render import RenderService
+from app.utils.lazy_import import LazyFunction
+
+LAZY_MODULES = ("numpy", "openpyxl", "pandas", "PIL", "reportlab")
+
+
+def test_heavy_libraries_are_not_imported_at_startup():
+    probe = "import json, sys, app.main; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    modules = json.loads(output.splitlines()[-1])
+
+    assert [m for m in modules if m.split(".")[0] in LAZY_MODULES] == []
+
+
+def test_lazy_function_pickles_as_import_path():
+    function = LazyFunction("os.path", "join")
+    assert function("a", "b") == "a/b"
+
+    restored = pickle.loads(pickle.dumps(function))
+    assert restored._function is None
+    assert restored("a", "b") == "a/b"
+
+
+@pytest.mark.asyncio
+async def test_lazy_function_runs_in_worker_process():
+    service = RenderService(max_workers=1, max_queued=0)
+    try:
+        content = await service.render(LazyFunction("os", "fsencode"), "pdf")
+    finally:
+        service.shutdown()
+
+    assert content == b"pdf"
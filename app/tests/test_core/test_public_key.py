@@ -0,0 +1,210 @@
+"""Auth service public key provider tests module."""
+import asyncio
+import json
+import pathlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator
+
+import jwt
+import pytest
+from fastapi_jwt_auth import AuthJWT  # type: ignore
+from fastapi_jwt_auth.exceptions import JWTDecodeError  # type: ignore
+
+from app.core.auth import CachedAuthJWT
+from app.core.public_key import PUBLIC_KEY_PATH, PublicKeyProvider, apply_public_key
+from app.core.settings import settings
+from app.tests.conftest import get_pytest_keys
+
+
+class StubAuthServer(ThreadingHTTPServer):
+    """Local auth service serving a public key, or errors."""
+
+    def __init__(self) -> None:
+        """Stub auth server initializer."""
+        super().__init__(("127.0.0.1", 0), StubAuthHandler)
+        self.keys = get_pytest_keys()
+        self.failures = 0
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        """Get the server base url."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def rotate(self) -> None:
+        """Start serving a new key pair."""
+        self.keys = get_pytest_keys()
+
+
+class StubAuthHandler(BaseHTTPRequestHandler):
+    """Stub auth service request handler."""
+
+    server: StubAuthServer
+
+    def do_GET(self) -> None:
+        """Serve the public key, or fail while failures are left."""
+        self.server.requests += 1
+        if self.path != PUBLIC_KEY_PATH:
+            self.send_error(404)
+            return
+        if self.server.failures:
+            self.server.failures -= 1
+            self.send_error(503)
+            return
+        body = json.dumps({"public_key": self.server.keys["public_key"]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        """Keep test output quiet."""
+
+
+@pytest.fixture
+def auth_server() -> Generator[StubAuthServer, None, None]:
+    server = StubAuthServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    public_key = settings.authjwt_public_key
+    yield server
+    server.shutdown()
+    server.server_close()
+    apply_public_key(public_key)  # type: ignore
+
+
+def create_provider(url: str, tmp_path: pathlib.Path) -> PublicKeyProvider:
+    return PublicKeyProvider(
+        url,
+        tmp_path / "keys" / "public_key.pem",
+        min_refresh_interval=0,
+        retry_interval=0.01,
+        max_retry_interval=0.05,
+    )
+
+
+async def wait_until_saved(provider: PublicKeyProvider) -> None:
+    for _ in range(100):
+        if provider.cache_path.exists():
+            if provider.cache_path.read_text() == provider.public_key:
+                return
+        await asyncio.sleep(0.01)
+
+
+def sign(private_key: str) -> str:
+    claims = {"sub": "user", "type": "access", "fresh": False, "exp": 4102444800}
+    return jwt.encode(claims, private_key, algorithm="RS256").decode()
+
+
+@pytest.mark.asyncio
+async def test_public_key_is_fetched_and_saved(
+    auth_server: StubAuthServer, tmp_path: pathlib.Path
+):
+    provider = create_provider(auth_server.url, tmp_path)
+    await provider.start(wait=5)
+    try:
+        public_key = auth_server.keys["public_key"]
+        assert provider.public_key == public_key
+        assert AuthJWT._public_key == public_key.strip()
+        await wait_until_saved(provider)
+        assert provider.cache_path.read_text() == public_key
+        assert provider.cache_path.stat().st_mode & 0o777 == 0o600
+        assert provider.cache_path.parent.stat().st_mode & 0o777 == 0o700
+        token = sign(auth_server.keys["private_key"])
+        assert CachedAuthJWT().get_raw_jwt(token)["sub"] == "user"
+    finally:
+        await provider.stop()
+
+
+@pytest.mark.asyncio
+async def test_saved_public_key_is_used_while_auth_service_is_down(
+    auth_server: StubAuthServer, tmp_path: pathlib.Path
+):
+    provider = create_provider(auth_server.url, tmp_path)
+    await provider.start(wait=5)
+    await wait_until_saved(provider)
+    await provider.stop()
+    auth_server.failures = 1000
+
+    restarted = create_provider(auth_server.url, tmp_path)
+    await restarted.start(wait=5)
+    try:
+        assert restarted.public_key == auth_server.keys["public_key"]
+        assert AuthJWT._public_key == auth_server.keys["public_key"].strip()
+    finally:
+        await restarted.stop()
+
+
+@pytest.mark.asyncio
+async def test_saved_public_key_writable_by_others_is_ignored(
+    auth_server: StubAuthServer, tmp_path: pathlib.Path
+):
+    provider = create_provider(auth_server.url, tmp_path)
+    provider.cache_path.parent.mkdir()
+    provider.cache_path.write_text(get_pytest_keys()["public_key"])
+    provider.cache_path.chmod(0o666)
+    assert provider.load_cached() is None
+
+    provider.cache_path.chmod(0o600)
+    assert provider.load_cached() == provider.cache_path.read_text()
+
+
+@pytest.mark.asyncio
+async def test_failed_fetches_are_retried(
+    auth_server: StubAuthServer, tmp_path: pathlib.Path
+):
+    auth_server.failures = 3
+    provider = create_provider(auth_server.url, tmp_path)
+    await provider.start(wait=5)
+    try:
+        assert provider.public_key == auth_server.keys["public_key"]
+        assert auth_server.requests == 4
+    finally:
+        await provider.stop()
+
+
+@pytest.mark.asyncio
+async def test_rotated_public_key_is_fetched_on_signature_failure(
+    auth_server: StubAuthServer, tmp_path: pathlib.Path
+):
+    provider = create_provider(auth_server.url, tmp_path)
+    await provider.start(wait=5)
+    try:
+        auth_server.rotate()
+        token = sign(auth_server.keys["private_key"])
+        with pytest.raises(JWTDecodeError):
+            CachedAuthJWT().get_raw_jwt(token)
+
+        for _ in range(100):
+            if provider.public_key == auth_server.keys["public_key"]:
+                break
+            await asyncio.sleep(0.01)
+        assert CachedAuthJWT().get_raw_jwt(token)["sub"] == "user"
+        await wait_until_saved(provider)
+        assert provider.cache_path.read_text() == auth_server.keys["public_key"]
+    finally:
+        await provider.stop()
+
+
+@pytest.mark.asyncio
+async def test_public_key_is_used_when_it_can_not_be_saved(
+    auth_server: StubAuthServer, tmp_path: pathlib.Path
+):
+    (tmp_path / "keys").write_text("not a directory")
+    provider = create_provider(auth_server.url, tmp_path)
+    await provider.start(wait=5)
+    try:
+        assert provider.public_key == auth_server.keys["public_key"]
+        auth_server.rotate()
+        provider.request_refresh()
+        for _ in range(100):
+            if provider.public_key == auth_server.keys["public_key"]:
+                break
+            await asyncio.sleep(0.01)
+        assert provider.public_key == auth_server.keys["public_key"]
+        assert not provider._task.done()  # type: ignore
+    finally:
+        await provider.stop()
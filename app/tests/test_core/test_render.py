@@ -0,0 +1,90 @@
+"""Report rendering worker pool tests module."""
+import asyncio
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.core.render import RenderQueueFull, RenderService
+
+
+def slow_render(seconds: float) -> bytes:
+    time.sleep(seconds)
+    return str(os.getpid()).encode()
+
+
+def crash_render() -> bytes:
+    os._exit(1)
+
+
+@pytest.mark.asyncio
+async def test_render_service_renders_in_worker_process():
+    service = RenderService(max_workers=1, max_queued=0)
+    render_count = service.render_time.count
+    try:
+        content = await service.render(slow_render, 0)
+    finally:
+        service.shutdown()
+
+    assert int(content) != os.getpid()
+    assert service.pending == 0
+    assert service.render_time.count == render_count + 1
+    assert service.queue_wait.count == render_count + 1
+
+
+@pytest.mark.asyncio
+async def test_render_service_rejects_when_queue_is_full():
+    service = RenderService(max_workers=1, max_queued=1)
+    rejected = service.rejected.value
+    try:
+        renders = [
+            asyncio.create_task(service.render(slow_render, 0.5)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert service.pending == 2
+
+        with pytest.raises(RenderQueueFull):
+            await service.render(slow_render, 0)
+
+        await asyncio.gather(*renders)
+        assert service.pending == 0
+        assert await service.render(slow_render, 0)
+    finally:
+        service.shutdown()
+
+    assert service.rejected.value == rejected + 1
+
+
+@pytest.mark.asyncio
+async def test_render_batch_reserves_slots_up_front():
+    service = RenderService(max_workers=2, max_queued=0)
+    try:
+        batch = service.batch(5)
+        assert service.pending == 2
+        with pytest.raises(RenderQueueFull):
+            await service.render(slow_render, 0)
+
+        reports = [report async for report in batch.render(slow_render, [(0,)] * 5)]
+    finally:
+        service.shutdown()
+
+    assert len(reports) == 5
+    assert service.pending == 0
+    batch.close()
+    assert service.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_render_service_restarts_after_worker_died():
+    service = RenderService(max_workers=1, max_queued=0)
+    try:
+        with pytest.raises(BrokenProcessPool):
+            await service.render(crash_render)
+        assert service.pending == 0
+
+        content = await service.render(slow_render, 0)
+    finally:
+        service.shutdown()
+
+    assert int(content) != os.getpid()
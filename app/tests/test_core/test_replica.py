@@ -0,0 +1,171 @@
+"""Read replica routing tests module."""
+import asyncio
+import time
+from typing import Final, Optional
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+
+from app.core import db
+from app.core.db import async_engine, get_async_session, read_only
+from app.core.replica import (
+    CONSISTENCY_TOKEN_HEADER,
+    ReplicaRouter,
+    ReplicaStatus,
+    parse_lsn,
+)
+
+ENDPOINT: Final = "divisions"
+
+
+class LaggingReplicaRouter(ReplicaRouter):
+    """Replica router reporting a fixed replication lag."""
+
+    def __init__(self, lag: float) -> None:
+        """Lagging replica router initializer."""
+        super().__init__(async_engine, max_lag=5.0, check_interval=0)
+        self.fixed_lag = lag
+
+    async def _fetch_status(self) -> Optional[ReplicaStatus]:
+        """Return status with fixed lag."""
+        return ReplicaStatus(
+            replay_lsn=0, lag=self.fixed_lag, checked_at=time.monotonic()
+        )
+
+
+class SlowReplicaRouter(ReplicaRouter):
+    """Replica router whose status checks take a while and are counted."""
+
+    def __init__(self, delay: float, **kwargs) -> None:
+        """Slow replica router initializer."""
+        super().__init__(async_engine, **kwargs)
+        self.delay = delay
+        self.checks = 0
+
+    async def _fetch_status(self) -> Optional[ReplicaStatus]:
+        """Return a caught up status after the delay."""
+        self.checks += 1
+        await asyncio.sleep(self.delay)
+        return ReplicaStatus(replay_lsn=100, lag=0.0, checked_at=time.monotonic())
+
+
+async def current_lsn() -> str:
+    """Get the current WAL position of the primary."""
+    async with async_engine.connect() as conn:
+        return (await conn.execute(text("SELECT pg_current_wal_lsn()::text"))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_parse_lsn():
+    assert parse_lsn("0/0") == 0
+    assert parse_lsn("16/B374D848") == (0x16 << 32) + 0xB374D848
+    assert parse_lsn("1/0") > parse_lsn("0/FFFFFFFF")
+
+
+@pytest.mark.asyncio
+async def test_router_without_replica_never_serves():
+    router = ReplicaRouter(None)
+
+    assert router.enabled is False
+    assert await router.can_serve() is False
+
+
+@pytest.mark.asyncio
+async def test_simulated_replica_serves_caught_up_token():
+    router = ReplicaRouter(async_engine, check_interval=0)
+    token = await current_lsn()
+
+    assert await router.can_serve() is True
+    assert await router.can_serve(token) is True
+
+
+@pytest.mark.asyncio
+async def test_replica_behind_token_falls_back_to_primary():
+    router = ReplicaRouter(async_engine, check_interval=0)
+
+    assert await router.can_serve("FFFFFFFF/FFFFFFFF") is False
+    assert await router.can_serve("not-a-token") is False
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_to_primary():
+    assert await LaggingReplicaRouter(lag=1.0).can_serve() is True
+    assert await LaggingReplicaRouter(lag=10.0).can_serve() is False
+
+
+@pytest.mark.asyncio
+async def test_hanging_replica_check_times_out():
+    router = SlowReplicaRouter(delay=10.0, check_timeout=0.05)
+
+    started = time.monotonic()
+    assert await router.can_serve() is False
+    assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_wait_for_running_replica_check():
+    router = SlowReplicaRouter(delay=0.2, check_interval=0, min_refresh_interval=0)
+    assert await router.can_serve() is True
+
+    checking = asyncio.create_task(router.status(refresh=True))
+    await asyncio.sleep(0)
+    started = time.monotonic()
+    assert await router.can_serve() is True
+    assert time.monotonic() - started < 0.1
+    await checking
+    assert router.checks == 2
+
+
+@pytest.mark.asyncio
+async def test_forced_replica_checks_are_rate_limited():
+    router = SlowReplicaRouter(delay=0, check_interval=60, min_refresh_interval=60)
+    ahead = "0/FFFF"
+
+    for _ in range(5):
+        assert await router.can_serve(ahead) is False
+    assert router.checks == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_return_consistency_token(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(db, "replica_engine", async_engine)
+    monkeypatch.setattr(
+        db, "replica_router", ReplicaRouter(async_engine, check_interval=0)
+    )
+
+    response = await client.post(f"/{ENDPOINT}", json={"name": "division 1"})
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+    token = response.headers[CONSISTENCY_TOKEN_HEADER]
+
+    response = await client.get(
+        f"/{ENDPOINT}", headers={CONSISTENCY_TOKEN_HEADER: token}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["count"] == 1
+    assert CONSISTENCY_TOKEN_HEADER not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_read_only_post_is_served_by_replica(monkeypatch: pytest.MonkeyPatch):
+    replica_engine = create_async_engine(async_engine.url)
+    monkeypatch.setattr(db, "replica_engine", replica_engine)
+    monkeypatch.setattr(
+        db, "replica_router", ReplicaRouter(async_engine, check_interval=0)
+    )
+
+    binds = []
+    for mark_read_only in (False, True):
+        request = Request({"type": "http", "method": "POST", "headers": []})
+        if mark_read_only:
+            read_only(request)
+        async for session in get_async_session(request):
+            binds.append(session.bind)
+
+    assert binds == [async_engine, replica_engine]
+    await replica_engine.dispose()
@@ -1,15 +1,28 @@
 """Employee api tests module."""
+import asyncio
+import base64
 import copy
+import csv
+import io
+import json
 import uuid
-from datetime import date
+import zipfile
+from datetime import date, datetime
 from typing import Final
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from openpyxl import load_workbook  # type: ignore
+from sqlalchemy import text
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models import EmployeeDB
+from app.api.v1.employee_info import employee as employee_api
+from app.core.db import async_engine
+from app.core.render import render_service
+from app.core.settings import settings
+from app.models import AddressDB, ChildDB, EmployeeDB
 from app.models.employee_info.termination import TerminationDB
 
 from .employee_related_data import initialize_related_tables
@@ -145,6 +158,120 @@ async def test_get_employees_list(client: AsyncClient, session: AsyncSession):
     assert isinstance(response.json()["result"], list)
 
 
+async def create_employees(session: AsyncSession, related: dict, count: int) -> None:
+    """Create employees hired one year apart, odd ones inactive."""
+    for i in range(count):
+        values = copy.deepcopy(EMPLOYEE_TEST_DATA)
+        values.update(
+            phone_number=f"0711{i:04}",
+            national_id=f"ID{i:04}",
+            current_hire_date=date(2010 + i, 1, 1),
+            is_active=i % 2 == 0,
+        )
+        session.add(
+            EmployeeDB(
+                **values,
+                designation_uid=related["designation"].uid,
+                nationality_uid=related["nationality"].uid,
+                section_uid=related["section"].uid,
+                educational_level_uid=related["educational_level"].uid,
+                country_uid=related["country"].uid,
+                created_by=uuid.UUID(USER_ID),
+                modified_by=uuid.UUID(USER_ID),
+            )
+        )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_employees_list_is_paginated_by_badge_number(
+    client: AsyncClient, session: AsyncSession
+):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 5)
+
+    badge_numbers = []
+    params = {"limit": 2, "sort_by": "badge_number", "order": "desc", "total": "exact"}
+    while True:
+        response = await client.get(f"/{ENDPOINT}/full", params=params)
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        assert response.json()["total"] == 5
+        badge_numbers.extend(e["badge_number"] for e in response.json()["result"])
+        if response.json()["next_cursor"] is None:
+            break
+        params["cursor"] = response.json()["next_cursor"]
+
+    assert badge_numbers == [5, 4, 3, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_employees_list_filters(client: AsyncClient, session: AsyncSession):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 5)
+
+    response = await client.get(
+        f"/{ENDPOINT}", params={"is_active": True, "total": "estimated"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["count"] == 3
+    assert response.json()["total"] == 3
+    assert all(e["is_active"] for e in response.json()["result"])
+
+    response = await client.get(
+        f"/{ENDPOINT}", params={"hired_from": "2011-01-01", "hired_to": "2013-01-01"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["count"] == 3
+
+    division_uid = related["division"].uid
+    response = await client.get(
+        f"/{ENDPOINT}/full", params={"division_uid": str(division_uid)}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["count"] == 5
+
+    response = await client.get(f"/{ENDPOINT}", params={"unit_uid": str(uuid.uuid4())})
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_full_employees_info_as_ndjson(
+    client: AsyncClient, session: AsyncSession
+):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 3)
+
+    response = await client.get(
+        f"/{ENDPOINT}/full", params={"stream": "ndjson", "sort_by": "badge_number"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "application/x-ndjson" in response.headers["Content-Type"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["badge_number"] for row in rows] == [1, 2, 3]
+    assert rows[0]["division"] == related["division"].name
+
+
+@pytest.mark.asyncio
+async def test_stream_full_employees_info_as_json_array(
+    client: AsyncClient, session: AsyncSession
+):
+    response = await client.get(f"/{ENDPOINT}/full", params={"stream": "json"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 3)
+
+    response = await client.get(
+        f"/{ENDPOINT}/full", params={"stream": "json", "is_active": True}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert "application/json" in response.headers["Content-Type"]
+    assert len(response.json()) == 2
+
+
 @pytest.mark.asyncio
 async def test_get_full_employees_info_list(client: AsyncClient, session: AsyncSession):
     related = await initialize_related_tables(session)
@@ -244,6 +371,42 @@ async def test_get_employee_by_badge_number(client: AsyncClient, session: AsyncS
     assert response.json()["badge_number"] == employee.badge_number
 
 
+@pytest.mark.asyncio
+async def test_get_employees_by_badge_numbers(
+    client: AsyncClient, session: AsyncSession
+):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 3)
+
+    response = await client.post(
+        f"{ENDPOINT}/badge-number/batch", json={"badge_numbers": [3, 999, 1, 3]}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["count"] == 2
+    assert [e["badge_number"] for e in response.json()["result"]] == [3, 1]
+    assert response.json()["not_found"] == [999]
+    assert response.json()["result"][0]["section"] == "section one"
+
+
+@pytest.mark.asyncio
+async def test_get_employees_by_uids(client: AsyncClient, session: AsyncSession):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 3)
+    employees = (await session.exec(select(EmployeeDB))).all()
+    uids = [str(e.uid) for e in sorted(employees, key=lambda e: -e.badge_number)]
+    missing = str(uuid.uuid4())
+
+    response = await client.post(
+        f"{ENDPOINT}/batch", json={"uids": [uids[0], missing, *uids[1:]]}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert [e["uid"] for e in response.json()["result"]] == uids
+    assert response.json()["not_found"] == [missing]
+
+    response = await client.post(f"{ENDPOINT}/batch", json={"uids": []})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.asyncio
 async def test_get_full_employee_info_by_id(client: AsyncClient, session: AsyncSession):
     related = await initialize_related_tables(session)
@@ -271,6 +434,163 @@ async def test_get_full_employee_info_by_id(client: AsyncClient, session: AsyncS
     assert response.json()["section"]
 
 
+@pytest.mark.asyncio
+async def test_full_employee_info_follows_updates(
+    client: AsyncClient, session: AsyncSession
+):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 2)
+    response = await client.get(f"/{ENDPOINT}/full")
+    employee_uid = response.json()["result"][0]["uid"]
+
+    response = await client.patch(
+        f"/divisions/{related['division'].uid}", json={"name": "new division"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    response = await client.patch(
+        f"{ENDPOINT}/{employee_uid}", json={"first_name": "john"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+
+    response = await client.get(f"/{ENDPOINT}/full")
+    employees = {e["uid"]: e for e in response.json()["result"]}
+    assert len(employees) == 2
+    assert {e["division"] for e in employees.values()} == {"new division"}
+    assert employees[employee_uid]["first_name"] == "john"
+
+    await session.delete(await session.get(EmployeeDB, uuid.UUID(employee_uid)))
+    await session.commit()
+    response = await client.get(f"{ENDPOINT}/{employee_uid}/full")
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.json()
+
+
+@pytest.mark.asyncio
+async def test_full_employee_info_concurrent_refreshes(
+    client: AsyncClient, session: AsyncSession
+):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 1)
+    employee_uid = (await session.exec(select(EmployeeDB.uid))).one()
+
+    async with async_engine.connect() as rename, async_engine.connect() as update:
+        await rename.begin()
+        await rename.execute(
+            text("UPDATE unit SET name = 'new unit' WHERE uid = :uid"),
+            {"uid": related["unit"].uid},
+        )
+        await update.begin()
+        # refreshes the same read model row, waiting for the rename to commit
+        updating = asyncio.create_task(
+            update.execute(
+                text("UPDATE employee SET first_name = 'john' WHERE uid = :uid"),
+                {"uid": employee_uid},
+            )
+        )
+        await asyncio.sleep(0.2)
+        assert not updating.done()
+        await rename.commit()
+        await updating
+        await update.commit()
+
+    response = await client.get(f"{ENDPOINT}/{employee_uid}/full")
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["unit"] == "new unit"
+    assert response.json()["first_name"] == "john"
+
+
+@pytest.mark.asyncio
+async def test_get_employee_profile(client: AsyncClient, session: AsyncSession):
+    employee = await create_terminated_employee(session)
+    for first_name, birth_date in (
+        ("selam", date(2012, 5, 1)),
+        ("yonas", date(2010, 1, 9)),
+    ):
+        session.add(
+            ChildDB(
+                parent_uid=employee.uid,
+                first_name=first_name,
+                gender="m",
+                birth_date=birth_date,
+                created_by=uuid.UUID(USER_ID),
+                modified_by=uuid.UUID(USER_ID),
+            )
+        )
+    session.add(
+        AddressDB(
+            employee_uid=employee.uid,
+            city="asmara",
+            district="godaif",
+            created_by=uuid.UUID(USER_ID),
+            modified_by=uuid.UUID(USER_ID),
+        )
+    )
+    await session.commit()
+
+    response = await client.get(f"{ENDPOINT}/{employee.uid}/profile")
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    profile = response.json()
+    assert profile["uid"] == str(employee.uid)
+    assert profile["section"]
+    assert [c["first_name"] for c in profile["children"]] == ["yonas", "selam"]
+    assert profile["address"]["city"] == "asmara"
+    assert profile["contact_person"] is None
+    assert [t["termination_date"] for t in profile["terminations"]] == ["2023-03-01"]
+
+    response = await client.get(f"{ENDPOINT}/{uuid.uuid4()}/profile")
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response.json()
+
+
+@pytest.mark.asyncio
+async def test_search_employees(client: AsyncClient, session: AsyncSession):
+    related = await initialize_related_tables(session)
+    for i, first_name in enumerate(("abraham", "abrehet", "yonas")):
+        values = copy.deepcopy(EMPLOYEE_TEST_DATA)
+        values.update(
+            first_name=first_name, phone_number=f"0711{i:04}", national_id=f"ID{i:04}"
+        )
+        session.add(
+            EmployeeDB(
+                **values,
+                designation_uid=related["designation"].uid,
+                nationality_uid=related["nationality"].uid,
+                section_uid=related["section"].uid,
+                educational_level_uid=related["educational_level"].uid,
+                country_uid=related["country"].uid,
+                created_by=uuid.UUID(USER_ID),
+                modified_by=uuid.UUID(USER_ID),
+            )
+        )
+    await session.commit()
+
+    async def search(**params) -> list[str]:
+        response = await client.get(f"/{ENDPOINT}/search", params=params)
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        return [e["first_name"] for e in response.json()["result"]]
+
+    assert await search(q="abrham") == ["abraham"]
+    assert sorted(await search(q="ABR")) == ["abraham", "abrehet"]
+    assert await search(q="yonas 0002") == ["yonas"]
+    assert await search(q="0001") == ["abrehet"]
+    assert await search(q="%_%") == []
+
+    first_names = []
+    params = {"q": "tewelde", "limit": 2}
+    while True:
+        response = await client.get(f"/{ENDPOINT}/search", params=params)
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        first_names.extend(e["first_name"] for e in response.json()["result"])
+        if response.json()["next_cursor"] is None:
+            break
+        params["cursor"] = response.json()["next_cursor"]
+    assert sorted(first_names) == ["abraham", "abrehet", "yonas"]
+
+    assert await search(q="yonas y") == ["yonas"]
+    response = await client.get(f"/{ENDPOINT}/search", params={"q": "ab"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    response = await client.get(f"/{ENDPOINT}/search", params={"q": "ab yo"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.asyncio
 async def test_employee_not_found(client: AsyncClient, session: AsyncSession):
     response = await client.get(f"{ENDPOINT}/{uuid.uuid4()}")
@@ -422,10 +742,40 @@ async def test_download_csv(client: AsyncClient, session: AsyncSession):
 
     assert response.status_code == status.HTTP_200_OK
     assert "text/csv" in response.headers["Content-Type"]
+    assert response.text.startswith("uid,badge_number,first_name")
+
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 3)
+
+    response = await client.get(
+        f"{ENDPOINT}/download/csv", params={"sort_by": "badge_number"}
+    )
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["badge_number"] for row in rows] == ["1", "2", "3"]
+    assert rows[0]["division"] == related["division"].name
 
 
 @pytest.mark.asyncio
-async def test_employee_severance_pay(client: AsyncClient, session: AsyncSession):
+async def test_download_excel(client: AsyncClient, session: AsyncSession):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 3)
+
+    response = await client.get(f"{ENDPOINT}/download/xlsx", params={"is_active": True})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        in response.headers["Content-Type"]
+    )
+    assert "employees.xlsx" in response.headers["Content-Disposition"]
+    workbook = load_workbook(io.BytesIO(response.content), read_only=True)
+    rows = list(workbook["employees"].values)
+    assert rows[0][:3] == ("uid", "badge_number", "first_name")
+    assert len(rows) == 3
+    assert isinstance(rows[1][rows[0].index("date_created")], datetime)
+
+
+async def create_terminated_employee(session: AsyncSession) -> EmployeeDB:
     related = await initialize_related_tables(session)
     values = copy.deepcopy(EMPLOYEE_TEST_DATA)
     employee = EmployeeDB(
@@ -442,19 +792,215 @@ async def test_employee_severance_pay(client: AsyncClient, session: AsyncSession
     session.add(employee)
     await session.commit()
     await session.refresh(employee)
-
-    termination = TerminationDB(
-        employee_uid=employee.uid,
-        hire_date=employee.current_hire_date,
-        termination_date=date(2023, 3, 1),
-        created_by=uuid.UUID(USER_ID),
-        modified_by=uuid.UUID(USER_ID),
+    session.add(
+        TerminationDB(
+            employee_uid=employee.uid,
+            hire_date=employee.current_hire_date,
+            termination_date=date(2023, 3, 1),
+            created_by=uuid.UUID(USER_ID),
+            modified_by=uuid.UUID(USER_ID),
+        )
     )
-    session.add(termination)
     await session.commit()
-    await session.refresh(termination)
+    return employee
+
+
+@pytest.mark.asyncio
+async def test_employee_severance_pay(client: AsyncClient, session: AsyncSession):
+    employee = await create_terminated_employee(session)
 
     response = await client.get(f"{ENDPOINT}/severance-pay/{employee.badge_number}")
 
     assert response.status_code == status.HTTP_200_OK, response.json()
     assert "application/pdf" in response.headers["Content-Type"]
+    assert base64.b64decode(response.content).startswith(b"%PDF")
+
+
+@pytest.mark.asyncio
+async def test_employee_severance_pay_binary(
+    client: AsyncClient, session: AsyncSession
+):
+    employee = await create_terminated_employee(session)
+    url = f"{ENDPOINT}/severance-pay/{employee.badge_number}"
+
+    response = await client.get(url, headers={"Accept": "application/pdf"})
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.content.startswith(b"%PDF")
+    assert response.headers["Content-Length"] == str(len(response.content))
+    assert response.headers["Content-Disposition"] == (
+        f'attachment; filename="employee_{employee.badge_number}_severance_pay.pdf"'
+    )
+
+    response = await client.get(url, params={"encoding": "binary"})
+    assert response.content.startswith(b"%PDF")
+
+    response = await client.get(
+        url, params={"encoding": "base64"}, headers={"Accept": "application/pdf"}
+    )
+    assert base64.b64decode(response.content).startswith(b"%PDF")
+
+
+@pytest.mark.asyncio
+async def test_employee_severance_pay_bulk(client: AsyncClient, session: AsyncSession):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 3)
+    employees = (await session.exec(select(EmployeeDB))).all()  # type: ignore
+    for i, employee in enumerate(sorted(employees, key=lambda e: e.badge_number)):
+        employee.is_terminated = True
+        session.add(employee)
+        session.add(
+            TerminationDB(
+                employee_uid=employee.uid,
+                hire_date=employee.current_hire_date,
+                termination_date=date(2023, 3, i + 1),
+                created_by=uuid.UUID(USER_ID),
+                modified_by=uuid.UUID(USER_ID),
+            )
+        )
+    await session.commit()
+    badge_numbers = sorted(e.badge_number for e in employees)
+
+    response = await client.get(
+        f"{ENDPOINT}/severance-pay/bulk",
+        params={"terminated_from": "2023-03-02", "terminated_to": "2023-03-31"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["Content-Type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.namelist() == [
+        f"employee_{badge_number}_severance_pay.pdf"
+        for badge_number in badge_numbers[1:]
+    ]
+    assert all(archive.read(name).startswith(b"%PDF") for name in archive.namelist())
+    assert render_service.pending == 0
+
+    response = await client.get(
+        f"{ENDPOINT}/severance-pay/bulk",
+        params={"badge_number": [badge_numbers[0], 999999]},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "terminated employees not found: [999999]."
+
+    response = await client.get(f"{ENDPOINT}/severance-pay/bulk")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_employee_severance_pay_bulk_limit(
+    client: AsyncClient, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(employee_api, "MAX_BULK_REPORTS", 1)
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 2)
+    for employee in (await session.exec(select(EmployeeDB))).all():
+        employee.is_terminated = True
+        session.add(employee)
+        session.add(
+            TerminationDB(
+                employee_uid=employee.uid,
+                hire_date=employee.current_hire_date,
+                termination_date=date(2023, 3, 1),
+                created_by=uuid.UUID(USER_ID),
+                modified_by=uuid.UUID(USER_ID),
+            )
+        )
+    await session.commit()
+
+    response = await client.get(
+        f"{ENDPOINT}/severance-pay/bulk", params={"terminated_from": "1900-01-01"}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.text
+    assert response.json()["detail"] == "more than 1 reports requested."
+
+
+@pytest.mark.asyncio
+async def test_employee_severance_pay_bulk_uses_latest_termination(
+    client: AsyncClient, session: AsyncSession
+):
+    employee = await create_terminated_employee(session)
+    employee.current_hire_date = date(2024, 1, 1)
+    session.add(employee)
+    session.add(
+        TerminationDB(
+            employee_uid=employee.uid,
+            hire_date=date(2023, 4, 1),
+            termination_date=date(2023, 9, 1),
+            created_by=uuid.UUID(USER_ID),
+            modified_by=uuid.UUID(USER_ID),
+        )
+    )
+    await session.commit()
+
+    for _ in range(3):
+        response = await client.get(
+            f"{ENDPOINT}/severance-pay/bulk", params={"terminated_to": "2023-06-30"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+        response = await client.get(
+            f"{ENDPOINT}/severance-pay/bulk", params={"terminated_from": "2023-07-01"}
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+
+
+@pytest.mark.asyncio
+async def test_employee_severance_pay_when_renderers_are_busy(
+    client: AsyncClient, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    employee = await create_terminated_employee(session)
+    monkeypatch.setattr(render_service, "max_workers", 0)
+    monkeypatch.setattr(render_service, "max_queued", 0)
+    rejected = render_service.rejected.value
+
+    response = await client.get(f"{ENDPOINT}/severance-pay/{employee.badge_number}")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == str(settings.report_retry_after)
+    assert render_service.rejected.value == rejected + 1
+
+
+@pytest.mark.asyncio
+async def test_employee_severance_pay_breakdown(
+    client: AsyncClient, session: AsyncSession
+):
+    employee = await create_terminated_employee(session)
+
+    response = await client.get(
+        f"{ENDPOINT}/severance-pay/{employee.badge_number}/breakdown"
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    breakdown = response.json()
+    assert breakdown["hire_date"] == "2015-04-21"
+    assert breakdown["termination_date"] == "2023-03-01"
+    assert (breakdown["years"], breakdown["months"]) == (7, 10)
+    assert breakdown["first_five_years"]["duration"] == 5
+    assert breakdown["between_five_and_ten_years"]["duration"] == 2
+
+    response = await client.get(
+        f"{ENDPOINT}/severance-pay/calculate",
+        params={
+            "salary": 3000,
+            "hire_date": "2015-04-21",
+            "termination_date": "2023-03-01",
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json() == breakdown
+
+
+@pytest.mark.asyncio
+async def test_calculate_severance_pay_validates_dates(client: AsyncClient):
+    response = await client.get(
+        f"{ENDPOINT}/severance-pay/calculate",
+        params={
+            "salary": 3000,
+            "hire_date": "2023-03-01",
+            "termination_date": "2015-04-21",
+        },
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.json()
+    assert response.json()["detail"] == "termination date is before hire date."
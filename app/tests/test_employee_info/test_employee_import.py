@@ -0,0 +1,193 @@
+"""Employee bulk import api tests module."""
+import csv
+import io
+import uuid
+from typing import Any, Final
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from openpyxl import Workbook  # type: ignore
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.exports.xlsx_export import XLSX_MEDIA_TYPE
+from app.models import EmployeeDB, SectionDB, UnitDB
+
+from .employee_related_data import USER_ID, initialize_related_tables
+
+ENDPOINT: Final = "employees/import"
+IMPORT_ROW: Final = {
+    "first_name": "Semere",
+    "last_name": "Tewelde",
+    "grandfather_name": "Kidane",
+    "gender": "m",
+    "birth_date": "1980-02-22",
+    "current_salary": "3000",
+    "current_hire_date": "2015-04-21",
+    "birth_place": "Asmara",
+    "origin_of_birth": "segeneyti",
+    "mother_first_name": "abeba",
+    "mother_last_name": "mebrahtu",
+    "mother_grandfather_name": "gebremedhn",
+    "apprenticeship_from_date": "2015-04-22",
+    "apprenticeship_to_date": "2015-06-22",
+    "designation": "Designation One",
+    "section": "section one",
+    "nationality": "eritrean",
+    "country": "eritrea",
+    "educational_level": "10th",
+}
+
+
+def import_rows(count: int, **changes: Any) -> list[dict[str, Any]]:
+    rows = []
+    for i in range(count):
+        row = dict(IMPORT_ROW, phone_number=f"0722{i:04}", national_id=f"NID{i:04}")
+        row.update(changes)
+        rows.append(row)
+    return rows
+
+
+def csv_file(rows: list[dict[str, Any]]) -> bytes:
+    columns = list(dict.fromkeys(column for row in rows for column in row))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, columns)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def count_employees(session: AsyncSession) -> int:
+    result = await session.exec(select(func.count()).select_from(EmployeeDB))
+    return result.one()
+
+
+@pytest.mark.asyncio
+async def test_import_employees_from_csv(client: AsyncClient, session: AsyncSession):
+    await initialize_related_tables(session)
+    rows = import_rows(4)
+    rows[1]["designation"] = "unknown"
+    rows[2]["birth_date"] = "not a date"
+    rows[3]["phone_number"] = rows[0]["phone_number"]
+
+    response = await client.post(
+        f"/{ENDPOINT}", files={"file": ("employees.csv", csv_file(rows), "text/csv")}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["rows"] == 4
+    assert response.json()["created"] == 1
+    errors = [(e["row"], e["column"]) for e in response.json()["errors"]]
+    assert errors == [(3, "designation"), (4, "birth_date"), (5, "phone_number")]
+    assert await count_employees(session) == 1
+
+    employee = (await session.exec(select(EmployeeDB))).one()
+    assert employee.birth_place == "asmara"
+    assert employee.created_by == uuid.UUID(USER_ID)
+
+
+@pytest.mark.asyncio
+async def test_import_employees_from_xlsx(client: AsyncClient, session: AsyncSession):
+    await initialize_related_tables(session)
+    rows = import_rows(3)
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(list(rows[0]))
+    for row in rows:
+        sheet.append(list(row.values()))
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    response = await client.post(
+        f"/{ENDPOINT}",
+        files={"file": ("employees.xlsx", buffer.getvalue(), XLSX_MEDIA_TYPE)},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["created"] == 3
+    assert response.json()["errors"] == []
+    assert await count_employees(session) == 3
+
+
+@pytest.mark.asyncio
+async def test_import_reports_existing_employees(
+    client: AsyncClient, session: AsyncSession
+):
+    await initialize_related_tables(session)
+    content = csv_file(import_rows(2))
+    files = {"file": ("employees.csv", content, "text/csv")}
+    response = await client.post(f"/{ENDPOINT}", files=files)
+    assert response.json()["created"] == 2
+
+    response = await client.post(f"/{ENDPOINT}", files=files)
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["created"] == 0
+    assert len(response.json()["errors"]) == 4
+    assert await count_employees(session) == 2
+
+
+@pytest.mark.asyncio
+async def test_import_dry_run_creates_nothing(
+    client: AsyncClient, session: AsyncSession
+):
+    await initialize_related_tables(session)
+    response = await client.post(
+        f"/{ENDPOINT}",
+        params={"dry_run": True},
+        files={"file": ("employees.csv", csv_file(import_rows(2)), "text/csv")},
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["created"] == 2
+    assert response.json()["dry_run"] is True
+    assert await count_employees(session) == 0
+
+
+@pytest.mark.asyncio
+async def test_import_ambiguous_section_needs_unit(
+    client: AsyncClient, session: AsyncSession
+):
+    related = await initialize_related_tables(session)
+    unit = UnitDB(
+        name="unit two",
+        department_uid=related["department"].uid,
+        created_by=uuid.UUID(USER_ID),
+        modified_by=uuid.UUID(USER_ID),
+    )
+    session.add(unit)
+    await session.commit()
+    section = SectionDB(
+        name="section one",
+        unit_uid=unit.uid,
+        created_by=uuid.UUID(USER_ID),
+        modified_by=uuid.UUID(USER_ID),
+    )
+    session.add(section)
+    await session.commit()
+
+    rows = import_rows(2)
+    rows[1]["unit"] = "unit two"
+    response = await client.post(
+        f"/{ENDPOINT}", files={"file": ("employees.csv", csv_file(rows), "text/csv")}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["created"] == 1
+    assert [e["column"] for e in response.json()["errors"]] == ["section"]
+    employee = (await session.exec(select(EmployeeDB))).one()
+    assert employee.section_uid == section.uid
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unsupported_files(client: AsyncClient):
+    response = await client.post(
+        f"/{ENDPOINT}", files={"file": ("employees.pdf", b"%PDF", "application/pdf")}
+    )
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    response = await client.post(
+        f"/{ENDPOINT}", files={"file": ("employees.xlsx", b"not a zip", "")}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -6,6 +6,8 @@ from uuid import UUID, uuid4
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -50,6 +52,48 @@ async def test_create_employee_termination(client: AsyncClient, session: AsyncSe
     assert employee.is_terminated is True
 
 
+@pytest.mark.asyncio
+async def test_create_employee_termination_commits_once(
+    client: AsyncClient, session: AsyncSession
+):
+    related = await initialize_related_tables(session)
+    values = copy.deepcopy(EMPLOYEE_TEST_DATA)
+    values.update(is_active=False)
+    employee = EmployeeDB(
+        **values,
+        designation_uid=related["designation"].uid,
+        nationality_uid=related["nationality"].uid,
+        section_uid=related["section"].uid,
+        educational_level_uid=related["educational_level"].uid,
+        country_uid=related["country"].uid,
+    )
+    session.add(employee)
+    await session.commit()
+    await session.refresh(employee)
+
+    commits = []
+
+    def count_commit(db_session: Session) -> None:
+        commits.append(db_session)
+
+    event.listen(Session, "after_commit", count_commit)
+    try:
+        response = await client.post(
+            f"{ENDPOINT}",
+            json={
+                "employee_uid": str(employee.uid),
+                "termination_date": "2023-05-29",
+            },
+        )
+    finally:
+        event.remove(Session, "after_commit", count_commit)
+    await session.refresh(employee)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert employee.is_terminated is True
+    assert len(commits) == 1
+
+
 @pytest.mark.asyncio
 async def test_can_not_terminate_active_employee(
     client: AsyncClient, session: AsyncSession
@@ -0,0 +1,68 @@
+"""Employee headcount aggregates api tests module."""
+from typing import Final
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import get_cache
+from app.tests.test_employee_info.test_employee import create_employees
+
+from .employee_related_data import initialize_related_tables
+
+ENDPOINT: Final = "headcount"
+
+
+@pytest.mark.asyncio
+async def test_headcount_groups(client: AsyncClient, session: AsyncSession):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 5)
+
+    response = await client.get(f"/{ENDPOINT}")
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    headcount = response.json()
+    assert headcount["total"] == 5
+    assert headcount["groups"]["division"] == [
+        {
+            "uid": str(related["division"].uid),
+            "name": related["division"].name,
+            "count": 5,
+        }
+    ]
+    assert headcount["groups"]["designation"][0]["count"] == 5
+    assert headcount["groups"]["gender"] == [{"uid": None, "name": "m", "count": 5}]
+    assert len(headcount["groups"]) == 9
+
+    response = await client.get(
+        f"/{ENDPOINT}", params={"group_by": ["section", "gender"], "is_active": True}
+    )
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["total"] == 3
+    assert set(response.json()["groups"]) == {"section", "gender"}
+    assert response.json()["groups"]["section"][0]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_headcount_is_cached_until_groups_change(
+    client: AsyncClient, session: AsyncSession
+):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 2)
+    cache = get_cache("headcount")
+    hits = cache.hits.value
+
+    response = await client.get(f"/{ENDPOINT}", params={"group_by": "division"})
+    response = await client.get(f"/{ENDPOINT}", params={"group_by": "division"})
+    assert cache.hits.value == hits + 1
+    assert response.json()["groups"]["division"][0]["count"] == 2
+
+    response = await client.patch(
+        f"/divisions/{related['division'].uid}", json={"name": "new division"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.json()
+
+    response = await client.get(f"/{ENDPOINT}", params={"group_by": "division"})
+    assert response.json()["groups"]["division"][0]["name"] == "new division"
@@ -1,4 +1,5 @@
 """Employee severance pay tests module."""
+import pathlib
 from datetime import date
 from decimal import Decimal
 from typing import Final
@@ -6,7 +7,7 @@ from typing import Final
 import pytest
 
 from app.models.employee_info.employee import EmployeeSeverancePay
-from app.reports import severance_pay
+from app.reports import severance_calculation, severance_pay
 
 EMPLOYEE: Final = EmployeeSeverancePay(
     badge_number=3580,
@@ -153,3 +154,31 @@ async def test_calc_total_service_pay():
     result = sr.calc_total_service_pay()
 
     assert result == Decimal("23188.57")
+
+
+@pytest.mark.asyncio
+async def test_calculate_severance_breakdown_is_memoized():
+    severance_calculation.calculate_severance.cache_clear()
+    args = (Decimal("2131"), date(2007, 11, 1), date(2023, 5, 13))
+
+    result = severance_calculation.calculate_severance(*args)
+
+    assert result.years == 15
+    assert result.first_five_years.amount == Decimal("4917.69")
+    assert result.more_than_ten_years.duration == 5
+    assert result.total == Decimal("23188.57")
+    assert severance_calculation.calculate_severance(*args) is result
+    assert severance_calculation.calculate_severance.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_create_report_in_memory(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.chdir(tmp_path)
+    sr = severance_pay.SeverancePayReport(employee=EMPLOYEE)
+
+    content = sr.create_report()
+
+    assert content.startswith(b"%PDF")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,38 @@
+"""Service metrics tests module."""
+import pytest
+from fastapi import status
+from httpx import URL, AsyncClient
+
+from app.core.metrics import Histogram
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_pool_statistics(client: AsyncClient):
+    """Test pool statistics are exposed in prometheus text format."""
+    await client.get("/divisions")
+    client.base_url = URL("http://tests")
+    response = await client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "text/plain" in response.headers["Content-Type"]
+    body = response.text
+    assert "# TYPE hr_db_pool_checkout_wait_seconds histogram" in body
+    assert 'hr_db_pool_checkout_wait_seconds_bucket{le="+Inf"}' in body
+    assert "hr_db_pool_checkedout " in body
+    assert "hr_db_pool_overflow " in body
+
+
+@pytest.mark.asyncio
+async def test_histogram_buckets_are_cumulative():
+    """Test histogram buckets count every observation up to their bound."""
+    histogram = Histogram("test_seconds", "Test histogram.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 5.0):
+        histogram.observe(value)
+
+    samples = histogram.samples()
+
+    assert 'test_seconds_bucket{le="0.1"} 1' in samples
+    assert 'test_seconds_bucket{le="1.0"} 3' in samples
+    assert 'test_seconds_bucket{le="+Inf"} 4' in samples
+    assert "test_seconds_count 4" in samples
+    assert histogram.count == 4
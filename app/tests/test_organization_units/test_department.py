@@ -1,4 +1,6 @@
 """Department endpoints tests module."""
+import csv
+import io
 import uuid
 from typing import Final
 
@@ -241,11 +243,19 @@ async def test_delete_department(client: AsyncClient, session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_download_csv(client: AsyncClient):
+async def test_download_csv(client: AsyncClient, session: AsyncSession):
+    department = await create_test_model("department", session)
+
     response = await client.get(f"{ENDPOINT}/download/csv")
 
     assert response.status_code == status.HTTP_200_OK
     assert "text/csv" in response.headers["Content-Type"]
+    assert "departments.csv" in response.headers["Content-Disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["uid"] == str(department.uid)
+    assert rows[0]["name"] == department.name
+    assert rows[0]["division"] == "operations"
 
 
 @pytest.mark.asyncio
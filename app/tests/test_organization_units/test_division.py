@@ -1,4 +1,6 @@
 """Department endpoints tests module."""
+import base64
+import json
 import uuid
 from typing import Final
 
@@ -82,6 +84,60 @@ async def test_can_get_divisions_list(client: AsyncClient, session: AsyncSession
     assert isinstance(response.json()["result"], list)
 
 
+@pytest.mark.asyncio
+async def test_divisions_list_is_paginated(client: AsyncClient, session: AsyncSession):
+    for name in ("hr", "camiceria", "store", "finance", "maintenance"):
+        session.add(
+            DivisionDB(
+                name=name,
+                created_by=uuid.UUID(USER_ID),
+                modified_by=uuid.UUID(USER_ID),
+            )
+        )
+    await session.commit()
+
+    names = []
+    params = {"limit": 2, "total": "exact"}
+    while True:
+        response = await client.get(f"/{ENDPOINT}", params=params)
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        assert response.json()["total"] == 5
+        assert response.json()["count"] <= 2
+        names.extend(d["name"] for d in response.json()["result"])
+        if response.json()["next_cursor"] is None:
+            break
+        params["cursor"] = response.json()["next_cursor"]
+
+    assert sorted(names) == ["camiceria", "finance", "hr", "maintenance", "store"]
+
+
+@pytest.mark.asyncio
+async def test_divisions_list_invalid_cursor(client: AsyncClient):
+    response = await client.get(f"/{ENDPOINT}", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.json()
+    assert response.json()["detail"] == "invalid cursor."
+
+    created = ["dt", "2023-01-01T00:00:00"]
+    uid = ["u", USER_ID]
+    for values in (
+        [created],
+        [created, uid, uid],
+        [created, ["v", {"a": 1}]],
+        [created, ["v", [1, 2]]],
+        [created, ["v", "not-a-uuid"]],
+        [["v", 1], uid],
+        [["d", "2023-01-01"], uid],
+        [created, "ab"],
+    ):
+        payload = {"k": ["date_created", "uid"], "v": values}
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        response = await client.get(f"/{ENDPOINT}", params={"cursor": cursor})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, values
+        assert response.json()["detail"] == "invalid cursor."
+
+
 @pytest.mark.asyncio
 async def test_can_get_division_by_id(client: AsyncClient, session: AsyncSession):
     division = DivisionDB(
@@ -0,0 +1,82 @@
+"""Organization tree endpoint tests module."""
+import copy
+import uuid
+from typing import Final
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import EmployeeDB
+from app.tests.test_employee_info.employee_related_data import initialize_related_tables
+from app.tests.test_employee_info.test_employee import EMPLOYEE_TEST_DATA
+
+ENDPOINT: Final = "org-tree"
+USER_ID: Final = "38eb651b-bd33-4f9a-beb2-0f9d52d7acc6"
+
+
+@pytest.mark.asyncio
+async def test_org_tree_has_employee_counts(client: AsyncClient, session: AsyncSession):
+    related = await initialize_related_tables(session)
+    for i, is_active in enumerate((True, True, False)):
+        values = copy.deepcopy(EMPLOYEE_TEST_DATA)
+        values.update(
+            phone_number=f"0711{i:04}", national_id=f"ID{i:04}", is_active=is_active
+        )
+        session.add(
+            EmployeeDB(
+                **values,
+                designation_uid=related["designation"].uid,
+                nationality_uid=related["nationality"].uid,
+                section_uid=related["section"].uid,
+                educational_level_uid=related["educational_level"].uid,
+                country_uid=related["country"].uid,
+                created_by=uuid.UUID(USER_ID),
+                modified_by=uuid.UUID(USER_ID),
+            )
+        )
+    await session.commit()
+
+    response = await client.get(f"/{ENDPOINT}")
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    tree = response.json()
+    assert tree["employee_count"] == 2
+    division = tree["divisions"][0]
+    assert division["uid"] == str(related["division"].uid)
+    assert division["employee_count"] == 2
+    unit = division["departments"][0]["units"][0]
+    assert unit["name"] == related["unit"].name
+    assert unit["sections"] == [
+        {
+            "uid": str(related["section"].uid),
+            "name": related["section"].name,
+            "employee_count": 2,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_org_tree_etag_revalidation(client: AsyncClient):
+    response = await client.post("/divisions", json={"name": "division 1"})
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+
+    response = await client.get(f"/{ENDPOINT}")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+    assert [d["name"] for d in response.json()["divisions"]] == ["division 1"]
+    assert response.json()["divisions"][0]["departments"] == []
+
+    response = await client.get(f"/{ENDPOINT}", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    response = await client.post("/divisions", json={"name": "division 2"})
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+
+    response = await client.get(f"/{ENDPOINT}", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert len(response.json()["divisions"]) == 2
@@ -0,0 +1,95 @@
+"""Severance liability report tests module."""
+import csv
+import io
+from datetime import date
+from decimal import Decimal
+from typing import Final
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.reports.severance_calculation import SeveranceCalculator
+from app.reports.severance_liability import calculate_liability
+from app.tests.test_employee_info.employee_related_data import initialize_related_tables
+from app.tests.test_employee_info.test_employee import create_employees
+
+ENDPOINT: Final = "reports/severance-liability"
+HIRE_DATES: Final = (
+    date(2020, 1, 31),
+    date(2019, 2, 28),
+    date(2016, 2, 29),
+    date(2013, 5, 13),
+    date(2008, 8, 31),
+    date(1999, 12, 1),
+    date(2023, 5, 13),
+)
+
+
+@pytest.mark.parametrize("include_end_date", (False, True))
+@pytest.mark.parametrize("end_date", (date(2023, 5, 13), date(2024, 2, 29)))
+def test_liability_matches_scalar_calculation(end_date: date, include_end_date: bool):
+    salaries = [2609.0, 3000.5, 12999.99, 800.0, 2131.0, 4500.0, 1500.0]
+
+    pay = calculate_liability(salaries, HIRE_DATES, end_date, include_end_date)
+
+    for i, (salary, hire_date) in enumerate(zip(salaries, HIRE_DATES)):
+        calculator = SeveranceCalculator(
+            Decimal(str(salary)), hire_date, end_date, include_end_date
+        )
+        row = pay.iloc[i]
+        assert (row.years, row.months, row.days) == (
+            calculator.years,
+            calculator.months,
+            calculator.days,
+        )
+        total = calculator.calc_total_service_pay()
+        assert abs(Decimal(str(row.total)) - total) <= Decimal("0.01")
+
+
+@pytest.mark.asyncio
+async def test_read_severance_liability(client: AsyncClient, session: AsyncSession):
+    related = await initialize_related_tables(session)
+    await create_employees(session, related, 5)
+
+    response = await client.get(f"/{ENDPOINT}", params={"as_of": "2023-01-01"})
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    liability = response.json()
+    assert liability["as_of"] == "2023-01-01"
+    assert liability["employee_count"] == 3
+    expected = sum(
+        SeveranceCalculator(
+            Decimal(3000), date(year, 1, 1), date(2023, 1, 1)
+        ).calc_total_service_pay()
+        for year in (2010, 2012, 2014)
+    )
+    assert abs(Decimal(liability["total"]) - expected) <= Decimal("0.03")
+    assert liability["departments"] == [
+        {
+            "department": related["department"].name,
+            "employee_count": 3,
+            "total": liability["total"],
+        }
+    ]
+
+    response = await client.get(
+        f"/{ENDPOINT}", params={"as_of": "2023-01-01", "format": "csv"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "text/csv" in response.headers["Content-Type"]
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["department", "employee_count", "total"]
+    assert rows[1][:2] == [related["department"].name, "3"]
+
+
+@pytest.mark.asyncio
+async def test_read_severance_liability_without_employees(client: AsyncClient):
+    response = await client.get(f"/{ENDPOINT}", params={"as_of": "2023-01-01"})
+
+    assert response.status_code == status.HTTP_200_OK, response.json()
+    assert response.json()["employee_count"] == 0
+    assert Decimal(response.json()["total"]) == 0
+    assert response.json()["departments"] == []
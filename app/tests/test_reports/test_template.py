@@ -0,0 +1,36 @@
+"""Report page templates tests module."""
+import io
+
+import pytest
+from reportlab.pdfgen import canvas  # type: ignore
+
+from app.reports.template import LOGO_PATH, PageTemplate, image_reader, letterhead
+
+
+def test_letterhead_is_drawn_once_per_document():
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, bottomup=0, pageCompression=0)
+    for _ in range(3):
+        letterhead.draw(c)
+        c.showPage()
+    c.save()
+    pdf = buffer.getvalue()
+
+    assert pdf.count(b"/FormXob.letterhead Do") == 3
+    assert pdf.count(b"(ZaEr plc - Asmara) Tj") == 1
+    assert pdf.count(b"/Subtype /Image") == 1
+
+
+def test_logo_is_prepared_once_per_process():
+    logo = image_reader(LOGO_PATH, 80, 40)
+
+    assert image_reader(LOGO_PATH, 80, 40) is logo
+    assert logo.getSize() == (333, 167)
+
+
+def test_template_without_static_elements_can_not_be_created():
+    class Blank(PageTemplate):
+        name = "blank"
+
+    with pytest.raises(TypeError):
+        Blank()
@@ -0,0 +1,37 @@
+"""Lazily imported functions module."""
+import importlib
+from typing import Any, Callable
+
+
+class LazyFunction:
+    """Function imported from its module on first call.
+
+    Keeps heavy modules, like reportlab, out of the api process until a
+    request needs them. Instances pickle as the import path, so worker
+    processes import the function themselves.
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        """Lazy function initializer."""
+        self.module = module
+        self.name = name
+        self._function: Callable[..., Any] | None = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Import the function if needed and call it."""
+        if self._function is None:
+            module = importlib.import_module(self.module)
+            self._function = getattr(module, self.name)
+        return self._function(*args, **kwargs)
+
+    def __getstate__(self) -> dict:
+        """Pickle the import path only."""
+        return {"module": self.module, "name": self.name}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore from the import path."""
+        self.__init__(state["module"], state["name"])  # type: ignore
+
+    def __repr__(self) -> str:
+        """Get the function import path."""
+        return f"LazyFunction({self.module}.{self.name})"
@@ -0,0 +1,95 @@
+"""Api process import time benchmark.
+
+Imports ``app.main`` in fresh interpreters, the way a gunicorn worker boots,
+and reports the median import time, the peak memory and the slowest
+packages according to ``python -X importtime``. Exits with an error when
+the median goes over the budget or a library that should only be loaded by
+export and report requests was imported::
+
+    python -m benchmarks.import_time --runs 5 --budget 2.5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import Counter
+
+MODULE = "app.main"
+# only needed by export and report requests, imported on first use
+LAZY_MODULES = ("numpy", "openpyxl", "pandas", "PIL", "reportlab")
+
+PROBE = f"""
+import json, resource, sys, time
+start = time.perf_counter()
+import {MODULE}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": sorted(sys.modules),
+}}))
+"""
+
+
+def probe() -> dict:
+    """Import the application in a fresh interpreter and measure it."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def slowest_packages(count: int) -> list[tuple[str, int]]:
+    """Get the top level packages with the most import time, in microseconds."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    totals: Counter[str] = Counter()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        totals[name.strip().split(".")[0]] += int(self_us)
+    return totals.most_common(count)
+
+
+def main() -> None:
+    """Run the benchmark and check the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=2.5, help="seconds")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    results = [probe() for _ in range(args.runs)]
+    seconds = statistics.median(r["seconds"] for r in results)
+    max_rss_kb = statistics.median(r["max_rss_kb"] for r in results)
+    loaded = sorted(
+        name
+        for name in LAZY_MODULES
+        if any(m == name or m.startswith(f"{name}.") for m in results[0]["modules"])
+    )
+
+    print(f"import {MODULE}: {seconds:.3f} s (median of {args.runs})")
+    print(f"peak memory:    {max_rss_kb / 1024:.1f} MiB")
+    print(f"modules:        {len(results[0]['modules'])}")
+    print("slowest packages:")
+    for name, self_us in slowest_packages(args.top):
+        print(f"  {name:<24} {self_us / 1000:8.1f} ms")
+
+    errors = []
+    if seconds > args.budget:
+        errors.append(f"import took {seconds:.3f} s, budget is {args.budget} s")
+    if loaded:
+        errors.append(f"imported at startup: {', '.join(loaded)}")
+    for error in errors:
+        print(f"FAIL: {error}", file=sys.stderr)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
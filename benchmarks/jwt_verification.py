@@ -0,0 +1,90 @@
+"""Access token verification benchmark.
+
+Compares authenticating a request the way endpoints used to, with
+``AuthJWT`` checking the RS256 signature for ``jwt_required``,
+``get_raw_jwt`` and ``get_jwt_subject``, with the ``CachedAuthJWT`` used by
+the claims dependencies. Needs the application environment variables::
+
+    python -m benchmarks.jwt_verification --requests 2000
+"""
+import argparse
+import time
+from typing import Callable
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi_jwt_auth import AuthJWT  # type: ignore
+from starlette.requests import Request
+
+from app.core.auth import CachedAuthJWT, token_cache
+
+
+def load_keys() -> None:
+    """Configure token creation and verification with a new RSA key pair."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_key = key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM, format=serialization.PublicFormat.PKCS1
+    )
+    AuthJWT.load_config(
+        lambda: [
+            ("authjwt_algorithm", "RS256"),
+            ("authjwt_private_key", private_key.decode()),
+            ("authjwt_public_key", public_key.decode()),
+        ]
+    )
+
+
+def make_request(token: str) -> Request:
+    """Create a request carrying the access token."""
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+def per_request(count: int, authenticate: Callable[[], object]) -> float:
+    """Authenticate requests, return the mean time per request in seconds."""
+    start = time.perf_counter()
+    for _ in range(count):
+        authenticate()
+    return (time.perf_counter() - start) / count
+
+
+def main() -> None:
+    """Run the benchmark and print the time per request."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    load_keys()
+    token = AuthJWT().create_access_token(
+        subject="38eb651b-bd33-4f9a-beb2-0f9d52d7acc6",
+        user_claims={"is_staff": True, "is_active": True},
+    )
+    request = make_request(token)
+
+    def uncached() -> object:
+        Authorize = AuthJWT(req=request)
+        Authorize.jwt_required()
+        Authorize.get_raw_jwt()
+        return Authorize.get_jwt_subject()
+
+    def cached() -> object:
+        Authorize = CachedAuthJWT(req=request)
+        Authorize.jwt_required()
+        return Authorize.get_raw_jwt()
+
+    token_cache.clear()
+    uncached_time = per_request(args.requests, uncached)
+    cached_time = per_request(args.requests, cached)
+    print(f"requests:  {args.requests}")
+    print(f"uncached:  {uncached_time * 1e6:.1f} us/request")
+    print(f"cached:    {cached_time * 1e6:.1f} us/request")
+    print(f"speedup:   {uncached_time / cached_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Severance liability benchmark.
+
+Compares the vectorized workforce liability engine with computing every
+employee's total with the scalar ``SeveranceCalculator``::
+
+    python -m benchmarks.severance_liability --employees 10000
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Callable
+
+from app.reports.severance_calculation import SeveranceCalculator
+from app.reports.severance_liability import calculate_liability
+
+
+def make_workforce(count: int, seed: int) -> tuple[list[float], list[date]]:
+    """Create random salaries and hire dates spanning forty years."""
+    rng = random.Random(seed)
+    salaries = [round(rng.uniform(500, 20000), 2) for _ in range(count)]
+    hire_dates = [
+        date(1985, 1, 1) + timedelta(days=rng.randint(0, 14000)) for _ in range(count)
+    ]
+    return salaries, hire_dates
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Run the function repeatedly, return the fastest run in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print timings and the total difference."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    as_of = date.today()
+    salaries, hire_dates = make_workforce(args.employees, args.seed)
+    decimal_salaries = [Decimal(str(salary)) for salary in salaries]
+
+    def scalar() -> Decimal:
+        return sum(
+            (
+                SeveranceCalculator(salary, hire_date, as_of).calc_total_service_pay()
+                for salary, hire_date in zip(decimal_salaries, hire_dates)
+            ),
+            Decimal(),
+        )
+
+    def vectorized() -> float:
+        return calculate_liability(salaries, hire_dates, as_of)["total"].sum()
+
+    scalar_seconds = best_of(args.repeat, scalar)
+    vectorized_seconds = best_of(args.repeat, vectorized)
+    difference = abs(float(scalar()) - vectorized())
+    print(f"employees:  {args.employees}")
+    print(f"scalar:     {scalar_seconds * 1000:10.1f} ms")
+    print(f"vectorized: {vectorized_seconds * 1000:10.1f} ms")
+    print(f"speedup:    {scalar_seconds / vectorized_seconds:10.1f}x")
+    print(f"total difference: {difference:.2f}")
+
+
+if __name__ == "__main__":
+    main()